@@ -25,6 +25,19 @@ import { Transpiler as astTranspiler } from 'ast-transpiler';
 
 const pythonCodingUtf8 = '# -*- coding: utf-8 -*-'
 const baseExchangeJsFile = './ts/src/base/Exchange.ts'
+// base methods that the Python classes wrap natively above the delimiter
+// their transpiled bodies are kept as name_transpiled and the native wrappers call them
+const pythonWrappedBaseMethods = [
+    'fetch2',
+]
+// base methods that the Python classes implement natively above the delimiter, their transpiled bodies are dropped
+// the paginated calls collect the pages of the native paginate_* generators, which iterate_pages() consumes as well
+const pythonNativeBaseMethods = [
+    'fetch_paginated_call_cursor',
+    'fetch_paginated_call_deterministic',
+    'fetch_paginated_call_dynamic',
+    'fetch_paginated_call_incremental',
+]
 
 const exchanges = JSON.parse (fs.readFileSync("./exchanges.json", "utf8"));
 const exchangeIds = exchanges.ids;
@@ -1729,12 +1742,16 @@ class Transpiler {
             const restOfFile = '([^\n]*\n)+'
             const python2File = './python/ccxt/base/exchange.py'
             const python3File = './python/ccxt/async_support/base/exchange.py'
+            // the natively wrapped methods get their transpiled bodies renamed, the native ones get them dropped
+            // any other native method must not shadow a transpiled one
+            const python2Methods = this.renameWrappedPythonMethods (python2, python2File, pythonDelimiter)
+            const python3AsyncMethods = this.renameWrappedPythonMethods (python3Async, python3File, pythonDelimiter)
             const phpFile = './php/Exchange.php'
             const phpAsyncFile = './php/async/Exchange.php'
             log.magenta ('→', python2File.yellow)
-            replaceInFile (python2File,  new RegExp (pythonDelimiter + restOfFile), pythonDelimiter + python2.join ('\n') + '\n')
+            replaceInFile (python2File,  new RegExp (pythonDelimiter + restOfFile), pythonDelimiter + python2Methods.join ('\n') + '\n')
             log.magenta ('→', python3File.yellow)
-            replaceInFile (python3File,  new RegExp (pythonDelimiter + restOfFile), pythonDelimiter + python3Async.join ('\n') + '\n')
+            replaceInFile (python3File,  new RegExp (pythonDelimiter + restOfFile), pythonDelimiter + python3AsyncMethods.join ('\n') + '\n')
             log.magenta ('→', phpFile.yellow)
             replaceInFile (phpFile,      new RegExp (phpDelimiter + restOfFile),    phpDelimiter + php.join ('\n') + '\n}\n')
             log.magenta ('→', phpAsyncFile.yellow)
@@ -1744,6 +1761,34 @@ class Transpiler {
 
     // ========================================================================
 
+    renameWrappedPythonMethods (lines, pythonFile, pythonDelimiter) {
+        // lines come in triplets of an empty line, the signature and the body
+        const native = fs.readFileSync (pythonFile, 'utf8').split (pythonDelimiter)[0]
+        const names = new Set ([ ... native.matchAll (/^    (?:async )?def (\w+)\(/gm) ].map (match => match[1]))
+        const result = []
+        for (let i = 0; i < lines.length; i += 3) {
+            let signature = lines[i + 1]
+            const [ _, name ] = signature.match (/def (\w+)\(/)
+            if (pythonNativeBaseMethods.includes (name)) {
+                if (!names.has (name)) {
+                    throw new Error (pythonFile + ' has no native ' + name + '(), remove it from pythonNativeBaseMethods')
+                }
+                continue
+            } else if (pythonWrappedBaseMethods.includes (name)) {
+                if (!names.has (name)) {
+                    throw new Error (pythonFile + ' has no native ' + name + '() wrapper, remove it from pythonWrappedBaseMethods')
+                }
+                signature = signature.replace ('def ' + name + '(', 'def ' + name + '_transpiled(')
+            } else if (names.has (name)) {
+                throw new Error (pythonFile + ' defines ' + name + '() above the delimiter, it shadows the transpiled ' + name + '(), change the TypeScript source or add it to pythonWrappedBaseMethods or pythonNativeBaseMethods')
+            }
+            result.push (lines[i], signature, lines[i + 2])
+        }
+        return result
+    }
+
+    // ========================================================================
+
     async getTSClassDeclarationsAllFiles (ids, folder, extension = '.js')  {
         const files = fs.readdirSync (folder).filter (file => ids.includes (basename (file, extension)))
         const promiseReadFile = promisify (fs.readFile);
@@ -1588,10 +1588,36 @@ public partial class Exchange
         return cleanStructure;
     }
 
+    public virtual object marketDefaults()
+    {
+        // the defaults are merged once per reload, deepExtend copies them into every market
+        return this.deepExtend(this.safeMarketStructure(), new Dictionary<string, object>() {
+            { "precision", this.precision },
+            { "limits", this.limits },
+        }, getValue(this.fees, "trading"));
+    }
+
+    public virtual object buildMarket(object defaults, object value)
+    {
+        object market = this.deepExtend(defaults, value);
+        if (isTrue(getValue(market, "linear")))
+        {
+            ((IDictionary<string,object>)market)["subType"] = "linear";
+        } else if (isTrue(getValue(market, "inverse")))
+        {
+            ((IDictionary<string,object>)market)["subType"] = "inverse";
+        } else
+        {
+            ((IDictionary<string,object>)market)["subType"] = null;
+        }
+        return market;
+    }
+
     public virtual object setMarkets(object markets, object currencies = null)
     {
         object values = new List<object>() {};
         this.markets_by_id = new Dictionary<string, object>() {};
+        object defaults = this.marketDefaults();
         // handle marketId conflicts
         // we insert spot markets first
         object marketValues = this.sortBy(this.toArray(markets), "spot", true, true);
@@ -1605,27 +1631,19 @@ public partial class Exchange
             {
                 ((IDictionary<string,object>)this.markets_by_id)[(string)getValue(value, "id")] = ((object)new List<object>() {value});
             }
-            object market = this.deepExtend(this.safeMarketStructure(), new Dictionary<string, object>() {
-                { "precision", this.precision },
-                { "limits", this.limits },
-            }, getValue(this.fees, "trading"), value);
-            if (isTrue(getValue(market, "linear")))
-            {
-                ((IDictionary<string,object>)market)["subType"] = "linear";
-            } else if (isTrue(getValue(market, "inverse")))
-            {
-                ((IDictionary<string,object>)market)["subType"] = "inverse";
-            } else
-            {
-                ((IDictionary<string,object>)market)["subType"] = null;
-            }
-            ((IList<object>)values).Add(market);
+            ((IList<object>)values).Add(this.buildMarket(defaults, value));
         }
         this.markets = ((object)this.indexBy(values, "symbol"));
         object marketsSortedBySymbol = this.keysort(this.markets);
         object marketsSortedById = this.keysort(this.markets_by_id);
         this.symbols = new List<object>(((IDictionary<string,object>)marketsSortedBySymbol).Keys);
         this.ids = new List<object>(((IDictionary<string,object>)marketsSortedById).Keys);
+        this.setCurrenciesFromMarkets(values, currencies);
+        return this.markets;
+    }
+
+    public virtual void setCurrenciesFromMarkets(object values, object currencies = null)
+    {
         if (isTrue(!isEqual(currencies, null)))
         {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
@@ -1692,7 +1710,6 @@ public partial class Exchange
         this.currencies_by_id = this.indexBy(this.currencies, "id");
         object currenciesSortedByCode = this.keysort(this.currencies);
         this.codes = new List<object>(((IDictionary<string,object>)currenciesSortedByCode).Keys);
-        return this.markets;
     }
 
     public virtual object getDescribeForExtendedWsExchange(object currentRestInstance, object parentRestInstance, object wsBaseDescribe)
@@ -3712,10 +3729,6 @@ public partial class Exchange
 
     public virtual object safeMarket(object marketId, object market = null, object delimiter = null, object marketType = null)
     {
-        object result = this.safeMarketStructure(new Dictionary<string, object>() {
-            { "symbol", marketId },
-            { "marketId", marketId },
-        });
         if (isTrue(!isEqual(marketId, null)))
         {
             if (isTrue(isTrue((!isEqual(this.markets_by_id, null))) && isTrue((inOp(this.markets_by_id, marketId)))))
@@ -3748,6 +3761,10 @@ public partial class Exchange
                 }
             } else if (isTrue(isTrue(!isEqual(delimiter, null)) && isTrue(!isEqual(delimiter, ""))))
             {
+                object result = this.safeMarketStructure(new Dictionary<string, object>() {
+                    { "symbol", marketId },
+                    { "marketId", marketId },
+                });
                 object parts = ((string)marketId).Split(new [] {((string)delimiter)}, StringSplitOptions.None).ToList<object>();
                 object partsLength = getArrayLength(parts);
                 if (isTrue(isEqual(partsLength, 2)))
@@ -3768,7 +3785,11 @@ public partial class Exchange
         {
             return market;
         }
-        return result;
+        // the placeholder structure is only built for an unknown market id
+        return this.safeMarketStructure(new Dictionary<string, object>() {
+            { "symbol", marketId },
+            { "marketId", marketId },
+        });
     }
 
     public virtual object checkRequiredCredentials(object error = null)
@@ -146,6 +146,16 @@ public partial class binance : ccxt.binance
                 { "listenKeyRefreshRate", 1200000 },
                 { "ws", new Dictionary<string, object>() {
                     { "cost", 5 },
+                    { "routes", new Dictionary<string, object>() {
+                        { "key", "e" },
+                        { "id", "s" },
+                        { "channels", new Dictionary<string, object>() {
+                            { "trade", "trade::" },
+                            { "aggTrade", "trade::" },
+                            { "depthUpdate", "orderbook::" },
+                            { "kline", "ohlcv::" },
+                        } },
+                    } },
                 } },
                 { "tickerChannelsMap", new Dictionary<string, object>() {
                     { "24hrTicker", "ticker" },
@@ -99,6 +99,18 @@ public partial class bybit : ccxt.bybit
                 } },
             } },
             { "options", new Dictionary<string, object>() {
+                { "ws", new Dictionary<string, object>() {
+                    { "routes", new Dictionary<string, object>() {
+                        { "key", "topic" },
+                        { "separator", "." },
+                        { "channels", new Dictionary<string, object>() {
+                            { "publicTrade", "trade:" },
+                            { "kline", "ohlcv::" },
+                            { "tickers", "ticker:" },
+                            { "liquidation", "liquidations::" },
+                        } },
+                    } },
+                } },
                 { "watchTicker", new Dictionary<string, object>() {
                     { "name", "tickers" },
                 } },
@@ -41,6 +41,14 @@ public partial class kraken : ccxt.kraken
                 } },
             } },
             { "options", new Dictionary<string, object>() {
+                { "ws", new Dictionary<string, object>() {
+                    { "routes", new Dictionary<string, object>() {
+                        { "key", "event" },
+                        { "channels", new Dictionary<string, object>() {
+                            { "heartbeat", "heartbeat" },
+                        } },
+                    } },
+                } },
                 { "tradesLimit", 1000 },
                 { "OHLCVLimit", 1000 },
                 { "ordersLimit", 1000 },
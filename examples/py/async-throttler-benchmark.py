@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+from time import process_time, time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+
+# the previous implementation that polled the bucket every config['delay'] seconds, kept here for comparison
+class PollingThrottler(Throttler):
+    async def looper(self):
+        last_timestamp = time() * 1000
+        while self.running:
+            future, cost = self.queue[0]
+            cost = self.config['cost'] if cost is None else cost
+            if self.config['tokens'] >= 0:
+                self.config['tokens'] -= cost
+                if not future.done():
+                    future.set_result(None)
+                self.queue.popleft()
+                await asyncio.sleep(0)
+                if len(self.queue) == 0:
+                    self.running = False
+            else:
+                await asyncio.sleep(self.config['delay'])
+                now = time() * 1000
+                elapsed = now - last_timestamp
+                last_timestamp = now
+                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+
+
+async def measure(throttler_class, requests, rate_limit):
+    throttler = throttler_class({
+        'refillRate': 1 / rate_limit,
+        'maxCapacity': requests + 1,
+    })
+    wall_start = time()
+    cpu_start = process_time()
+    await asyncio.gather(*[throttler(1) for i in range(0, requests)])
+    return time() - wall_start, process_time() - cpu_start
+
+
+async def main():
+    requests = 1000
+    rate_limit = 5  # milliseconds per request, 1000 requests take ~5 seconds of wall time
+    for throttler_class in [PollingThrottler, Throttler]:
+        wall, cpu = await measure(throttler_class, requests, rate_limit)
+        print(throttler_class.__name__, requests, 'queued requests:', round(wall, 3), 's wall,', round(cpu, 3), 's cpu')
+
+
+asyncio.run(main())
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.static_dependencies import keccak  # noqa: E402
+
+exchange = ccxt.hyperliquid({
+    'privateKey': '0x' + '1a' * 32,
+    'walletAddress': '0x' + '00' * 20,
+})
+domain = {'chainId': 1337, 'name': 'Exchange', 'verifyingContract': '0x0000000000000000000000000000000000000000', 'version': '1'}
+types = {'Agent': [{'name': 'source', 'type': 'string'}, {'name': 'connectionId', 'type': 'bytes32'}]}
+
+
+def order(nonce):
+    # shaped like the action hyperliquid.create_order() signs
+    return {
+        'type': 'order',
+        'orders': [{'a': 0, 'b': True, 'p': str(60000 + nonce % 100), 's': '0.001', 'r': False, 't': {'limit': {'tif': 'Gtc'}}}],
+        'grouping': 'na',
+    }
+
+
+def per_second(function, cached, seconds=2):
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        if not cached:
+            Exchange.eth_domain_separators.clear()
+            Exchange.eth_message_types.clear()
+        function(1700000000000 + count)
+        count += 1
+    return round(count / (perf_counter() - start))
+
+
+cases = [
+    ('action_hash', lambda nonce: exchange.action_hash(order(nonce), None, nonce)),
+    ('eth_encode_structured_data', lambda nonce: exchange.eth_encode_structured_data(domain, types, {'source': 'a', 'connectionId': nonce.to_bytes(32, 'big')})),
+    ('sign_l1_action', lambda nonce: exchange.sign_l1_action(order(nonce), nonce)),
+]
+# the first call picks the native keccak
+keccak.SHA3(b'')
+native = keccak.native
+for keccak_name, function in [('python keccak', None), ('native keccak', native)]:
+    if keccak_name == 'native keccak' and native is None:
+        print('no native keccak installed, pip install pycryptodome')
+        break
+    keccak.native = function
+    for name, case in cases:
+        print(keccak_name, name, 'per second:', per_second(case, False), 'without cache,', per_second(case, True), 'cached')
+keccak.native = native
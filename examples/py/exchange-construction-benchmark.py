@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+ids = ['binance', 'binanceusdm', 'okx', 'bybit', 'bitget', 'gate', 'kucoin', 'htx', 'mexc', 'kraken']
+duration = 1.0  # seconds per exchange
+
+
+def measure(exchange_class):
+    # the first instance fills the per-class caches
+    start = perf_counter()
+    exchange_class()
+    first = perf_counter() - start
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < duration:
+        exchange_class({'apiKey': 'key', 'secret': 'secret'})
+        count += 1
+    return first, count / (perf_counter() - start)
+
+
+for module in [ccxt, ccxt.async_support]:
+    for exchange_id in ids:
+        first, rate = measure(getattr(module, exchange_id))
+        print((module.__name__ + '.' + exchange_id).ljust(36), 'first', str(round(first * 1000, 1)).rjust(7), 'ms,', str(round(rate)).rjust(6), 'instances/s')
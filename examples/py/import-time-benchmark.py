@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# every statement runs in a fresh interpreter, so that nothing is cached in sys.modules
+statements = [
+    'import ccxt',
+    'import ccxt.async_support',
+    'import ccxt.pro',
+    'import ccxt; ccxt.exchanges',
+    'import ccxt; ccxt.binance()',
+    'import ccxt.pro; ccxt.pro.binance()',
+    'import ccxt; ccxt.Exchange.ecdsa("aa" * 32, "bb" * 32, "secp256k1")',
+    'import ccxt; from ccxt import *',
+]
+
+timer = 'import time; start = time.perf_counter(); {}; print(time.perf_counter() - start)'
+
+
+def measure(statement, runs=5):
+    env = dict(os.environ, PYTHONPATH=root + '/python')
+    timings = []
+    for i in range(0, runs):
+        output = subprocess.check_output([sys.executable, '-c', timer.format(statement)], env=env)
+        timings.append(float(output.strip()))
+    return min(timings)
+
+
+for statement in statements:
+    print(statement.ljust(80), str(round(measure(statement) * 1000)) + ' ms')
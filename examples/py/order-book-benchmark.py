@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.order_book import OrderBook, SortedOrderBook, ColumnarOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_side import np  # noqa: E402
+
+
+def make_deltas(levels, count):
+    # size changes, new levels and deleted levels anywhere in a book of about levels prices per side
+    random.seed(levels)
+    deltas = []
+    for i in range(0, count):
+        side = random.choice(['asks', 'bids'])
+        price = random.randint(0, 2 * levels) / 2
+        size = random.choice([0, random.randint(1, 100) / 10, random.randint(1, 100) / 10])
+        deltas.append((side, [price, size]))
+    return deltas
+
+
+def per_update(book_class, levels, batch, seconds=1):
+    # microseconds per update of batch deltas followed by limit(), like a watch_order_book handler
+    snapshot = {
+        'asks': [[i / 2, 1.0] for i in range(0, 2 * levels, 2)],
+        'bids': [[i / 2, 1.0] for i in range(1, 2 * levels, 2)],
+    }
+    book = book_class(snapshot)
+    book.limit()
+    deltas = make_deltas(levels, 100000)
+    count = 0
+    start = perf_counter()
+    while perf_counter() - start < seconds:
+        for i in range(0, batch):
+            side, delta = deltas[(count * batch + i) % len(deltas)]
+            book[side].storeArray(list(delta))
+        book.limit()
+        count += 1
+    return (perf_counter() - start) / count * 1000000
+
+
+books = [('OrderBook', OrderBook), ('SortedOrderBook', SortedOrderBook)]
+if np is not None:
+    books.append(('ColumnarOrderBook', ColumnarOrderBook))
+else:
+    print('no numpy installed, pip install numpy to compare the columnar book')
+for levels in [1000, 5000, 20000, 100000]:
+    for batch in [1, 10]:
+        results = [name + ' ' + str(round(per_update(book_class, levels, batch), 1)) for name, book_class in books]
+        print(levels, 'levels,', batch, 'deltas + limit() in µs:', ', '.join(results))
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import random
+import sys
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base import precise  # noqa: E402
+
+static = root + '/ts/src/test/static/'
+
+
+def load(folder, id):
+    with open(static + folder + '/' + id + '.json', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def vary(entry, generator):
+    # the recorded entry with other prices and quantities, formatted like the exchange formats them
+    result = dict(entry)
+    for key, value in entry.items():
+        if isinstance(value, str) and key not in ('symbol', 'side', 'type', 'status', 'timeInForce', 'positionSide', 'workingType', 'commissionAsset') and value.replace('.', '').isdigit() and '.' in value:
+            decimals = len(value) - value.index('.') - 1
+            result[key] = '%.*f' % (decimals, float(value) * generator.uniform(0.5, 1.5))
+    return result
+
+
+def pages(response, method, count):
+    generator = random.Random(1)
+    entries = [entry for recorded in response['methods'][method] for entry in recorded['httpResponse']]
+    return [vary(generator.choice(entries), generator) for i in range(0, count)]
+
+
+def measure(parse, page, cold):
+    elapsed = []
+    for i in range(0, 20):
+        if cold:
+            precise.parsed_numbers.clear()
+        start = perf_counter()
+        parse(page)
+        elapsed.append(perf_counter() - start)
+    return round(min(elapsed) * 1000, 1)
+
+
+def main():
+    exchange = ccxt.binance()
+    exchange.set_markets(load('markets', 'binance'))
+    response = load('response', 'binance')
+    cases = [
+        ('parse_trades fetchTrades', 'fetchTrades', 'BTC/USDT', exchange.parse_trades),
+        ('parse_trades fetchMyTrades', 'fetchMyTrades', 'LTC/USDT', exchange.parse_trades),
+        ('parse_orders fetchOrders', 'fetchOrders', 'BTC/USDT:USDT', exchange.parse_orders),
+    ]
+    for name, method, symbol, parse in cases:
+        page = pages(response, method, 1000)
+        market = exchange.market(symbol)
+        # a new page parses new price and amount strings, a warm cache only keeps the repeated ones and the results of the previous operations
+        print(name, '1000 entries', measure(lambda page: parse(page, market), page, True), 'ms cold,', measure(lambda page: parse(page, market), page, False), 'ms warm')
+
+
+main()
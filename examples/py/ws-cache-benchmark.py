@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import os
+import random
+import sys
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById  # noqa: E402
+
+
+# the previous implementation that located updated orders with a linear scan over a parallel deque
+class LinearArrayCacheBySymbolById(ArrayCache):
+    def __init__(self, max_size=None):
+        super(LinearArrayCacheBySymbolById, self).__init__(max_size)
+        self._nested_new_updates_by_symbol = True
+        self.hashmap = {}
+        self._index = collections.deque([], max_size)
+
+    def append(self, item):
+        by_id = self.hashmap.setdefault(item['symbol'], {})
+        if item['id'] in by_id:
+            reference = by_id[item['id']]
+            if reference != item:
+                reference.update(item)
+            item = reference
+            index = self._index.index(item['id'])
+            del self._deque[index]
+            del self._index[index]
+        else:
+            by_id[item['id']] = item
+        if len(self._deque) == self._deque.maxlen:
+            delete_item = self._deque.popleft()
+            self._index.popleft()
+            del self.hashmap[delete_item['symbol']][delete_item['id']]
+        self._deque.append(item)
+        self._index.append(item['id'])
+        if item['symbol'] not in self._new_updates_by_symbol:
+            self._new_updates_by_symbol[item['symbol']] = set()
+        self._new_updates_by_symbol[item['symbol']].add(item['id'])
+
+
+def make_updates(count, ids):
+    random.seed(count)
+    symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'XRP/USDT']
+    updates = []
+    for i in range(0, count):
+        order_id = random.randint(0, ids)
+        updates.append({'id': str(order_id), 'symbol': symbols[order_id % len(symbols)], 'filled': i})
+    return updates
+
+
+def measure(cache_class, updates, max_size):
+    cache = cache_class(max_size)
+    start = perf_counter()
+    for update in updates:
+        cache.append(update)
+        # a consumer reading the newest entry after every update, as watch_orders does
+        cache[-1]
+    return perf_counter() - start
+
+
+def main():
+    max_size = 1000
+    # most updates hit orders that are already in the cache, as partial fills do
+    ids = 1200
+    for count in [10000, 100000, 1000000]:
+        updates = make_updates(count, ids)
+        for cache_class in [LinearArrayCacheBySymbolById, ArrayCacheBySymbolById]:
+            elapsed = measure(cache_class, [dict(update) for update in updates], max_size)
+            print(cache_class.__name__, count, 'updates:', round(elapsed, 3), 's,', round(count / elapsed), 'updates/s')
+
+
+main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import gzip
+import json
+import os
+import sys
+import tracemalloc
+import zlib
+from gzip import GzipFile
+from io import BytesIO
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from aiohttp import WSMessage, WSMsgType  # noqa: E402
+from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient  # noqa: E402
+from ccxt.async_support.base.ws.functions import json_decoder  # noqa: E402
+
+decode = json_decoder()
+
+
+# the previous path: decompress through GzipFile, decode to str, then parse the str
+def legacy_handle_message(client, message):
+    data = message.data
+    if client.gunzip:
+        data = GzipFile('', 'rb', 9, BytesIO(data)).read().decode('utf-8')
+    elif client.inflate:
+        data = zlib.decompress(data, -zlib.MAX_WBITS)
+    if isinstance(data, bytes):
+        data = data.decode()
+    client.on_message_callback(client, decode(data))
+
+
+def deflate(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def recording(count):
+    # an order book feed replayed from memory, one snapshot per message
+    messages = []
+    for i in range(0, count):
+        messages.append(json.dumps({
+            'ch': 'market.btcusdt.depth.step0',
+            'ts': 1700000000000 + i,
+            'tick': {
+                'bids': [[30000.1 - j - i % 7, 0.5 + j] for j in range(0, 150)],
+                'asks': [[30001.1 + j + i % 5, 0.25 + j] for j in range(0, 150)],
+            },
+        }).encode('utf-8'))
+    return messages
+
+
+def replay(handle, client, frames):
+    start = perf_counter()
+    for frame in frames:
+        handle(client, frame)
+    elapsed = perf_counter() - start
+    # the transient memory of a single message, from the frame payload to the parsed document
+    tracemalloc.start()
+    for frame in frames[:100]:
+        handle(client, frame)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def main():
+    count = 2000
+    messages = recording(count)
+    feeds = [
+        ('gzip', {'gunzip': True}, [WSMessage(WSMsgType.BINARY, gzip.compress(m), None) for m in messages]),
+        ('deflate', {'inflate': True}, [WSMessage(WSMsgType.BINARY, deflate(m), None) for m in messages]),
+        ('binary', {}, [WSMessage(WSMsgType.BINARY, m, None) for m in messages]),
+    ]
+    for name, config, frames in feeds:
+        client = AiohttpClient('wss://replay.test', lambda client, message: None, None, None, None, config)
+        for label, handle in [('legacy', legacy_handle_message), ('bytes', AiohttpClient.handle_message)]:
+            elapsed, peak = replay(handle, client, frames)
+            print(name, label, round(elapsed / count * 1000000, 1), 'us/message,', round(peak / 1024), 'KiB peak per message')
+
+
+asyncio.run(main())
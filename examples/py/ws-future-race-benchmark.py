@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt import ExchangeClosedByUser  # noqa: E402
+from ccxt.async_support.base.ws.future import Future  # noqa: E402
+
+
+# the previous implementation that wrapped asyncio.wait in a new task on every call
+def task_race(futures):
+    future = Future()
+    for f in futures:
+        f.is_race_future = True
+    task = asyncio.create_task(asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED))
+
+    def callback(done):
+        try:
+            complete, pending = done.result()
+            for i, f in enumerate(complete):
+                try:
+                    f.result()
+                except ExchangeClosedByUser as e:
+                    if len(pending) == 0 and i == len(complete) - 1:
+                        future.reject(e)
+                    continue
+                except asyncio.CancelledError:
+                    continue
+                except Exception as e:
+                    future.reject(e)
+                    return
+            futures_list = list(complete)
+            if all([f.cancelled() for f in futures_list]):
+                future.reject(ExchangeClosedByUser('Connection closed by the user'))
+                return
+            future.resolve(futures_list[0].result())
+        except Exception as e:
+            future.reject(e)
+    task.add_done_callback(callback)
+    return future
+
+
+async def measure(race, symbols, rounds):
+    # one watch_trades_for_symbols call per round, the per-hash futures live across rounds as in Client.future()
+    futures = [Future() for i in range(0, symbols)]
+    start = perf_counter()
+    for i in range(0, rounds):
+        race_future = race(futures)
+        index = i % symbols
+        futures[index].resolve(i)
+        assert (await race_future) == i
+        futures[index] = Future()
+    elapsed = perf_counter() - start
+    for future in futures:
+        future.cancel()
+    return elapsed
+
+
+async def main():
+    rounds = 2000
+    for symbols in [10, 100, 300]:
+        for name, race in [('task race', task_race), ('callback race', Future.race)]:
+            elapsed = await measure(race, symbols, rounds)
+            print(name, symbols, 'symbols:', round(elapsed, 3), 's,', round(rounds / elapsed), 'calls/s')
+
+
+asyncio.run(main())
@@ -852,7 +852,10 @@ export default class Exchange {
     };
     safeCurrencyStructure(currency: object): CurrencyInterface;
     safeMarketStructure(market?: Dict): MarketInterface;
+    marketDefaults(): any;
+    buildMarket(defaults: any, value: any): any;
     setMarkets(markets: any, currencies?: any): Dictionary<any>;
+    setCurrenciesFromMarkets(values: any, currencies?: any): void;
     getDescribeForExtendedWsExchange(currentRestInstance: any, parentRestInstance: any, wsBaseDescribe: Dictionary<any>): any;
     safeBalance(balance: Dict): Balances;
     safeOrder(order: Dict, market?: Market): Order;
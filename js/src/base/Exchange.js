@@ -2479,9 +2479,30 @@ export default class Exchange {
         }
         return cleanStructure;
     }
+    marketDefaults() {
+        // the defaults are merged once per reload, deepExtend copies them into every market
+        return this.deepExtend(this.safeMarketStructure(), {
+            'precision': this.precision,
+            'limits': this.limits,
+        }, this.fees['trading']);
+    }
+    buildMarket(defaults, value) {
+        const market = this.deepExtend(defaults, value);
+        if (market['linear']) {
+            market['subType'] = 'linear';
+        }
+        else if (market['inverse']) {
+            market['subType'] = 'inverse';
+        }
+        else {
+            market['subType'] = undefined;
+        }
+        return market;
+    }
     setMarkets(markets, currencies = undefined) {
         const values = [];
         this.markets_by_id = {};
+        const defaults = this.marketDefaults();
         // handle marketId conflicts
         // we insert spot markets first
         const marketValues = this.sortBy(this.toArray(markets), 'spot', true, true);
@@ -2493,26 +2514,17 @@ export default class Exchange {
             else {
                 this.markets_by_id[value['id']] = [value];
             }
-            const market = this.deepExtend(this.safeMarketStructure(), {
-                'precision': this.precision,
-                'limits': this.limits,
-            }, this.fees['trading'], value);
-            if (market['linear']) {
-                market['subType'] = 'linear';
-            }
-            else if (market['inverse']) {
-                market['subType'] = 'inverse';
-            }
-            else {
-                market['subType'] = undefined;
-            }
-            values.push(market);
+            values.push(this.buildMarket(defaults, value));
         }
         this.markets = this.indexBy(values, 'symbol');
         const marketsSortedBySymbol = this.keysort(this.markets);
         const marketsSortedById = this.keysort(this.markets_by_id);
         this.symbols = Object.keys(marketsSortedBySymbol);
         this.ids = Object.keys(marketsSortedById);
+        this.setCurrenciesFromMarkets(values, currencies);
+        return this.markets;
+    }
+    setCurrenciesFromMarkets(values, currencies = undefined) {
         if (currencies !== undefined) {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
             this.currencies = this.deepExtend(this.currencies, currencies);
@@ -2572,7 +2584,6 @@ export default class Exchange {
         this.currencies_by_id = this.indexBy(this.currencies, 'id');
         const currenciesSortedByCode = this.keysort(this.currencies);
         this.codes = Object.keys(currenciesSortedByCode);
-        return this.markets;
     }
     getDescribeForExtendedWsExchange(currentRestInstance, parentRestInstance, wsBaseDescribe) {
         const extendedRestDescribe = this.deepExtend(parentRestInstance.describe(), currentRestInstance.describe());
@@ -4142,10 +4153,6 @@ export default class Exchange {
         });
     }
     safeMarket(marketId, market = undefined, delimiter = undefined, marketType = undefined) {
-        const result = this.safeMarketStructure({
-            'symbol': marketId,
-            'marketId': marketId,
-        });
         if (marketId !== undefined) {
             if ((this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
                 const markets = this.markets_by_id[marketId];
@@ -4171,6 +4178,10 @@ export default class Exchange {
                 }
             }
             else if (delimiter !== undefined && delimiter !== '') {
+                const result = this.safeMarketStructure({
+                    'symbol': marketId,
+                    'marketId': marketId,
+                });
                 const parts = marketId.split(delimiter);
                 const partsLength = parts.length;
                 if (partsLength === 2) {
@@ -4189,7 +4200,11 @@ export default class Exchange {
         if (market !== undefined) {
             return market;
         }
-        return result;
+        // the placeholder structure is only built for an unknown market id
+        return this.safeMarketStructure({
+            'symbol': marketId,
+            'marketId': marketId,
+        });
     }
     checkRequiredCredentials(error = true) {
         /**
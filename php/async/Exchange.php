@@ -1654,9 +1654,30 @@ class Exchange extends \ccxt\Exchange {
         return $cleanStructure;
     }
 
+    public function market_defaults() {
+        // the defaults are merged once per reload, deepExtend copies them into every market
+        return $this->deep_extend($this->safe_market_structure(), array(
+            'precision' => $this->precision,
+            'limits' => $this->limits,
+        ), $this->fees['trading']);
+    }
+
+    public function build_market($defaults, $value) {
+        $market = $this->deep_extend($defaults, $value);
+        if ($market['linear']) {
+            $market['subType'] = 'linear';
+        } elseif ($market['inverse']) {
+            $market['subType'] = 'inverse';
+        } else {
+            $market['subType'] = null;
+        }
+        return $market;
+    }
+
     public function set_markets($markets, $currencies = null) {
         $values = array();
         $this->markets_by_id = array();
+        $defaults = $this->market_defaults();
         // handle marketId conflicts
         // we insert spot $markets first
         $marketValues = $this->sort_by($this->to_array($markets), 'spot', true, true);
@@ -1667,24 +1688,18 @@ class Exchange extends \ccxt\Exchange {
             } else {
                 $this->markets_by_id[$value['id']] = array( $value );
             }
-            $market = $this->deep_extend($this->safe_market_structure(), array(
-                'precision' => $this->precision,
-                'limits' => $this->limits,
-            ), $this->fees['trading'], $value);
-            if ($market['linear']) {
-                $market['subType'] = 'linear';
-            } elseif ($market['inverse']) {
-                $market['subType'] = 'inverse';
-            } else {
-                $market['subType'] = null;
-            }
-            $values[] = $market;
+            $values[] = $this->build_market($defaults, $value);
         }
         $this->markets = $this->index_by($values, 'symbol');
         $marketsSortedBySymbol = $this->keysort($this->markets);
         $marketsSortedById = $this->keysort($this->markets_by_id);
         $this->symbols = is_array($marketsSortedBySymbol) ? array_keys($marketsSortedBySymbol) : array();
         $this->ids = is_array($marketsSortedById) ? array_keys($marketsSortedById) : array();
+        $this->set_currencies_from_markets($values, $currencies);
+        return $this->markets;
+    }
+
+    public function set_currencies_from_markets($values, $currencies = null) {
         if ($currencies !== null) {
             // $currencies is always null when called in constructor but not when called from loadMarkets
             $this->currencies = $this->deep_extend($this->currencies, $currencies);
@@ -1742,7 +1757,6 @@ class Exchange extends \ccxt\Exchange {
         $this->currencies_by_id = $this->index_by($this->currencies, 'id');
         $currenciesSortedByCode = $this->keysort($this->currencies);
         $this->codes = is_array($currenciesSortedByCode) ? array_keys($currenciesSortedByCode) : array();
-        return $this->markets;
     }
 
     public function get_describe_for_extended_ws_exchange(mixed $currentRestInstance, mixed $parentRestInstance, array $wsBaseDescribe) {
@@ -3386,10 +3400,6 @@ class Exchange extends \ccxt\Exchange {
     }
 
     public function safe_market(?string $marketId, ?array $market = null, ?string $delimiter = null, ?string $marketType = null) {
-        $result = $this->safe_market_structure(array(
-            'symbol' => $marketId,
-            'marketId' => $marketId,
-        ));
         if ($marketId !== null) {
             if (($this->markets_by_id !== null) && (is_array($this->markets_by_id) && array_key_exists($marketId, $this->markets_by_id))) {
                 $markets = $this->markets_by_id[$marketId];
@@ -3412,6 +3422,10 @@ class Exchange extends \ccxt\Exchange {
                     }
                 }
             } elseif ($delimiter !== null && $delimiter !== '') {
+                $result = $this->safe_market_structure(array(
+                    'symbol' => $marketId,
+                    'marketId' => $marketId,
+                ));
                 $parts = explode($delimiter, $marketId);
                 $partsLength = count($parts);
                 if ($partsLength === 2) {
@@ -3429,7 +3443,11 @@ class Exchange extends \ccxt\Exchange {
         if ($market !== null) {
             return $market;
         }
-        return $result;
+        // the placeholder structure is only built for an unknown $market id
+        return $this->safe_market_structure(array(
+            'symbol' => $marketId,
+            'marketId' => $marketId,
+        ));
     }
 
     public function check_required_credentials($error = true) {
@@ -155,6 +155,17 @@ class binance extends \ccxt\async\binance {
                 'listenKeyRefreshRate' => 1200000, // 20 mins
                 'ws' => array(
                     'cost' => 5,
+                    // frames of the channels below are decoded only while the prefix followed by the symbol of the frame is watched, see Client.route() in python
+                    'routes' => array(
+                        'key' => 'e',
+                        'id' => 's',
+                        'channels' => array(
+                            'trade' => 'trade::',
+                            'aggTrade' => 'trade::',
+                            'depthUpdate' => 'orderbook::',
+                            'kline' => 'ohlcv::',
+                        ),
+                    ),
                 ),
                 'tickerChannelsMap' => array(
                     '24hrTicker' => 'ticker',
@@ -107,6 +107,19 @@ class bybit extends \ccxt\async\bybit {
                 ),
             ),
             'options' => array(
+                'ws' => array(
+                    // frames of the channels below are decoded only while the prefix followed by the symbol of the frame is watched, see Client.route() in python
+                    'routes' => array(
+                        'key' => 'topic',
+                        'separator' => '.',
+                        'channels' => array(
+                            'publicTrade' => 'trade:',
+                            'kline' => 'ohlcv::',
+                            'tickers' => 'ticker:',
+                            'liquidation' => 'liquidations::',
+                        ),
+                    ),
+                ),
                 'watchTicker' => array(
                     'name' => 'tickers', // 'tickers' for 24hr statistical ticker or 'tickers_lt' for leverage token ticker
                 ),
@@ -53,6 +53,15 @@ class kraken extends \ccxt\async\kraken {
             //     'ws' => '0.2.0',
             // ),
             'options' => array(
+                'ws' => array(
+                    // frames of the channels below are decoded only while a hash with the prefix is watched, see Client.route() in python
+                    'routes' => array(
+                        'key' => 'event',
+                        'channels' => array(
+                            'heartbeat' => 'heartbeat',
+                        ),
+                    ),
+                ),
                 'tradesLimit' => 1000,
                 'OHLCVLimit' => 1000,
                 'ordersLimit' => 1000,
@@ -0,0 +1,101 @@
+import aiohttp
+
+
+class ConnectionPool:
+    # aiohttp connectors shared by every exchange instance in the process that opts in with the same settings
+    # aiohttp keeps a keep-alive pool per host inside each connector, limitPerHost caps it
+    registry = {}
+
+    defaults = {
+        'limit': 100,  # connections across all hosts
+        'limitPerHost': 0,  # connections per host, 0 is unlimited
+        'ttlDnsCache': 300,  # seconds a resolved address is reused, None caches forever
+        'keepaliveTimeout': 30,  # seconds an idle connection stays open
+        'prewarm': 1,  # connections opened per api host by Exchange.prewarm()
+    }
+
+    def __init__(self, key, config, ssl_context, loop=None):
+        self.key = key
+        self.config = config
+        self.loop = loop
+        self.users = 0
+        self.connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            loop=loop,
+            enable_cleanup_closed=True,
+            limit=config['limit'],
+            limit_per_host=config['limitPerHost'],
+            use_dns_cache=True,
+            ttl_dns_cache=config['ttlDnsCache'],
+            keepalive_timeout=config['keepaliveTimeout'],
+        )
+        # connection and dns counters per host, collected from the sessions through aiohttp tracing
+        self.counters = {}
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self.on_request_start)
+        self.trace_config.on_connection_create_end.append(self.on_connection_create_end)
+        self.trace_config.on_connection_reuseconn.append(self.on_connection_reuseconn)
+        self.trace_config.on_dns_cache_hit.append(self.on_dns_cache_hit)
+        self.trace_config.on_dns_cache_miss.append(self.on_dns_cache_miss)
+
+    @classmethod
+    def shared(cls, config, ssl_context, cafile=None, verify=True, loop=None):
+        config = dict(cls.defaults, **config)
+        # connectors are bound to their event loop and to the certificates they trust
+        key = (loop, cafile, verify, config['limit'], config['limitPerHost'], config['ttlDnsCache'], config['keepaliveTimeout'])
+        pool = cls.registry.get(key)
+        if pool is None or pool.connector.closed:
+            pool = cls(key, config, ssl_context, loop)
+            cls.registry[key] = pool
+        pool.users += 1
+        return pool
+
+    async def release(self):
+        # the last exchange instance to let go closes the connector
+        self.users -= 1
+        if self.users <= 0:
+            if self.registry.get(self.key) is self:
+                del self.registry[self.key]
+            await self.connector.close()
+
+    def session(self, trust_env=False):
+        return aiohttp.ClientSession(loop=self.loop, connector=self.connector, connector_owner=False, trust_env=trust_env, trace_configs=[self.trace_config])
+
+    def count(self, host, counter):
+        counters = self.counters.get(host)
+        if counters is None:
+            counters = self.counters[host] = {'opened': 0, 'reused': 0, 'dnsHits': 0, 'dnsMisses': 0}
+        counters[counter] += 1
+
+    async def on_request_start(self, session, context, params):
+        context.host = params.url.host
+
+    async def on_connection_create_end(self, session, context, params):
+        self.count(getattr(context, 'host', None), 'opened')
+
+    async def on_connection_reuseconn(self, session, context, params):
+        self.count(getattr(context, 'host', None), 'reused')
+
+    async def on_dns_cache_hit(self, session, context, params):
+        self.count(params.host, 'dnsHits')
+
+    async def on_dns_cache_miss(self, session, context, params):
+        self.count(params.host, 'dnsMisses')
+
+    def metrics(self):
+        # {host: {'idle', 'active', 'opened', 'reused', 'dnsHits', 'dnsMisses', 'limit'}}
+        result = {}
+
+        def host_metrics(host):
+            if host not in result:
+                result[host] = {'idle': 0, 'active': 0, 'opened': 0, 'reused': 0, 'dnsHits': 0, 'dnsMisses': 0, 'limit': self.config['limitPerHost']}
+            return result[host]
+
+        # the live pool sizes come from the connector internals, missing ones read as empty
+        for connection_key, connections in getattr(self.connector, '_conns', {}).items():
+            host_metrics(connection_key.host)['idle'] += len(connections)
+        for connection_key, connections in getattr(self.connector, '_acquired_per_host', {}).items():
+            host_metrics(connection_key.host)['active'] += len(connections)
+        for host, counters in self.counters.items():
+            host_metrics(host).update(counters)
+        return result
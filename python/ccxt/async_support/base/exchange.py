@@ -7,20 +7,22 @@ __version__ = '4.4.32'
 # -----------------------------------------------------------------------------
 
 import asyncio
+import collections
 import concurrent.futures
+import contextvars
 import socket
 import certifi
 import aiohttp
 import ssl
 import sys
 import yarl
-import math
 from typing import Any, List
 from ccxt.base.types import Int, Str, Num, Strings
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.connection_pool import ConnectionPool
 
 # -----------------------------------------------------------------------------
 
@@ -29,14 +31,15 @@ from ccxt.base.types import OrderType, OrderSide, OrderRequest, CancellationRequ
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired
+from ccxt.base.exchange import Exchange as BaseExchange, ArgumentsRequired, pagination_capture
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
-from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.stream import Stream, Subscriber
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook, SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook, ColumnarOrderBook, ColumnarCountedOrderBook
 
 
 # -----------------------------------------------------------------------------
@@ -55,6 +58,14 @@ __all__ = [
 
 # -----------------------------------------------------------------------------
 
+# json parsers read utf-8, other charsets are decoded to text first
+utf8_encodings = ('utf-8', 'utf8')
+
+# set while a streamed watch_* call subscribes, see Exchange.stream_updates()
+stream_subscriber = contextvars.ContextVar('stream_subscriber', default=None)
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(BaseExchange):
     synchronous = False
@@ -65,6 +76,8 @@ class Exchange(BaseExchange):
     ping = None
     newUpdates = True
     clients = {}
+    markets_cache_refresher = None
+    connection_pool = None
     timeout_on_exit = 250  # needed for: https://github.com/ccxt/ccxt/pull/23470
 
     def __init__(self, config={}):
@@ -81,7 +94,23 @@ class Exchange(BaseExchange):
         self.reloading_markets = False
 
     def init_rest_rate_limiter(self):
-        self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
+        if self.rateLimitGroup is not None:
+            self.throttle = Throttler.shared(self.rateLimitGroup, self.tokenBucket, self.asyncio_loop)
+        else:
+            self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
+
+    def handle_rate_limit_headers(self, headers):
+        # options['rateLimitHeaders'] maps a response header to the weight budget it reports, e.g.
+        # {'x-mbx-used-weight-1m': {'limit': 6000, 'cost': 0.05}} where cost converts weight to bucket tokens
+        rate_limit_headers = self.safe_dict(self.options, 'rateLimitHeaders')
+        if not rate_limit_headers or not headers:
+            return
+        for header in headers:
+            config = rate_limit_headers.get(header.lower())
+            if config is not None:
+                used = self.parse_number(headers[header])
+                if used is not None:
+                    self.throttle.resync(used, config['limit'], config.get('cost', 1.0))
 
     def get_event_loop(self):
         return self.asyncio_loop
@@ -114,20 +143,120 @@ class Exchange(BaseExchange):
             self.ssl_context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
 
         if self.own_session and self.session is None:
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            self.tcp_connector = aiohttp.TCPConnector(ssl=self.ssl_context, loop=self.asyncio_loop, enable_cleanup_closed=True)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
+            pool_config = self.connection_pool_config()
+            if pool_config is not None:
+                # borrow the process-wide connector, the session is ours but the connections are shared
+                self.connection_pool = ConnectionPool.shared(pool_config, self.ssl_context, self.cafile, self.verify, self.asyncio_loop)
+                self.session = self.connection_pool.session(self.aiohttp_trust_env)
+            else:
+                # Pass this SSL context to aiohttp and create a TCPConnector
+                self.tcp_connector = aiohttp.TCPConnector(ssl=self.ssl_context, loop=self.asyncio_loop, enable_cleanup_closed=True)
+                self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
+
+    def connection_pool_config(self):
+        # options['connectionPool'] is True or a dict overriding ConnectionPool.defaults, see ConnectionPool
+        config = self.safe_value(self.options, 'connectionPool')
+        if not config:
+            return None
+        return config if isinstance(config, dict) else {}
+
+    def api_origins(self):
+        # scheme://host[:port] of every rest endpoint in urls['api']
+        origins = []
+        pending = [self.safe_value(self.urls, 'api')]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                pending.extend(value.values())
+            elif isinstance(value, list):
+                pending.extend(value)
+            elif isinstance(value, str):
+                url = yarl.URL(self.implode_hostname(value))
+                if url.scheme in ('http', 'https') and url.host:
+                    origin = str(url.origin())
+                    if origin not in origins:
+                        origins.append(origin)
+        return origins
+
+    async def prewarm(self, connections=None):
+        """
+        opens keep-alive connections to the api hosts ahead of the first requests, so they skip dns, tcp and tls setup
+        :param int [connections]: connections per host, defaults to options['connectionPool']['prewarm'] or 1
+        :returns dict: the number of connections opened per origin
+        """
+        self.open()
+        if connections is None:
+            connections = self.safe_integer(self.connection_pool_config() or {}, 'prewarm', 1)
+        origins = self.api_origins()
+        requests = []
+        for origin in origins:
+            httpProxy, httpsProxy, socksProxy = self.check_proxy_settings(origin, 'HEAD', None, None)
+            if socksProxy or self.check_proxy_url_settings(origin, 'HEAD', None, None):
+                raise NotSupported(self.id + ' prewarm() does not support socks proxies and proxy urls')
+            proxy = httpProxy or httpsProxy or self.aiohttp_proxy
+            for i in range(0, connections):
+                requests.append(self.prewarm_connection(origin, proxy))
+        # the requests run concurrently so each one holds a connection of its own
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        opened = {}
+        for i in range(0, len(origins)):
+            chunk = results[i * connections:(i + 1) * connections]
+            opened[origins[i]] = len([result for result in chunk if result is True])
+        return opened
+
+    async def prewarm_connection(self, origin, proxy=None):
+        async with self.session.head(origin, timeout=(self.timeout / 1000), proxy=proxy, allow_redirects=False) as response:
+            await response.read()
+        return True
 
     async def close(self):
+        if self.markets_cache_refresher is not None:
+            self.markets_cache_refresher.cancel()
+            self.markets_cache_refresher = None
         await self.ws_close()
         if self.session is not None:
             if self.own_session:
                 await self.session.close()
             self.session = None
+        if self.connection_pool is not None:
+            await self.connection_pool.release()
+            self.connection_pool = None
         await self.close_connector()
         await self.close_proxy_sessions()
         await self.sleep(self.timeout_on_exit)
 
+    async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        key = self.request_cache_key(path, api, method, params, headers, body)
+        if key is None:
+            return await self.fetch2_transpiled(path, api, method, params, headers, body, config)
+        cache = self.get_request_cache()
+        hit, shared = cache.get(key, self.milliseconds())
+        if hit:
+            return self.unshare_response(shared)
+        # identical requests in flight share one task, shielded so that a cancelled caller does not cancel the others
+        task = cache.inflight.get(key)
+        if task is None:
+            cache.misses += 1
+            task = asyncio.ensure_future(self.fetch2_shared(path, api, method, params, headers, body, config))
+            cache.inflight[key] = task
+
+            def settle(task):
+                if cache.inflight.get(key) is task:
+                    del cache.inflight[key]
+                if not task.cancelled() and task.exception() is None:
+                    ttl = self.request_cache_ttl(path)
+                    if ttl > 0:
+                        cache.set(key, task.result(), self.milliseconds() + ttl)
+
+            task.add_done_callback(settle)
+        else:
+            cache.coalesced += 1
+        return self.unshare_response(await asyncio.shield(task))
+
+    async def fetch2_shared(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+        response = await self.fetch2_transpiled(path, api, method, params, headers, body, config)
+        return self.shared_response(response)
+
     async def close_connector(self):
         if self.tcp_connector is not None:
             await self.tcp_connector.close()
@@ -212,19 +341,17 @@ class Exchange(BaseExchange):
                                       headers=request_headers,
                                       timeout=(self.timeout / 1000),
                                       proxy=final_proxy) as response:
-                http_response = await response.text(errors='replace')
+                # the body is read once as bytes, json is parsed from them rather than from the text
+                http_body = await response.read()
+                encoding = response.get_encoding()
+                text = http_body.decode(encoding, errors='replace')
                 # CIMultiDictProxy
-                raw_headers = response.headers
-                headers = {}
-                for header in raw_headers:
-                    if header in headers:
-                        headers[header] = headers[header] + ', ' + raw_headers[header]
-                    else:
-                        headers[header] = raw_headers[header]
+                headers = self.join_response_headers(response.headers)
                 http_status_code = response.status
                 http_status_text = response.reason
-                http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
-                json_response = self.parse_json(http_response)
+                self.handle_rate_limit_headers(headers)
+                http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, text, request_headers, request_body)
+                json_response = self.parse_json_body(http_body, encoding, text, http_response)
                 if self.enableLastHttpResponse:
                     self.last_http_response = http_response
                 if self.enableLastResponseHeaders:
@@ -261,17 +388,64 @@ class Exchange(BaseExchange):
             return http_response
         return response.content
 
+    def parse_json_body(self, body, encoding, text, http_response):
+        # utf-8 bytes go to the parser as they are, a str would be encoded to utf-8 again for it
+        # the text is parsed instead when on_rest_response() changed more than the surrounding whitespace
+        if encoding.lower() in utf8_encodings and (http_response is text or http_response == text.strip()):
+            if Exchange.is_json_encoded_object(http_response):
+                try:
+                    return self.on_json_response(body)
+                except ValueError:
+                    pass
+        return self.parse_json(http_response)
+
+    @staticmethod
+    def join_response_headers(raw_headers):
+        # a plain dict of the CIMultiDictProxy, repeated headers are joined with commas
+        headers = dict(raw_headers)
+        if len(headers) == len(raw_headers):
+            return headers
+        headers = {}
+        for header in raw_headers:
+            if header in headers:
+                headers[header] = headers[header] + ', ' + raw_headers[header]
+            else:
+                headers[header] = raw_headers[header]
+        return headers
+
     async def load_markets_helper(self, reload=False, params={}):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if not params and self.load_markets_from_cache() is not None:
+                if self.markets_cache_expired():
+                    if not self.markets_cache_config()['background']:
+                        return await self.refresh_markets(params)
+                    # serve the stale markets right away and replace them once the exchange has answered
+                    if self.markets_cache_refresher is None or self.markets_cache_refresher.done():
+                        self.markets_cache_refresher = asyncio.ensure_future(self.refresh_markets_in_background())
+                return self.markets
+        return await self.refresh_markets(params)
+
+    async def refresh_markets(self, params={}):
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        result = self.apply_markets(markets, currencies)
+        if not params:
+            self.save_markets_to_cache()
+        return result
+
+    async def refresh_markets_in_background(self):
+        try:
+            await self.refresh_markets()
+        except Exception as e:
+            # the stale markets stay in place, the next load_markets() call retries
+            if self.verbose:
+                self.log('refresh_markets_in_background', e)
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -315,6 +489,283 @@ class Exchange(BaseExchange):
     async def fetch_full_tickers(self, symbols=None, params={}):
         return await self.fetch_tickers(symbols, params)
 
+    async def paginate_dynamic(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, params={}, maxEntriesPerRequest: Int = None):
+        # yields the pages of fetch_paginated_call_dynamic() as they arrive
+        maxCalls = None
+        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
+        maxRetries = None
+        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
+        paginationDirection = None
+        paginationDirection, params = self.handle_option_and_params(params, method, 'paginationDirection', 'backward')
+        paginationTimestamp = None
+        calls = 0
+        errors = 0
+        until = self.safe_integer_2(params, 'untill', 'till')  # do not omit it from params here
+        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
+        if (paginationDirection == 'forward'):
+            if since is None:
+                raise ArgumentsRequired(self.id + ' pagination requires a since argument when paginationDirection set to forward')
+            paginationTimestamp = since
+        while calls < maxCalls:
+            calls += 1
+            try:
+                if paginationDirection == 'backward':
+                    # do it backwards, starting from the last
+                    # UNTIL filtering is required in order to work
+                    if paginationTimestamp is not None:
+                        params['until'] = paginationTimestamp - 1
+                    response = await getattr(self, method)(symbol, None, maxEntriesPerRequest, params)
+                    responseLength = len(response)
+                    if self.verbose:
+                        backwardMessage = 'Dynamic pagination call ' + self.number_to_string(calls) + ' method ' + method + ' response length ' + self.number_to_string(responseLength)
+                        if paginationTimestamp is not None:
+                            backwardMessage += ' timestamp ' + self.number_to_string(paginationTimestamp)
+                        self.log(backwardMessage)
+                    if responseLength == 0:
+                        break
+                    errors = 0
+                    yield response
+                    firstElement = self.safe_value(response, 0)
+                    paginationTimestamp = self.safe_integer_2(firstElement, 'timestamp', 0)
+                    if (since is not None) and (paginationTimestamp <= since):
+                        break
+                else:
+                    # do it forwards, starting from the since
+                    response = await getattr(self, method)(symbol, paginationTimestamp, maxEntriesPerRequest, params)
+                    responseLength = len(response)
+                    if self.verbose:
+                        forwardMessage = 'Dynamic pagination call ' + self.number_to_string(calls) + ' method ' + method + ' response length ' + self.number_to_string(responseLength)
+                        if paginationTimestamp is not None:
+                            forwardMessage += ' timestamp ' + self.number_to_string(paginationTimestamp)
+                        self.log(forwardMessage)
+                    if responseLength == 0:
+                        break
+                    errors = 0
+                    yield response
+                    last = self.safe_value(response, responseLength - 1)
+                    paginationTimestamp = self.safe_integer(last, 'timestamp') + 1
+                    if (until is not None) and (paginationTimestamp >= until):
+                        break
+            except Exception as e:
+                errors += 1
+                if errors > maxRetries:
+                    raise e
+
+    async def fetch_paginated_call_dynamic(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, params={}, maxEntriesPerRequest: Int = None):
+        if self.capture_pagination('paginate_dynamic', method, [method, symbol, since, limit, params, maxEntriesPerRequest], since, limit):
+            return []
+        concurrency = None
+        concurrency, params = self.handle_option_and_params(params, method, 'paginationConcurrency', 1)
+        if concurrency > 1 and since is not None and self.safe_integer_2(params, 'until', 'till') is not None:
+            return await self.fetch_paginated_call_adaptive(method, symbol, since, limit, params, maxEntriesPerRequest, concurrency)
+        result = []
+        async for page in self.paginate_dynamic(method, symbol, since, limit, params, maxEntriesPerRequest):
+            result.extend(page)
+        return self.merge_paginated_result(method, self.remove_repeated_elements_from_array(result), since, limit)
+
+    async def fetch_adaptive_pagination_window(self, method, symbol, window, maxEntriesPerRequest, params):
+        return await getattr(self, method)(symbol, window[0], maxEntriesPerRequest, self.extend(params, {'until': window[1]}))
+
+    async def fetch_paginated_call_adaptive(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, params={}, maxEntriesPerRequest: Int = None, concurrency=1):
+        maxCalls = None
+        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
+        maxRetries = None
+        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
+        paginationDirection = None
+        paginationDirection, params = self.handle_option_and_params(params, method, 'paginationDirection', 'backward')
+        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
+        until = self.safe_integer_2(params, 'until', 'till')
+        params = self.omit(params, ['until', 'till'])
+        concurrency = self.pagination_concurrency(concurrency)
+        windows = collections.deque(self.split_pagination_window(since, until, concurrency))
+        pending = {}
+        calls = 0
+        result = []
+        try:
+            while True:
+                while windows and len(pending) < concurrency and calls < maxCalls:
+                    window = windows.popleft()
+                    calls += 1
+                    pending[asyncio.ensure_future(self.fetch_adaptive_pagination_window(method, symbol, window, maxEntriesPerRequest, params))] = window
+                if not pending:
+                    break
+                done, not_done = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    window = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        window[2] += 1
+                        if window[2] > maxRetries:
+                            raise e
+                        windows.append(window)
+                        continue
+                    responseLength = len(response)
+                    if self.verbose:
+                        self.log('Adaptive pagination call ' + str(calls) + ' method ' + method + ' window ' + str(window[0]) + '-' + str(window[1]) + ' response length ' + str(responseLength))
+                    result = self.array_concat(result, response)
+                    if responseLength >= maxEntriesPerRequest:
+                        windows.extend(self.remaining_pagination_windows(window, response, paginationDirection, concurrency))
+        finally:
+            for task in pending:
+                task.cancel()
+        return self.merge_adaptive_pagination_result(method, result, since, limit)
+
+    async def paginate_deterministic(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, timeframe: Str = None, params={}, maxEntriesPerRequest=None):
+        # yields the windows of fetch_paginated_call_deterministic() one at a time, oldest first
+        windows, maxEntriesPerRequest, params = self.deterministic_pagination_windows(method, since, timeframe, params, maxEntriesPerRequest)
+        for windowSince in windows:
+            yield await self.safe_deterministic_call(method, symbol, windowSince, maxEntriesPerRequest, timeframe, params)
+
+    async def fetch_paginated_call_deterministic(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, timeframe: Str = None, params={}, maxEntriesPerRequest=None):
+        if self.capture_pagination('paginate_deterministic', method, [method, symbol, since, limit, timeframe, params, maxEntriesPerRequest], since, limit):
+            return []
+        # the windows are requested concurrently, paginate_deterministic() requests them one at a time
+        windows, maxEntriesPerRequest, params = self.deterministic_pagination_windows(method, since, timeframe, params, maxEntriesPerRequest)
+        pages = await asyncio.gather(*[self.safe_deterministic_call(method, symbol, windowSince, maxEntriesPerRequest, timeframe, params) for windowSince in windows])
+        result = []
+        for page in pages:
+            result.extend(page)
+        return self.merge_paginated_result(method, self.remove_repeated_elements_from_array(result), since, limit)
+
+    async def paginate_cursor(self, method: str, symbol: Str = None, since=None, limit=None, params={}, cursorReceived=None, cursorSent=None, cursorIncrement=None, maxEntriesPerRequest=None):
+        # yields the pages of fetch_paginated_call_cursor() as they arrive
+        maxCalls = None
+        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
+        maxRetries = None
+        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
+        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
+        cursorValue = None
+        i = 0
+        errors = 0
+        timeframe = self.safe_string(params, 'timeframe')
+        params = self.omit(params, 'timeframe')  # reading the timeframe from the method arguments to avoid changing the signature
+        while i < maxCalls:
+            try:
+                if cursorValue is not None:
+                    if cursorIncrement is not None:
+                        cursorValue = self.parse_to_int(cursorValue) + cursorIncrement
+                    params[cursorSent] = cursorValue
+                response = None
+                if method == 'fetchAccounts':
+                    response = await getattr(self, method)(params)
+                elif method == 'getLeverageTiersPaginated' or method == 'fetchPositions':
+                    response = await getattr(self, method)(symbol, params)
+                elif method == 'fetchOpenInterestHistory':
+                    response = await getattr(self, method)(symbol, timeframe, since, maxEntriesPerRequest, params)
+                else:
+                    response = await getattr(self, method)(symbol, since, maxEntriesPerRequest, params)
+                errors = 0
+                responseLength = len(response)
+                if self.verbose:
+                    cursorString = '' if (cursorValue is None) else cursorValue
+                    iteration = (i + 1)
+                    cursorMessage = 'Cursor pagination call ' + str(iteration) + ' method ' + method + ' response length ' + str(responseLength) + ' cursor ' + cursorString
+                    self.log(cursorMessage)
+                if responseLength == 0:
+                    break
+                yield response
+                last = self.safe_dict(response, responseLength - 1)
+                # cursorValue = self.safe_value(last['info'], cursorReceived)
+                cursorValue = None  # search for the cursor
+                for j in range(0, responseLength):
+                    index = responseLength - j - 1
+                    entry = self.safe_dict(response, index)
+                    info = self.safe_dict(entry, 'info')
+                    cursor = self.safe_value(info, cursorReceived)
+                    if cursor is not None:
+                        cursorValue = cursor
+                        break
+                if cursorValue is None:
+                    break
+                lastTimestamp = self.safe_integer(last, 'timestamp')
+                if lastTimestamp is not None and lastTimestamp < since:
+                    break
+            except Exception as e:
+                errors += 1
+                if errors > maxRetries:
+                    raise e
+            i += 1
+
+    async def fetch_paginated_call_cursor(self, method: str, symbol: Str = None, since=None, limit=None, params={}, cursorReceived=None, cursorSent=None, cursorIncrement=None, maxEntriesPerRequest=None):
+        if self.capture_pagination('paginate_cursor', method, [method, symbol, since, limit, params, cursorReceived, cursorSent, cursorIncrement, maxEntriesPerRequest], since, limit):
+            return []
+        result = []
+        async for page in self.paginate_cursor(method, symbol, since, limit, params, cursorReceived, cursorSent, cursorIncrement, maxEntriesPerRequest):
+            result.extend(page)
+        return self.merge_paginated_result(method, self.sort_cursor_paginated_result(result), since, limit)
+
+    async def paginate_incremental(self, method: str, symbol: Str = None, since=None, limit=None, params={}, pageKey=None, maxEntriesPerRequest=None):
+        # yields the pages of fetch_paginated_call_incremental() as they arrive
+        maxCalls = None
+        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
+        maxRetries = None
+        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
+        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
+        i = 0
+        errors = 0
+        while i < maxCalls:
+            try:
+                params[pageKey] = i + 1
+                response = await getattr(self, method)(symbol, since, maxEntriesPerRequest, params)
+                errors = 0
+                responseLength = len(response)
+                if self.verbose:
+                    incrementalMessage = 'Incremental pagination call ' + str(i + 1) + ' method ' + method + ' response length ' + str(responseLength)
+                    self.log(incrementalMessage)
+                if responseLength == 0:
+                    break
+                yield response
+            except Exception as e:
+                errors += 1
+                if errors > maxRetries:
+                    raise e
+            i += 1
+
+    async def fetch_paginated_call_incremental(self, method: str, symbol: Str = None, since=None, limit=None, params={}, pageKey=None, maxEntriesPerRequest=None):
+        if self.capture_pagination('paginate_incremental', method, [method, symbol, since, limit, params, pageKey, maxEntriesPerRequest], since, limit):
+            return []
+        result = []
+        async for page in self.paginate_incremental(method, symbol, since, limit, params, pageKey, maxEntriesPerRequest):
+            result.extend(page)
+        return self.merge_paginated_result(method, self.sort_cursor_paginated_result(result), since, limit)
+
+    async def start_page_iteration(self, method, args):
+        # calls the fetch_* method with paginate=True while the pagination it starts is captured
+        # an empty capture means the exchange does not paginate the method and the response holds every entry
+        args = list(args)
+        params = args.pop()
+        dedupSize = None
+        dedupSize, params = self.handle_option_and_params(params, self.camel_case(method), 'paginationDedupSize', 1000)
+        capture = {}
+        token = pagination_capture.set(capture)
+        try:
+            response = await getattr(self, method)(*args, self.extend(params, {'paginate': True}))
+        finally:
+            pagination_capture.reset(token)
+        return [capture, response, dedupSize]
+
+    async def iterate_pages(self, method, *args):
+        """
+        iterates over the pages of a fetch_* method that the exchange paginates with params['paginate'], as they arrive
+        :param str method: the name of the fetch_* method, like 'fetch_trades'
+        :param args: the arguments of the fetch_* method, ending with params
+        :returns async generator: lists of entries, since and limit apply to the whole iteration, repeated entries are dropped within the last options['paginationDedupSize'] entries
+        the entries of a backward dynamic pagination are yielded newest first, across and within the pages, all others oldest first
+        """
+        capture, response, dedupSize = await self.start_page_iteration(method, args)
+        if not capture:
+            if response:
+                yield response
+            return
+        state = self.page_filter_state(capture, dedupSize)
+        async for page in getattr(self, capture['pages'])(*capture['args']):
+            page = self.filter_page(page, state)
+            if page:
+                yield page
+            if state['remaining'] is not None and state['remaining'] <= 0:
+                return
+
     async def sleep(self, milliseconds):
         return await asyncio.sleep(milliseconds / 1000)
 
@@ -353,12 +804,25 @@ class Exchange(BaseExchange):
         return gunzip(data)
 
     def order_book(self, snapshot={}, depth=None):
+        order_book_type = self.safe_string(self.options, 'orderBookType')
+        if order_book_type == 'sorted':
+            return SortedOrderBook(snapshot, depth)
+        elif order_book_type == 'columnar':
+            return ColumnarOrderBook(snapshot, depth)
         return OrderBook(snapshot, depth)
 
     def indexed_order_book(self, snapshot={}, depth=None):
+        # order ids do not fit float64 columns, so the columnar mode keeps the sorted per-order book here
+        if self.safe_string(self.options, 'orderBookType') in ['sorted', 'columnar']:
+            return SortedIndexedOrderBook(snapshot, depth)
         return IndexedOrderBook(snapshot, depth)
 
     def counted_order_book(self, snapshot={}, depth=None):
+        order_book_type = self.safe_string(self.options, 'orderBookType')
+        if order_book_type == 'sorted':
+            return SortedCountedOrderBook(snapshot, depth)
+        elif order_book_type == 'columnar':
+            return ColumnarCountedOrderBook(snapshot, depth)
         return CountedOrderBook(snapshot, depth)
 
     def client(self, url):
@@ -370,17 +834,30 @@ class Exchange(BaseExchange):
             on_connected = self.on_connected
             # decide client type here: aiohttp ws / websockets / signalr / socketio
             ws_options = self.safe_value(self.options, 'ws', {})
+            ws_rate_limit_group = self.safe_string(ws_options, 'rateLimitGroup')
+            if ws_rate_limit_group is not None:
+                throttle = Throttler.shared(ws_rate_limit_group, self.tokenBucket, self.asyncio_loop)
+            else:
+                throttle = Throttler(self.tokenBucket, self.asyncio_loop)
             options = self.extend(self.streaming, {
                 'log': getattr(self, 'log'),
                 'ping': getattr(self, 'ping', None),
                 'verbose': self.verbose,
-                'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
+                'throttle': throttle,
                 'asyncio_loop': self.asyncio_loop,
+                'route_symbols': self.route_symbols,
             }, ws_options)
             self.clients[url] = FastClient(url, on_message, on_error, on_close, on_connected, options)
             self.clients[url].proxy = self.get_ws_proxy()
         return self.clients[url]
 
+    def route_symbols(self, market_id):
+        # the symbols of a raw market id for Client.route(), None until the markets are loaded
+        markets = self.markets_by_id.get(market_id) if self.markets_by_id else None
+        if markets is None:
+            return None
+        return [market['symbol'] for market in markets]
+
     def get_ws_proxy(self):
         httpProxy, httpsProxy, socksProxy = self.check_ws_proxy_settings()
         if httpProxy:
@@ -407,6 +884,7 @@ class Exchange(BaseExchange):
         client = self.client(url)
 
         future = Future.race([client.future(message_hash) for message_hash in message_hashes])
+        self.attach_stream(client, message_hashes)
 
         missing_subscriptions = []
         if subscribe_hashes is not None:
@@ -444,6 +922,7 @@ class Exchange(BaseExchange):
         self.open()
         backoff_delay = 0
         client = self.client(url)
+        self.attach_stream(client, [message_hash])
         if subscribe_hash is None and message_hash in client.futures:
             return client.futures[message_hash]
         future = client.future(message_hash)
@@ -477,6 +956,86 @@ class Exchange(BaseExchange):
 
         return future
 
+    def attach_stream(self, client, message_hashes):
+        subscriber = stream_subscriber.get()
+        if subscriber is not None:
+            # a watch_* method may watch auxiliary hashes first, the values come from the last subscription it makes
+            subscriber.detach()
+            subscriber.attach(client, message_hashes)
+
+    def stream_updates(self, method, *args, maxSize=None, overflow=None):
+        """
+        async iterator over every value a watch_* method resolves, without calling it again for each update
+        :param str method: the name of the watch_* method, like 'watch_trades'
+        :param args: the arguments of the watch_* method
+        :param int [maxSize]: how many values are buffered for a slow consumer, defaults to options['ws']['stream']['maxSize']
+        :param str [overflow]: 'dropOldest', 'coalesce' or 'block' once the buffer is full, defaults to options['ws']['stream']['overflow']
+        :returns Stream: the caches are streamed as lists of the entries added since the previous value filtered like the watch_* method filters them, order books as copies of their limited depth, other values as they are resolved
+        """
+        options = self.safe_dict(self.safe_dict(self.options, 'ws', {}), 'stream', {})
+        if maxSize is None:
+            maxSize = self.safe_integer(options, 'maxSize', 1000)
+        if overflow is None:
+            overflow = self.safe_string(options, 'overflow', 'dropOldest')
+        return Stream(self, method, args, Subscriber(maxSize, overflow, self.stream_processor(method, args)))
+
+    def stream_processor(self, method, args):
+        # the post-processing the watch_* methods apply to their result, streams apply it to every value they queue
+        def argument(index):
+            return args[index] if len(args) > index else None
+
+        if method == 'watch_order_book' or method == 'watch_order_book_for_symbols':
+            return self.stream_order_book_snapshot
+        if method == 'watch_ohlcv':
+            since = argument(2)
+            limit = argument(3)
+            return lambda values: self.filter_by_since_limit(values, since, limit, 0, True) if isinstance(values, list) else values
+        if method == 'watch_trades' or method == 'watch_orders' or method == 'watch_my_trades':
+            symbol = argument(0)
+            since = argument(1)
+            limit = argument(2)
+            return lambda values: self.filter_by_symbol_since_limit(values, symbol, since, limit, True) if isinstance(values, list) else values
+        return None
+
+    def stream_order_book_snapshot(self, orderbook):
+        # the book is resolved as the same mutable object, every queued value is a copy of its limited depth
+        if not isinstance(orderbook, OrderBook):
+            return orderbook
+        orderbook.limit()
+        return self.extend(orderbook, {
+            'asks': [list(level) for level in orderbook['asks']],
+            'bids': [list(level) for level in orderbook['bids']],
+        })
+
+    def subscribe_stream(self, subscriber, method, args):
+        # the task copies the current context, so the watch() calls it makes see the subscriber
+        token = stream_subscriber.set(subscriber)
+        try:
+            return asyncio.ensure_future(getattr(self, method)(*args))
+        finally:
+            stream_subscriber.reset(token)
+
+    def stream_ticker(self, symbol: str, params={}, **config):
+        return self.stream_updates('watch_ticker', symbol, params, **config)
+
+    def stream_trades(self, symbol: str, since: Int = None, limit: Int = None, params={}, **config):
+        return self.stream_updates('watch_trades', symbol, since, limit, params, **config)
+
+    def stream_order_book(self, symbol: str, limit: Int = None, params={}, **config):
+        return self.stream_updates('watch_order_book', symbol, limit, params, **config)
+
+    def stream_ohlcv(self, symbol: str, timeframe='1m', since: Int = None, limit: Int = None, params={}, **config):
+        return self.stream_updates('watch_ohlcv', symbol, timeframe, since, limit, params, **config)
+
+    def stream_orders(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}, **config):
+        return self.stream_updates('watch_orders', symbol, since, limit, params, **config)
+
+    def stream_my_trades(self, symbol: Str = None, since: Int = None, limit: Int = None, params={}, **config):
+        return self.stream_updates('watch_my_trades', symbol, since, limit, params, **config)
+
+    def stream_balance(self, params={}, **config):
+        return self.stream_updates('watch_balance', params, **config)
+
     def on_connected(self, client, message=None):
         # for user hooks
         # print('Connected to', client.url)
@@ -855,7 +1414,7 @@ class Exchange(BaseExchange):
                 self.options['limitsLoaded'] = self.milliseconds()
         return self.markets
 
-    async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
+    async def fetch2_transpiled(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
             await self.throttle(cost)
@@ -1809,71 +2368,6 @@ class Exchange(BaseExchange):
         else:
             raise NotSupported(self.id + ' fetchTransactions() is not supported yet')
 
-    async def fetch_paginated_call_dynamic(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, params={}, maxEntriesPerRequest: Int = None):
-        maxCalls = None
-        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
-        maxRetries = None
-        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
-        paginationDirection = None
-        paginationDirection, params = self.handle_option_and_params(params, method, 'paginationDirection', 'backward')
-        paginationTimestamp = None
-        calls = 0
-        result = []
-        errors = 0
-        until = self.safe_integer_2(params, 'untill', 'till')  # do not omit it from params here
-        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
-        if (paginationDirection == 'forward'):
-            if since is None:
-                raise ArgumentsRequired(self.id + ' pagination requires a since argument when paginationDirection set to forward')
-            paginationTimestamp = since
-        while((calls < maxCalls)):
-            calls += 1
-            try:
-                if paginationDirection == 'backward':
-                    # do it backwards, starting from the last
-                    # UNTIL filtering is required in order to work
-                    if paginationTimestamp is not None:
-                        params['until'] = paginationTimestamp - 1
-                    response = await getattr(self, method)(symbol, None, maxEntriesPerRequest, params)
-                    responseLength = len(response)
-                    if self.verbose:
-                        backwardMessage = 'Dynamic pagination call ' + self.number_to_string(calls) + ' method ' + method + ' response length ' + self.number_to_string(responseLength)
-                        if paginationTimestamp is not None:
-                            backwardMessage += ' timestamp ' + self.number_to_string(paginationTimestamp)
-                        self.log(backwardMessage)
-                    if responseLength == 0:
-                        break
-                    errors = 0
-                    result = self.array_concat(result, response)
-                    firstElement = self.safe_value(response, 0)
-                    paginationTimestamp = self.safe_integer_2(firstElement, 'timestamp', 0)
-                    if (since is not None) and (paginationTimestamp <= since):
-                        break
-                else:
-                    # do it forwards, starting from the since
-                    response = await getattr(self, method)(symbol, paginationTimestamp, maxEntriesPerRequest, params)
-                    responseLength = len(response)
-                    if self.verbose:
-                        forwardMessage = 'Dynamic pagination call ' + self.number_to_string(calls) + ' method ' + method + ' response length ' + self.number_to_string(responseLength)
-                        if paginationTimestamp is not None:
-                            forwardMessage += ' timestamp ' + self.number_to_string(paginationTimestamp)
-                        self.log(forwardMessage)
-                    if responseLength == 0:
-                        break
-                    errors = 0
-                    result = self.array_concat(result, response)
-                    last = self.safe_value(response, responseLength - 1)
-                    paginationTimestamp = self.safe_integer(last, 'timestamp') + 1
-                    if (until is not None) and (paginationTimestamp >= until):
-                        break
-            except Exception as e:
-                errors += 1
-                if errors > maxRetries:
-                    raise e
-        uniqueResults = self.remove_repeated_elements_from_array(result)
-        key = 0 if (method == 'fetchOHLCV') else 'timestamp'
-        return self.filter_by_since_limit(uniqueResults, since, limit, key)
-
     async def safe_deterministic_call(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, timeframe: Str = None, params={}):
         maxRetries = None
         maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
@@ -1892,132 +2386,6 @@ class Exchange(BaseExchange):
                     raise e
         return []
 
-    async def fetch_paginated_call_deterministic(self, method: str, symbol: Str = None, since: Int = None, limit: Int = None, timeframe: Str = None, params={}, maxEntriesPerRequest=None):
-        maxCalls = None
-        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
-        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
-        current = self.milliseconds()
-        tasks = []
-        time = self.parse_timeframe(timeframe) * 1000
-        step = time * maxEntriesPerRequest
-        currentSince = current - (maxCalls * step) - 1
-        if since is not None:
-            currentSince = max(currentSince, since)
-        else:
-            currentSince = max(currentSince, 1241440531000)  # avoid timestamps older than 2009
-        until = self.safe_integer_2(params, 'until', 'till')  # do not omit it here
-        if until is not None:
-            requiredCalls = int(math.ceil((until - since)) / step)
-            if requiredCalls > maxCalls:
-                raise BadRequest(self.id + ' the number of required calls is greater than the max number of calls allowed, either increase the paginationCalls or decrease the since-until gap. Current paginationCalls limit is ' + str(maxCalls) + ' required calls is ' + str(requiredCalls))
-        for i in range(0, maxCalls):
-            if (until is not None) and (currentSince >= until):
-                break
-            if currentSince >= current:
-                break
-            tasks.append(self.safe_deterministic_call(method, symbol, currentSince, maxEntriesPerRequest, timeframe, params))
-            currentSince = self.sum(currentSince, step) - 1
-        results = await asyncio.gather(*tasks)
-        result = []
-        for i in range(0, len(results)):
-            result = self.array_concat(result, results[i])
-        uniqueResults = self.remove_repeated_elements_from_array(result)
-        key = 0 if (method == 'fetchOHLCV') else 'timestamp'
-        return self.filter_by_since_limit(uniqueResults, since, limit, key)
-
-    async def fetch_paginated_call_cursor(self, method: str, symbol: Str = None, since=None, limit=None, params={}, cursorReceived=None, cursorSent=None, cursorIncrement=None, maxEntriesPerRequest=None):
-        maxCalls = None
-        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
-        maxRetries = None
-        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
-        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
-        cursorValue = None
-        i = 0
-        errors = 0
-        result = []
-        timeframe = self.safe_string(params, 'timeframe')
-        params = self.omit(params, 'timeframe')  # reading the timeframe from the method arguments to avoid changing the signature
-        while(i < maxCalls):
-            try:
-                if cursorValue is not None:
-                    if cursorIncrement is not None:
-                        cursorValue = self.parse_to_int(cursorValue) + cursorIncrement
-                    params[cursorSent] = cursorValue
-                response = None
-                if method == 'fetchAccounts':
-                    response = await getattr(self, method)(params)
-                elif method == 'getLeverageTiersPaginated' or method == 'fetchPositions':
-                    response = await getattr(self, method)(symbol, params)
-                elif method == 'fetchOpenInterestHistory':
-                    response = await getattr(self, method)(symbol, timeframe, since, maxEntriesPerRequest, params)
-                else:
-                    response = await getattr(self, method)(symbol, since, maxEntriesPerRequest, params)
-                errors = 0
-                responseLength = len(response)
-                if self.verbose:
-                    cursorString = '' if (cursorValue is None) else cursorValue
-                    iteration = (i + 1)
-                    cursorMessage = 'Cursor pagination call ' + str(iteration) + ' method ' + method + ' response length ' + str(responseLength) + ' cursor ' + cursorString
-                    self.log(cursorMessage)
-                if responseLength == 0:
-                    break
-                result = self.array_concat(result, response)
-                last = self.safe_dict(response, responseLength - 1)
-                # cursorValue = self.safe_value(last['info'], cursorReceived)
-                cursorValue = None  # search for the cursor
-                for j in range(0, responseLength):
-                    index = responseLength - j - 1
-                    entry = self.safe_dict(response, index)
-                    info = self.safe_dict(entry, 'info')
-                    cursor = self.safe_value(info, cursorReceived)
-                    if cursor is not None:
-                        cursorValue = cursor
-                        break
-                if cursorValue is None:
-                    break
-                lastTimestamp = self.safe_integer(last, 'timestamp')
-                if lastTimestamp is not None and lastTimestamp < since:
-                    break
-            except Exception as e:
-                errors += 1
-                if errors > maxRetries:
-                    raise e
-            i += 1
-        sorted = self.sort_cursor_paginated_result(result)
-        key = 0 if (method == 'fetchOHLCV') else 'timestamp'
-        return self.filter_by_since_limit(sorted, since, limit, key)
-
-    async def fetch_paginated_call_incremental(self, method: str, symbol: Str = None, since=None, limit=None, params={}, pageKey=None, maxEntriesPerRequest=None):
-        maxCalls = None
-        maxCalls, params = self.handle_option_and_params(params, method, 'paginationCalls', 10)
-        maxRetries = None
-        maxRetries, params = self.handle_option_and_params(params, method, 'maxRetries', 3)
-        maxEntriesPerRequest, params = self.handle_max_entries_per_request_and_params(method, maxEntriesPerRequest, params)
-        i = 0
-        errors = 0
-        result = []
-        while(i < maxCalls):
-            try:
-                params[pageKey] = i + 1
-                response = await getattr(self, method)(symbol, since, maxEntriesPerRequest, params)
-                errors = 0
-                responseLength = len(response)
-                if self.verbose:
-                    iteration = (i + str(1))
-                    incrementalMessage = 'Incremental pagination call ' + iteration + ' method ' + method + ' response length ' + str(responseLength)
-                    self.log(incrementalMessage)
-                if responseLength == 0:
-                    break
-                result = self.array_concat(result, response)
-            except Exception as e:
-                errors += 1
-                if errors > maxRetries:
-                    raise e
-            i += 1
-        sorted = self.sort_cursor_paginated_result(result)
-        key = 0 if (method == 'fetchOHLCV') else 'timestamp'
-        return self.filter_by_since_limit(sorted, since, limit, key)
-
     async def fetch_position_history(self, symbol: str, since: Int = None, limit: Int = None, params={}):
         """
         fetches the history of margin added or reduced from contract isolated positions
@@ -4,6 +4,9 @@ from time import time
 
 
 class Throttler:
+    # named buckets shared by every exchange instance and ws client that attaches to the same key
+    registry = {}
+
     def __init__(self, config, loop=None):
         self.loop = loop
         self.config = {
@@ -18,26 +21,61 @@ class Throttler:
         self.queue = collections.deque()
         self.running = False
 
+    def refill(self, last_timestamp):
+        now = time() * 1000
+        elapsed = now - last_timestamp
+        self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+        return now
+
+    def release(self):
+        # resolve every queued future that the bucket can currently afford in one batch
+        while self.queue and self.config['tokens'] >= 0:
+            future, cost = self.queue.popleft()
+            self.config['tokens'] -= self.config['cost'] if cost is None else cost
+            if not future.done():
+                future.set_result(None)
+
+    def wait_time(self):
+        # seconds until the bucket is back to zero tokens, never shorter than the configured delay
+        missing = -self.config['tokens']
+        refill_rate = self.config['refillRate']
+        if refill_rate <= 0:
+            return self.config['delay']
+        return max(missing / refill_rate / 1000, self.config['delay'])
+
     async def looper(self):
         last_timestamp = time() * 1000
         while self.running:
-            future, cost = self.queue[0]
-            cost = self.config['cost'] if cost is None else cost
-            if self.config['tokens'] >= 0:
-                self.config['tokens'] -= cost
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
-                # context switch
-                await asyncio.sleep(0)
-                if len(self.queue) == 0:
-                    self.running = False
-            else:
-                await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
-                elapsed = now - last_timestamp
-                last_timestamp = now
-                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+            self.release()
+            if len(self.queue) == 0:
+                self.running = False
+                break
+            # sleep exactly once until enough tokens have accumulated instead of polling every delay
+            await asyncio.sleep(self.wait_time())
+            last_timestamp = self.refill(last_timestamp)
+
+    @classmethod
+    def shared(cls, key, config, loop=None):
+        # the bucket is created with the config of the first caller, the config of later callers is ignored
+        throttler = cls.registry.get(key)
+        if throttler is None:
+            throttler = cls(config, loop)
+            cls.registry[key] = throttler
+        elif throttler.loop is None:
+            throttler.loop = loop
+        return throttler
+
+    @classmethod
+    def release_shared(cls, key):
+        return cls.registry.pop(key, None)
+
+    def resync(self, used, limit, cost=1.0):
+        # align the local bucket with the weight the exchange reports as used in its current window
+        # only ever lowers the balance, the local bucket stays authoritative while the remote one has room
+        remaining = (limit - used) * cost
+        if remaining < self.config['tokens']:
+            self.config['tokens'] = remaining
+        return self.config['tokens']
 
     def __call__(self, cost=None):
         future = asyncio.Future()
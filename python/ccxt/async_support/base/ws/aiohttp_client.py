@@ -9,15 +9,20 @@ except ImportError:
 import json
 from asyncio import sleep, ensure_future
 from aiohttp import WSMsgType
-from .functions import milliseconds, iso8601, is_json_encoded_object
+from .functions import milliseconds, iso8601, is_json_encoded_object, json_decoder
 from ccxt.async_support.base.ws.client import Client
-from ccxt.async_support.base.ws.functions import gunzip, inflate
+from ccxt.async_support.base.ws.functions import gunzip_bytes, inflate
 from ccxt import NetworkError, RequestTimeout, ExchangeClosedByUser
 
 
 class AiohttpClient(Client):
 
     proxy = None
+    decode = None  # the json parser resolved from the decoder option
+
+    def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
+        super(AiohttpClient, self).__init__(url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config)
+        self.decode = json_decoder(self.decoder)
 
     def closed(self):
         return (self.connection is None) or self.connection.closed
@@ -29,18 +34,16 @@ class AiohttpClient(Client):
     def handle_text_or_binary_message(self, data):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
-        if isinstance(data, bytes):
-            data = data.decode()
-        # decoded = json.loads(data) if is_json_encoded_object(data) else data
-        decode = None
+        if self.routes is not None and not self.route(data):
+            return
+        # json documents go to the decoder as they arrived, bytes included, other payloads are passed on as text
         if is_json_encoded_object(data):
-            if orjson is None:
-                decode = json.loads(data)
-            else:
-                decode = orjson.loads(data)
+            decoded = self.decode(data)
+        elif isinstance(data, bytes):
+            decoded = data.decode()
         else:
-            decode = data
-        self.on_message_callback(self, decode)
+            decoded = data
+        self.on_message_callback(self, decoded)
 
     def handle_message(self, message):
         # self.log(iso8601(milliseconds()), message)
@@ -49,7 +52,7 @@ class AiohttpClient(Client):
         elif message.type == WSMsgType.BINARY:
             data = message.data
             if self.gunzip:
-                data = gunzip(data)
+                data = gunzip_bytes(data)
             elif self.inflate:
                 data = inflate(data)
             self.handle_text_or_binary_message(data)
@@ -11,6 +11,87 @@ class Delegate:
         return getattr(deque, self.name)
 
 
+class OrderedDeque:
+    # deque-like storage over an insertion-ordered dict, used by the caches that replace entries by key
+    # moving an entry to the end and evicting the oldest one are O(1)
+    # positional reads other than the first and the last go through a list snapshot
+    # that is rebuilt only after the next mutation
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._items = {}
+        self._snapshot = None
+        self._last = None
+
+    def snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = list(self._items.values())
+        return self._snapshot
+
+    def append_by_key(self, key, item):
+        # returns the evicted item, if any
+        self._snapshot = None
+        items = self._items
+        self._last = item
+        if key in items:
+            del items[key]
+            items[key] = item
+            return None
+        evicted = None
+        if self.maxlen is not None and len(items) == self.maxlen:
+            evicted = items.pop(next(iter(items)))
+        items[key] = item
+        return evicted
+
+    def popleft(self):
+        self._snapshot = None
+        item = self._items.pop(next(iter(self._items)))
+        if not self._items:
+            self._last = None
+        return item
+
+    def pop(self):
+        self._snapshot = None
+        self._last = None
+        return self._items.popitem()[1]
+
+    def clear(self):
+        self._snapshot = None
+        self._last = None
+        self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __reversed__(self):
+        return reversed(self.snapshot())
+
+    def __contains__(self, item):
+        return item in self.snapshot()
+
+    def __getitem__(self, index):
+        if self._snapshot is None and self._items:
+            if index == 0:
+                return next(iter(self._items.values()))
+            elif index == -1 and self._last is not None:
+                return self._last
+        return self.snapshot()[index]
+
+    def __setitem__(self, index, item):
+        key = list(self._items.keys())[index]
+        self._snapshot = None
+        self._last = None
+        self._items[key] = item
+
+    def __delitem__(self, index):
+        key = list(self._items.keys())[index]
+        self._snapshot = None
+        self._last = None
+        del self._items[key]
+
+
 class BaseCache(list):
     # implicitly called magic methods don't invoke __getattribute__
     # https://docs.python.org/3/reference/datamodel.html#special-method-lookup
@@ -29,6 +110,8 @@ class BaseCache(list):
         super(BaseCache, self).__init__()
         self.max_size = max_size
         self._deque = collections.deque([], max_size)
+        # counts the appends, streams use it to find the entries added since they last looked
+        self.revision = 0
 
     def __eq__(self, other):
         return list(self) == other
@@ -84,6 +167,7 @@ class ArrayCache(BaseCache):
             return new_updates_value
 
     def append(self, item):
+        self.revision += 1
         self._deque.append(item)
         if self._clear_all_updates:
             self._clear_all_updates = False
@@ -112,6 +196,7 @@ class ArrayCacheByTimestamp(BaseCache):
         return min(self._new_updates, limit)
 
     def append(self, item):
+        self.revision += 1
         if item[0] in self.hashmap:
             reference = self.hashmap[item[0]]
             if reference != item:
@@ -134,26 +219,21 @@ class ArrayCacheBySymbolById(ArrayCache):
         super(ArrayCacheBySymbolById, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        self._deque = OrderedDeque(max_size)
 
     def append(self, item):
+        self.revision += 1
         by_id = self.hashmap.setdefault(item['symbol'], {})
         if item['id'] in by_id:
             reference = by_id[item['id']]
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['id'])
-            del self._deque[index]
-            del self._index[index]
         else:
             by_id[item['id']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
+        delete_item = self._deque.append_by_key((item['symbol'], item['id']), item)
+        if delete_item is not None:
             del self.hashmap[delete_item['symbol']][delete_item['id']]
-        self._deque.append(item)
-        self._index.append(item['id'])
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -176,26 +256,21 @@ class ArrayCacheBySymbolBySide(ArrayCache):
         super(ArrayCacheBySymbolBySide, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque([], max_size)
+        self._deque = OrderedDeque(max_size)
 
     def append(self, item):
+        self.revision += 1
         by_side = self.hashmap.setdefault(item['symbol'], {})
         if item['side'] in by_side:
             reference = by_side[item['side']]
             if reference != item:
                 reference.update(item)
             item = reference
-            index = self._index.index(item['symbol'] + item['side'])
-            del self._deque[index]
-            del self._index[index]
         else:
             by_side[item['side']] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
+        delete_item = self._deque.append_by_key((item['symbol'], item['side']), item)
+        if delete_item is not None:
             del self.hashmap[delete_item['symbol']][delete_item['side']]
-        self._deque.append(item)
-        self._index.append(item['symbol'] + item['side'])
         if self._clear_all_updates:
             self._clear_all_updates = False
             self._clear_updates_by_symbol.clear()
@@ -1,11 +1,21 @@
 # -*- coding: utf-8 -*-
 
 from asyncio import sleep, ensure_future, wait_for, TimeoutError
+from functools import lru_cache
+import re
 from .functions import milliseconds, iso8601, deep_extend
 from ccxt import NetworkError, RequestTimeout, NotSupported
 from ccxt.async_support.base.ws.future import Future
 from collections import deque
 
+
+@lru_cache(maxsize=None)
+def route_pattern(key, binary):
+    # matches the first string member named key, e.g. "e":"trade"
+    pattern = '"' + re.escape(key) + '"\\s*:\\s*"([^"\\\\]*)"'
+    return re.compile(pattern.encode('utf-8') if binary else pattern)
+
+
 class Client(object):
 
     url = None
@@ -13,6 +23,7 @@ class Client(object):
     futures = {}
     options = {}  # ws-specific options
     subscriptions = {}
+    streams = {}  # message_hash => stream subscribers
     rejections = {}
     message_queue = {}
     useMessageQueue = False
@@ -35,17 +46,25 @@ class Client(object):
     verbose = False  # verbose output
     gunzip = False
     inflate = False
+    decoder = None  # 'orjson', 'msgspec', 'json' or a callable, defaults to orjson when installed
     throttle = None
     connecting = False
     asyncio_loop = None
     ping_looper = None
     receive_looper = None
+    backpressure = None  # resolves when the blocking stream subscribers have room again
+    routes = None  # pre-routing of raw frames, see route()
+    route_holders = {}  # (channel prefix, market id) => a hash that subscribed to it
+    route_symbols = None  # market id => its symbols or None when unknown, see route()
+    dropped_frames = 0
 
     def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
         defaults = {
             'url': url,
             'futures': {},
             'subscriptions': {},
+            'streams': {},
+            'route_holders': {},
             'rejections': {},
             'on_message_callback': on_message_callback,
             'on_error_callback': on_error_callback,
@@ -97,10 +116,83 @@ class Client(object):
                 future = self.futures[message_hash]
                 future.resolve(result)
                 del self.futures[message_hash]
+        if message_hash in self.streams:
+            for subscriber in self.streams[message_hash]:
+                drained = subscriber.push(result)
+                if drained is not None:
+                    self.pause_until(drained)
         return result
 
+    def route(self, data):
+        # reads the routing member of a raw frame without parsing it and tells whether the frame is worth decoding
+        # routes = {'key': 'e', 'id': 's', 'window': 256, 'separator': None, 'drop': [routing values], 'channels': {routing value: hash prefix}}
+        # with a separator only the part of the value before it is the routing value, e.g. "topic":"publicTrade.BTCUSDT"
+        # the market id is read from the id member or else from the last part of a separated value, e.g. BTCUSDT above
+        # dropped values are heartbeats and acks nobody reads, a channel is decoded only while a future,
+        # a subscription or a stream hash is its prefix followed by a symbol of that market id, anything else is always decoded
+        routes = self.routes
+        key = routes.get('key')
+        if key is None:
+            return True
+        window = routes.get('window', 256)
+        binary = not isinstance(data, str)
+        head = data[:window] if window else data
+        match = route_pattern(key, binary).search(head)
+        if match is None:
+            return True
+        value = match.group(1)
+        if binary:
+            value = value.decode('utf-8')
+        market_id = None
+        separator = routes.get('separator')
+        if separator is not None and separator in value:
+            value, market_id = value.split(separator, 1)
+            market_id = market_id.rsplit(separator, 1)[-1]
+        if value in routes.get('drop', ()):
+            self.dropped_frames += 1
+            return False
+        prefix = routes.get('channels', {}).get(value)
+        if prefix is None:
+            return True
+        id_key = routes.get('id')
+        if id_key is not None:
+            match = route_pattern(id_key, binary).search(head)
+            if match is not None:
+                market_id = match.group(1).decode('utf-8') if binary else match.group(1)
+        # the hash that matched last time usually still holds the channel of that market
+        holder = self.route_holders.get((prefix, market_id))
+        if holder is not None and (holder in self.futures or holder in self.subscriptions or holder in self.streams):
+            return True
+        symbols = None
+        if market_id is not None and self.route_symbols is not None:
+            symbols = self.route_symbols(market_id)
+        for hashes in (self.futures, self.subscriptions, self.streams):
+            for message_hash in hashes:
+                if isinstance(message_hash, str) and message_hash.startswith(prefix) and self.routed_to(message_hash, prefix, symbols):
+                    self.route_holders[(prefix, market_id)] = message_hash
+                    return True
+        self.dropped_frames += 1
+        return False
+
+    def routed_to(self, message_hash, prefix, symbols):
+        # unknown market ids keep the whole channel wanted, a symbol is followed by the end of the hash or by ::, e.g. ohlcv::BTC/USDT::1m
+        if symbols is None:
+            return True
+        for symbol in symbols:
+            routed = prefix + symbol
+            if message_hash == routed or message_hash.startswith(routed + '::'):
+                return True
+        return False
+
+    def pause_until(self, drained):
+        # stop reading from the socket until a blocking stream subscriber has consumed its backlog
+        if self.backpressure is None or self.backpressure.done():
+            self.backpressure = drained
+
     def reject(self, result, message_hash=None):
         if message_hash:
+            for subscriber in self.streams.get(message_hash, []):
+                subscriber.fail(result)
             if message_hash in self.futures:
                 future = self.futures[message_hash]
                 future.reject(result)
@@ -111,6 +203,10 @@ class Client(object):
             message_hashes = list(self.futures.keys())
             for message_hash in message_hashes:
                 self.reject(result, message_hash)
+            for message_hash in list(self.streams.keys()):
+                if message_hash not in message_hashes:
+                    for subscriber in self.streams[message_hash]:
+                        subscriber.fail(result)
         return result
 
     async def receive_loop(self):
@@ -121,6 +217,9 @@ class Client(object):
                 message = await self.receive()
                 # self.log(iso8601(milliseconds()), 'received', message)
                 self.handle_message(message)
+                if self.backpressure is not None:
+                    await self.backpressure
+                    self.backpressure = None
             except Exception as e:
                 error = NetworkError(str(e))
                 if self.verbose:
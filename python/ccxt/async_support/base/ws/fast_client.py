@@ -90,6 +90,19 @@ class FastClient(AiohttpClient):
         # return a future so super class won't complain
         return asyncio.sleep(0)
 
+    def pause_until(self, drained):
+        # handle_message runs from call_soon here, so the transport stops reading instead of the receive loop
+        if self.transport is None:
+            return super(FastClient, self).pause_until(drained)
+        if self.backpressure is None or self.backpressure.done():
+            self.backpressure = drained
+            self.transport.pause_reading()
+
+            def resume(future):
+                if self.transport is not None and not self.transport.is_closing():
+                    self.transport.resume_reading()
+            drained.add_done_callback(resume)
+
     def reset(self, error):
         super(FastClient, self).reset(error)
         self.stack.clear()
@@ -2,10 +2,22 @@
 
 from zlib import decompress, MAX_WBITS
 from base64 import b64decode
-from gzip import GzipFile
-from io import BytesIO
+import json
 import time
 import datetime
+from ccxt.base.errors import NotSupported
+
+orjson = None
+try:
+    import orjson as orjson
+except ImportError:
+    pass
+
+msgspec = None
+try:
+    import msgspec as msgspec
+except ImportError:
+    pass
 
 
 def inflate(data):
@@ -17,7 +29,31 @@ def inflate64(data):
 
 
 def gunzip(data):
-    return GzipFile('', 'rb', 9, BytesIO(data)).read().decode('utf-8')
+    return gunzip_bytes(data).decode('utf-8')
+
+
+def gunzip_bytes(data):
+    # every message is a complete gzip member, zlib reads the header and the trailer itself
+    return decompress(data, 16 + MAX_WBITS)
+
+
+def json_decoder(decoder=None):
+    # returns a callable that parses a json document from str or bytes
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        decoder = 'json' if orjson is None else 'orjson'
+    if decoder == 'orjson':
+        if orjson is None:
+            raise NotSupported('the orjson decoder requires the orjson package, pip install orjson')
+        return orjson.loads
+    if decoder == 'msgspec':
+        if msgspec is None:
+            raise NotSupported('the msgspec decoder requires the msgspec package, pip install msgspec')
+        return msgspec.json.Decoder().decode
+    if decoder == 'json':
+        return json.loads
+    raise NotSupported('unknown websocket decoder ' + str(decoder) + ', use orjson, msgspec, json or a callable')
 
 
 #  Tmp : added methods below to avoid circular imports between exchange.py and aiohttp.py
@@ -41,6 +77,9 @@ def iso8601(timestamp=None):
 
 
 def is_json_encoded_object(input):
+    if isinstance(input, (bytes, bytearray)):
+        # 0x7b is {, 0x5b is [
+        return (len(input) >= 2) and ((input[0] == 0x7b) or (input[0] == 0x5b))
     return (isinstance(input, str) and
             (len(input) >= 2) and
             ((input[0] == '{') or (input[0] == '[')))
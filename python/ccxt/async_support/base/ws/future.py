@@ -26,44 +26,33 @@ class Future(asyncio.Future):
 
     @classmethod
     def race(cls, futures):
+        # resolves with the first member to complete, the done-callbacks are detached from the others afterwards
+        if not futures:
+            # like asyncio.wait(), an empty race would never complete
+            raise ValueError('Set of Tasks/Futures is empty.')
         future = Future()
-        for f in futures:
-            f.is_race_future = True
-        coro = asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
-        task = asyncio.create_task(coro)
 
-        def callback(done):
-            try:
-                complete, pending = done.result()
-                # check for exceptions
-                for i, f in enumerate(complete):
-                    try:
-                        f.result()
-                    except ExchangeClosedByUser as e:
-                        if len(pending) == 0 and i == len(complete) - 1:
-                            future.reject(e)
-                        # wait for all the sub promises to be reject before rejecting future
-                        continue
-                    except asyncio.CancelledError as e:
-                        continue
-                    except Exception as e:
-                        future.reject(e)
-                        return
-                # no exceptions return first result
-                futures_list = list(complete)
-
-                are_all_canceled = all([f.cancelled() for f in futures_list])
-                if are_all_canceled:
+        def on_member_done(member):
+            if member.cancelled():
+                if not future.done():
+                    # the members are cancelled silently when the connection is closed by the user
                     future.reject(ExchangeClosedByUser('Connection closed by the user'))
-                    return
-
-                first = futures_list[0]
-
-                first_result = first.result()
-                future.resolve(first_result)
-            except asyncio.CancelledError as e:
-                future.reject(e)
-            except Exception as e:
-                future.reject(e)
-        task.add_done_callback(callback)
+                return
+            # retrieving the error also keeps asyncio from reporting the members that lost the race
+            error = member.exception()
+            if future.done():
+                return
+            if error is not None:
+                future.reject(error)
+            else:
+                future.resolve(member.result())
+
+        def detach(_):
+            for member in futures:
+                member.remove_done_callback(on_member_done)
+
+        for member in futures:
+            member.is_race_future = True
+            member.add_done_callback(on_member_done)
+        future.add_done_callback(detach)
         return future
@@ -76,3 +76,65 @@ class IndexedOrderBook(OrderBook):
             'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
         })
         super(IndexedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# same books backed by sorted blocks, see order_book_side.SortedOrderBookSide
+
+
+class SortedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedOrderBook, self).__init__(copy, depth)
+
+
+class SortedCountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedCountedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedCountedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedCountedOrderBook, self).__init__(copy, depth)
+
+
+class SortedIndexedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedIndexedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.SortedIndexedBids(snapshot.get('bids', []), depth),
+        })
+        super(SortedIndexedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# numpy-backed books, see order_book_side.ColumnarOrderBookSide
+
+
+class ColumnarOrderBook(OrderBook):
+    asks_class = order_book_side.ColumnarAsks
+    bids_class = order_book_side.ColumnarBids
+
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': self.asks_class(snapshot.get('asks', []), depth),
+            'bids': self.bids_class(snapshot.get('bids', []), depth),
+        })
+        super(ColumnarOrderBook, self).__init__(copy, depth)
+
+    def best_bid(self):
+        return self['bids'].best()
+
+    def best_ask(self):
+        return self['asks'].best()
+
+    def top(self, n=None):
+        return {
+            'bids': self['bids'].top(n),
+            'asks': self['asks'].top(n),
+        }
+
+
+class ColumnarCountedOrderBook(ColumnarOrderBook):
+    asks_class = order_book_side.ColumnarCountedAsks
+    bids_class = order_book_side.ColumnarCountedBids
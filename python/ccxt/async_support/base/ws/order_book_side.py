@@ -2,6 +2,13 @@
 
 import sys
 import bisect
+import itertools
+from ccxt.base.errors import NotSupported
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -172,3 +179,458 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+
+# -----------------------------------------------------------------------------
+# keeps the levels in a list of sorted blocks instead of one flat list
+# inserts and deletes touch a single block, so a delta costs O(log n) to locate
+# and O(load) to shift instead of O(n) bisect and index bookkeeping on deep books
+# reads walk the blocks, the inherited flat list only mirrors the top mirror_depth levels
+# for consumers that bypass the overridden accessors (C extensions like orjson)
+# the mirror shares the level lists with the blocks, limit() rewrites it from the first level that moved
+
+
+class SortedOrderBookSide(OrderBookSide):
+    load = 256  # blocks are split when they grow past twice this size and merged when they shrink below half of it
+    mirror_depth = 100
+
+    def __init__(self, deltas=[], depth=None):
+        self._keys = []  # sorted blocks of sort keys
+        self._values = []  # parallel blocks of deltas
+        self._maxes = []  # last sort key of every block
+        self._length = 0
+        self._mirrored = 0  # leading levels of the flat list that are up to date
+        super(SortedOrderBookSide, self).__init__(deltas, depth)
+
+    def sort_key(self, delta):
+        return -delta[0] if self.side else delta[0]
+
+    def locate(self, key):
+        block = bisect.bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            return block, 0
+        return block, bisect.bisect_left(self._keys[block], key)
+
+    def find(self, key):
+        block, index = self.locate(key)
+        if block < len(self._maxes) and self._keys[block][index] == key:
+            return block, index
+        return None, None
+
+    def changed(self, block, index):
+        # a level was inserted, deleted or replaced, the mirror is stale from its position on
+        values = self._values
+        for i in range(0, block):
+            if index >= self._mirrored:
+                return
+            index += len(values[i])
+        if index < self._mirrored:
+            self._mirrored = index
+
+    def insert_at(self, block, index, key, delta):
+        if not self._maxes:
+            self._keys.append([key])
+            self._values.append([delta])
+            self._maxes.append(key)
+            self._mirrored = 0
+        else:
+            if block == len(self._maxes):
+                block = block - 1
+                index = len(self._keys[block])
+            self.changed(block, index)
+            keys = self._keys[block]
+            keys.insert(index, key)
+            self._values[block].insert(index, delta)
+            self._maxes[block] = keys[-1]
+            if len(keys) > 2 * self.load:
+                self.split(block)
+        self._length += 1
+
+    def split(self, block):
+        keys = self._keys[block]
+        values = self._values[block]
+        self._keys[block:block + 1] = [keys[:self.load], keys[self.load:]]
+        self._values[block:block + 1] = [values[:self.load], values[self.load:]]
+        self._maxes[block:block + 1] = [keys[self.load - 1], keys[-1]]
+
+    def merge(self, block):
+        # joins an undersized block with its neighbour, deletes would otherwise leave many tiny blocks behind
+        if block == len(self._maxes) - 1:
+            block = block - 1
+        keys = self._keys[block] + self._keys[block + 1]
+        self._keys[block:block + 2] = [keys]
+        self._values[block:block + 2] = [self._values[block] + self._values[block + 1]]
+        self._maxes[block:block + 2] = [keys[-1]]
+        if len(keys) > 2 * self.load:
+            self.split(block)
+
+    def delete_at(self, block, index):
+        self.changed(block, index)
+        keys = self._keys[block]
+        del keys[index]
+        del self._values[block][index]
+        if len(keys) < self.load // 2 and len(self._maxes) > 1:
+            self.merge(block)
+        elif keys:
+            self._maxes[block] = keys[-1]
+        else:
+            del self._keys[block]
+            del self._values[block]
+            del self._maxes[block]
+        self._length -= 1
+
+    def storeArray(self, delta):
+        size = delta[1]
+        key = -delta[0] if self.side else delta[0]
+        # locate() inlined, this runs once per delta
+        maxes = self._maxes
+        block = bisect.bisect_left(maxes, key)
+        if block < len(maxes):
+            keys = self._keys[block]
+            index = bisect.bisect_left(keys, key)
+            found = keys[index] == key
+        else:
+            index = 0
+            found = False
+        if size:
+            if found:
+                self._values[block][index][1] = size
+            else:
+                self.insert_at(block, index, key, delta)
+        elif found:
+            self.delete_at(block, index)
+
+    def limit(self):
+        while self._length > self._depth:
+            last = len(self._maxes) - 1
+            self.remove_index(self._values[last][-1])
+            self.delete_at(last, len(self._keys[last]) - 1)
+        mirrored = min(self._length, self.mirror_depth)
+        if self._mirrored < mirrored or list.__len__(self) != mirrored:
+            start = min(self._mirrored, mirrored)
+            list.__setitem__(self, slice(start, None), list(itertools.islice(self.levels(), start, mirrored)))
+            self._mirrored = mirrored
+
+    def clear(self):
+        self._keys = []
+        self._values = []
+        self._maxes = []
+        self._length = 0
+        self._mirrored = 0
+        super(SortedOrderBookSide, self).clear()
+
+    def levels(self):
+        return itertools.chain.from_iterable(self._values)
+
+    def __len__(self):
+        return min(self._length, self._n)
+
+    def __iter__(self):
+        return itertools.islice(self.levels(), len(self))
+
+    def __getitem__(self, item):
+        # reads go to the blocks, the flat list is only refreshed by limit()
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step < 0:
+                return [self[i] for i in range(start, stop, step)]
+            return list(itertools.islice(self.levels(), start, max(start, stop), step))
+        length = len(self)
+        if item < 0:
+            item += length
+        if item < 0 or item >= length:
+            raise IndexError('list index out of range')
+        for values in self._values:
+            if item < len(values):
+                return values[item]
+            item -= len(values)
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == list(other)
+        return False
+
+    def __repr__(self):
+        return str(list(self))
+
+# -----------------------------------------------------------------------------
+# overwrites absolute volumes at price levels
+# or deletes price levels based on order counts (3rd value in a bidask delta)
+
+
+class SortedCountedOrderBookSide(SortedOrderBookSide):
+    def storeArray(self, delta):
+        size = delta[1]
+        count = delta[2]
+        key = self.sort_key(delta)
+        block, index = self.locate(key)
+        found = block < len(self._maxes) and self._keys[block][index] == key
+        if size and count:
+            if found:
+                level = self._values[block][index]
+                level[1] = size
+                level[2] = count
+            else:
+                self.insert_at(block, index, key, delta)
+        elif found:
+            self.delete_at(block, index)
+
+    def store(self, price, size, count):
+        self.storeArray([price, size, count])
+
+# -----------------------------------------------------------------------------
+# indexed by order ids (3rd value in a bidask delta)
+# levels are sorted by (price, order id), the hashmap remembers the price of every order id
+
+
+class SortedIndexedOrderBookSide(SortedOrderBookSide):
+    def __init__(self, deltas=[], depth=None):
+        self._hashmap = {}
+        super(SortedIndexedOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        price = delta[0]
+        if price is not None:
+            index_price = -price if self.side else price
+        else:
+            index_price = None
+        size = delta[1]
+        order_id = delta[2]
+        if size:
+            if order_id in self._hashmap:
+                old_price = self._hashmap[order_id]
+                index_price = index_price or old_price
+                # in case the price is not defined
+                delta[0] = abs(index_price)
+                block, index = self.find((old_price, order_id))
+                if index_price == old_price:
+                    # just overwrite the old level
+                    self._values[block][index] = delta
+                    self.changed(block, index)
+                    return
+                # remove old price level
+                self.delete_at(block, index)
+            # insert new price level
+            self._hashmap[order_id] = index_price
+            key = (index_price, order_id)
+            block, index = self.locate(key)
+            self.insert_at(block, index, key, delta)
+        elif order_id in self._hashmap:
+            block, index = self.find((self._hashmap[order_id], order_id))
+            self.delete_at(block, index)
+            del self._hashmap[order_id]
+
+    def remove_index(self, order):
+        order_id = order[2]
+        if order_id in self._hashmap:
+            del self._hashmap[order_id]
+
+    def clear(self):
+        self._hashmap = {}
+        super(SortedIndexedOrderBookSide, self).clear()
+
+    def store(self, price, size, order_id):
+        self.storeArray([price, size, order_id])
+
+
+class SortedAsks(SortedOrderBookSide): side = False                         # noqa
+class SortedBids(SortedOrderBookSide): side = True                          # noqa
+class SortedCountedAsks(SortedCountedOrderBookSide): side = False           # noqa
+class SortedCountedBids(SortedCountedOrderBookSide): side = True            # noqa
+class SortedIndexedAsks(SortedIndexedOrderBookSide): side = False           # noqa
+class SortedIndexedBids(SortedIndexedOrderBookSide): side = True            # noqa
+
+# -----------------------------------------------------------------------------
+# columnar side for the numpy order book mode
+# prices and sizes live in preallocated float64 arrays sorted by price, rows are [price, size(, count)]
+# store() only stages the delta, staged deltas are applied on the next read, one by one for a few of them
+# and in one vectorised step from vectorise_from deltas on, where the fixed cost of the numpy calls pays off
+# reads return plain lists for compatibility, top() and best() return zero-copy views into the arrays
+# a size or a count of 0 or None deletes the level
+# the inherited flat list only mirrors the top mirror_depth levels for consumers that bypass the overridden accessors (C extensions like orjson)
+# limit() rewrites the mirrored rows from the first one that changed, changes below the mirrored levels cost nothing
+
+
+class ColumnarOrderBookSide(OrderBookSide):
+    columns = 2
+    capacity = 1024
+    mirror_depth = 100
+    vectorise_from = 32
+
+    def __init__(self, deltas=[], depth=None):
+        if np is None:
+            raise NotSupported('the columnar order book requires numpy, install it with "pip install numpy"')
+        self._keys = np.empty(self.capacity, dtype=np.float64)
+        self._data = np.empty((self.capacity, self.columns), dtype=np.float64)
+        self._count = 0
+        self._pending = []
+        self._mirrored = 0  # the number of leading rows of the inherited list that are up to date
+        super(ColumnarOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        self._pending.append(delta[:self.columns])
+
+    def store(self, price, size):
+        self._pending.append((price, size))
+
+    def is_live(self, batch):
+        # None is staged as nan
+        sizes = batch[:, 1]
+        return (sizes != 0) & ~np.isnan(sizes)
+
+    def is_live_delta(self, delta):
+        size = delta[1]
+        return bool(size) and size == size
+
+    def reserve(self, count):
+        if count > len(self._keys):
+            capacity = max(count, 2 * len(self._keys))
+            keys = np.empty(capacity, dtype=np.float64)
+            data = np.empty((capacity, self.columns), dtype=np.float64)
+            keys[:self._count] = self._keys[:self._count]
+            data[:self._count] = self._data[:self._count]
+            self._keys = keys
+            self._data = data
+
+    def apply(self, delta):
+        # a single delta, the rows below its level are shifted by one within the preallocated arrays
+        key = -delta[0] if self.side else delta[0]
+        count = self._count
+        keys = self._keys
+        position = int(keys[:count].searchsorted(key))
+        found = position < count and keys[position] == key
+        if self.is_live_delta(delta):
+            if not found:
+                self.reserve(count + 1)
+                keys = self._keys
+                keys[position + 1:count + 1] = keys[position:count]
+                self._data[position + 1:count + 1] = self._data[position:count]
+                keys[position] = key
+                self._count = count + 1
+            self._data[position] = delta
+        elif found:
+            keys[position:count - 1] = keys[position + 1:count]
+            self._data[position:count - 1] = self._data[position + 1:count]
+            self._count = count - 1
+        else:
+            return
+        if position < self._mirrored:
+            self._mirrored = position
+
+    def flush(self):
+        if not self._pending:
+            return
+        if len(self._pending) < self.vectorise_from:
+            pending = self._pending
+            self._pending = []
+            for delta in pending:
+                self.apply(delta)
+            return
+        batch = np.array(self._pending, dtype=np.float64)
+        self._pending = []
+        keys = -batch[:, 0] if self.side else batch[:, 0]
+        # keep the last delta for every price, np.unique also sorts the batch by key
+        keys, first = np.unique(keys[::-1], return_index=True)
+        batch = batch[len(batch) - 1 - first]
+        live = self.is_live(batch)
+        count = self._count
+        current = self._keys[:count]
+        positions = np.searchsorted(current, keys)
+        found = positions < count
+        found[found] = current[positions[found]] == keys[found]
+        updated = found & live
+        self._data[positions[updated]] = batch[updated]
+        removed = found & ~live
+        inserted = ~found & live
+        if updated.any():
+            self._mirrored = min(self._mirrored, positions[updated].min())
+        if not removed.any() and not inserted.any():
+            return
+        # the rows above the first removed or inserted level stay where they are
+        # the rows below it are moved within the preallocated arrays, each one by the levels inserted before it minus the ones removed
+        start = positions[removed | inserted].min()
+        self._mirrored = min(self._mirrored, start)
+        keep = np.ones(count - start, dtype=bool)
+        keep[positions[removed] - start] = False
+        kept_keys = self._keys[start:count][keep]
+        kept_data = self._data[start:count][keep]
+        inserted_keys = keys[inserted]
+        total = start + len(kept_keys) + len(inserted_keys)
+        self.reserve(total)
+        kept_positions = start + np.arange(len(kept_keys)) + np.searchsorted(inserted_keys, kept_keys)
+        inserted_positions = start + np.arange(len(inserted_keys)) + np.searchsorted(kept_keys, inserted_keys)
+        self._keys[kept_positions] = kept_keys
+        self._data[kept_positions] = kept_data
+        self._keys[inserted_positions] = inserted_keys
+        self._data[inserted_positions] = batch[inserted]
+        self._count = total
+
+    def limit(self):
+        self.flush()
+        if self._count > self._depth:
+            self._count = self._depth
+        mirrored = min(self._count, self.mirror_depth)
+        if self._mirrored < mirrored or list.__len__(self) != mirrored:
+            start = min(self._mirrored, mirrored)
+            list.__setitem__(self, slice(start, None), self._data[start:mirrored].tolist())
+            self._mirrored = mirrored
+
+    def clear(self):
+        self._count = 0
+        self._pending = []
+        self._mirrored = 0
+        super(ColumnarOrderBookSide, self).clear()
+
+    def top(self, n=None):
+        length = len(self)
+        return self._data[:length if n is None else min(n, length)]
+
+    def best(self):
+        return self._data[0] if len(self) else None
+
+    def __len__(self):
+        self.flush()
+        return min(self._count, self._n)
+
+    def __iter__(self):
+        # one list per level that is actually iterated
+        return (row.tolist() for row in self.top())
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.top()[item].tolist()
+        length = len(self)
+        if item < 0:
+            item += length
+        if item < 0 or item >= length:
+            raise IndexError('list index out of range')
+        return self._data[item].tolist()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == list(other)
+        return False
+
+    def __repr__(self):
+        return str(list(self))
+
+
+class ColumnarCountedOrderBookSide(ColumnarOrderBookSide):
+    columns = 3
+
+    def is_live(self, batch):
+        sizes = batch[:, 1]
+        counts = batch[:, 2]
+        return (sizes != 0) & (counts != 0) & ~np.isnan(sizes) & ~np.isnan(counts)
+
+    def is_live_delta(self, delta):
+        count = delta[2]
+        return super(ColumnarCountedOrderBookSide, self).is_live_delta(delta) and bool(count) and count == count
+
+    def store(self, price, size, count):
+        self._pending.append((price, size, count))
+
+
+class ColumnarAsks(ColumnarOrderBookSide): side = False                     # noqa
+class ColumnarBids(ColumnarOrderBookSide): side = True                      # noqa
+class ColumnarCountedAsks(ColumnarCountedOrderBookSide): side = False       # noqa
+class ColumnarCountedBids(ColumnarCountedOrderBookSide): side = True        # noqa
@@ -0,0 +1,188 @@
+import asyncio
+import collections
+from ccxt.base.errors import BadRequest, NotSupported
+from ccxt.async_support.base.ws.cache import BaseCache
+
+
+class Subscriber:
+    # a bounded per-consumer buffer of the values a ws client resolves for the message hashes it is attached to
+    # when the buffer is full, 'dropOldest' discards the oldest value, 'coalesce' replaces the newest one
+    # and 'block' keeps everything and asks the client to stop reading from the socket until the consumer catches up
+    # process does what the watch_* method does to its result, it runs when the value is resolved, before it is queued
+    overflow_policies = ['dropOldest', 'coalesce', 'block']
+
+    def __init__(self, max_size=1000, overflow='dropOldest', process=None):
+        if overflow not in self.overflow_policies:
+            raise BadRequest('stream overflow policy must be one of ' + ', '.join(self.overflow_policies))
+        self.max_size = max_size
+        self.overflow = overflow
+        self.process = process
+        self.queue = collections.deque()
+        self.attached = []
+        self.received = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.error = None
+        self.closed = False
+        self.waiter = None
+        self.drained = None
+        self.revisions = {}
+
+    @property
+    def lag(self):
+        # values received but not consumed yet
+        return len(self.queue)
+
+    def attach(self, client, message_hashes):
+        for message_hash in message_hashes:
+            subscribers = client.streams.setdefault(message_hash, [])
+            if self not in subscribers:
+                subscribers.append(self)
+                self.attached.append((client, message_hash))
+
+    def detach(self):
+        for client, message_hash in self.attached:
+            subscribers = client.streams.get(message_hash)
+            if subscribers and self in subscribers:
+                subscribers.remove(self)
+                if not subscribers:
+                    del client.streams[message_hash]
+        self.attached = []
+
+    def cache_delta(self, cache):
+        # the caches are resolved as the same mutable object every time, the consumer gets the entries added since its previous value
+        # this is what getLimit() counts for a watch_* caller, kept per consumer so that streams and watch_* calls do not reset each other
+        key = id(cache)
+        seen = self.revisions.get(key)
+        self.revisions[key] = (cache, cache.revision)
+        if seen is None:
+            return list(cache)
+        added = cache.revision - seen[1]
+        length = len(cache)
+        if added > length:
+            self.dropped += added - length
+            added = length
+        return cache[length - added:] if added else []
+
+    def push(self, value):
+        # returns a future while a blocking subscriber is over capacity, the client resumes reading once it resolves
+        if self.closed:
+            return None
+        if isinstance(value, BaseCache):
+            value = self.cache_delta(value)
+            if self.process is not None:
+                value = self.process(value)
+            if not value:
+                # nothing of this update passed the filters of the watch_* method
+                return None
+        elif self.process is not None:
+            value = self.process(value)
+        self.received += 1
+        queue = self.queue
+        if self.max_size is not None and len(queue) >= self.max_size:
+            if self.overflow == 'dropOldest':
+                queue.popleft()
+                self.dropped += 1
+            elif self.overflow == 'coalesce':
+                queue[-1] = value
+                self.coalesced += 1
+                return None
+            elif self.drained is None:
+                self.drained = asyncio.get_event_loop().create_future()
+        queue.append(value)
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+        return self.drained
+
+    def fail(self, error):
+        self.error = error
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def release(self):
+        if self.drained is not None and len(self.queue) < self.max_size:
+            drained = self.drained
+            self.drained = None
+            if not drained.done():
+                drained.set_result(None)
+
+    def close(self):
+        self.closed = True
+        self.detach()
+        self.queue.clear()
+        self.release()
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def get(self):
+        while not self.queue:
+            if self.error is not None:
+                error = self.error
+                self.error = None
+                raise error
+            if self.closed:
+                raise StopAsyncIteration
+            self.waiter = asyncio.get_event_loop().create_future()
+            await self.waiter
+        value = self.queue.popleft()
+        if self.drained is not None:
+            self.release()
+        return value
+
+
+class Stream:
+    # async iterator over the values of a watch_* subscription, see Exchange.stream_updates()
+    # the first iteration runs the watch_* method once to subscribe, later values come from the subscriber buffer
+    def __init__(self, exchange, method, args, subscriber):
+        self.exchange = exchange
+        self.method = method
+        self.args = args
+        self.subscriber = subscriber
+        self.task = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.task is None:
+            self.task = self.exchange.subscribe_stream(self.subscriber, self.method, self.args)
+        subscriber = self.subscriber
+        if not subscriber.queue and not self.task.done():
+            # the watch_* call can still fail before the first value arrives
+            getter = asyncio.ensure_future(subscriber.get())
+            await asyncio.wait([getter, self.task], return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                return getter.result()
+            getter.cancel()
+            if not self.task.cancelled() and self.task.exception() is not None:
+                self.close()
+                raise self.task.exception()
+        if not subscriber.attached and not subscriber.closed and self.task.done():
+            raise NotSupported(self.method + '() did not subscribe through watch(), it can not be streamed')
+        return await subscriber.get()
+
+    @property
+    def lag(self):
+        return self.subscriber.lag
+
+    @property
+    def dropped(self):
+        return self.subscriber.dropped
+
+    @property
+    def coalesced(self):
+        return self.subscriber.coalesced
+
+    def close(self):
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.subscriber.close()
+
+    async def aclose(self):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
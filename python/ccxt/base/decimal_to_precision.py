@@ -1,4 +1,5 @@
 import decimal
+import fractions
 import numbers
 import itertools
 import re
@@ -14,6 +15,9 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'Rounder',
+    'rounder',
+    'rounded_to_precision',
 ]
 
 
@@ -172,3 +176,186 @@ def number_to_string(x):
     d = decimal.Decimal(str(x))
     formatted = '{:f}'.format(d)
     return formatted.rstrip('0').rstrip('.') if '.' in formatted else formatted
+
+
+# the plain notation that decimal.Decimal() and '{:f}' keep as is, other inputs go through decimal_to_precision()
+plain_number = re.compile(r'(-?)(\d+)(?:\.(\d+))?\Z')
+powers_of_10 = [10 ** i for i in range(0, 64)]
+# the default decimal context rounds at 28 digits, longer numbers go through decimal_to_precision()
+max_digits = 24
+
+
+def quantize_string(sign, integer, fraction, precision):
+    # '{:f}'.format(Decimal(...).quantize(10 ** -precision)) with decimal.ROUND_HALF_UP
+    if len(fraction) <= precision:
+        if precision == 0:
+            return sign + integer
+        return sign + integer + '.' + fraction + '0' * (precision - len(fraction))
+    kept = int(integer + fraction[:precision])
+    if fraction[precision] >= '5':
+        kept += 1
+    digits = str(kept)
+    if precision == 0:
+        return sign + digits
+    if len(digits) <= precision:
+        digits = '0' * (precision + 1 - len(digits)) + digits
+    return sign + digits[:-precision] + '.' + digits[-precision:]
+
+
+def round_places(sign, integer, fraction, precision, padding_mode):
+    # the ROUND and DECIMAL_PLACES branch of decimal_to_precision()
+    precise = quantize_string(sign, integer, fraction, precision)
+    if precise == '-0':
+        precise = '0'
+    if padding_mode == NO_PADDING:
+        return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+    if '.' not in precise and precision > 0:
+        return precise + '.' + precision * '0'
+    return precise
+
+
+def truncate_places(sign, integer, fraction, precision, padding_mode):
+    # the TRUNCATE and DECIMAL_PLACES branch of decimal_to_precision()
+    precise = sign + integer + '.' + fraction[:precision]
+    if precise == '-0.':
+        precise = '0.'
+    precise = precise.rstrip('.')
+    if padding_mode == NO_PADDING:
+        return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+    if '.' in precise:
+        before, after = precise.split('.')
+        return before + '.' + after.ljust(precision, '0')
+    if precision > 0:
+        return precise + '.' + precision * '0'
+    return precise
+
+
+class Rounder:
+    """decimal_to_precision() with its arguments bound, see rounder()"""
+
+    __slots__ = ['rounding_mode', 'precision', 'counting_mode', 'padding_mode']
+
+    def __init__(self, rounding_mode, precision, counting_mode, padding_mode):
+        self.rounding_mode = rounding_mode
+        self.precision = precision
+        self.counting_mode = counting_mode
+        self.padding_mode = padding_mode
+
+    def __call__(self, n):
+        return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+
+
+class DecimalPlacesRounder(Rounder):
+    __slots__ = ['places']
+
+    def __init__(self, rounding_mode, precision, counting_mode, padding_mode):
+        super(DecimalPlacesRounder, self).__init__(rounding_mode, precision, counting_mode, padding_mode)
+        self.places = min(precision, 26)
+
+    def __call__(self, n):
+        match = plain_number.match(n if isinstance(n, str) else str(n))
+        if match is None or decimal.getcontext().prec != 28:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        sign, integer, fraction = match.groups('')
+        integer = integer.lstrip('0') or '0'
+        if len(integer) + max(len(fraction), self.places) > max_digits:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        if self.rounding_mode == ROUND:
+            return round_places(sign, integer, fraction, self.places, self.padding_mode)
+        return truncate_places(sign, integer, fraction, self.places, self.padding_mode)
+
+
+class TickSizeRounder(Rounder):
+    # the value and the tick are scaled to integers with as many decimals as the longer of the two
+    __slots__ = ['tick_decimals', 'ticks', 'halves', 'places']
+
+    def __init__(self, rounding_mode, precision, counting_mode, padding_mode):
+        super(TickSizeRounder, self).__init__(rounding_mode, precision, counting_mode, padding_mode)
+        value = float(precision) if isinstance(precision, str) else precision
+        precision_dec = decimal.Decimal(str(value))
+        sign, digits, exponent = precision_dec.as_tuple()
+        tick = int(''.join(map(str, digits)))
+        self.tick_decimals = max(-exponent, 0)
+        if exponent > 0:
+            tick *= 10 ** exponent
+        # decimal_to_precision() compares the remainder with value / 2, a float unless the tick is a Decimal
+        half = fractions.Fraction(value) / 2
+        # the tick and the smallest remainder that rounds up, per number of decimals
+        self.ticks = []
+        self.halves = []
+        for decimals in range(0, max_digits + 1):
+            scale = 10 ** (decimals - self.tick_decimals) if decimals >= self.tick_decimals else 0
+            self.ticks.append(tick * scale)
+            self.halves.append(-((-half.numerator * 10 ** decimals) // half.denominator))
+        parts = re.sub(r'0+$', '', '{:f}'.format(precision_dec)).split('.')
+        self.places = min(len(parts[1]) if len(parts) > 1 else 0, 26)
+
+    def __call__(self, n):
+        match = plain_number.match(n if isinstance(n, str) else str(n))
+        if match is None or decimal.getcontext().prec != 28:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        sign, integer, fraction = match.groups('')
+        integer = integer.lstrip('0') or '0'
+        decimals = len(fraction)
+        if decimals < self.tick_decimals:
+            decimals = self.tick_decimals
+        if len(integer) + decimals > max_digits:
+            return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+        value = int(integer + fraction) * powers_of_10[decimals - len(fraction)]
+        tick = self.ticks[decimals]
+        missing = value % tick
+        if missing:
+            # the magnitude moves the same way for both signs
+            value -= missing
+            if self.rounding_mode == ROUND and missing >= self.halves[decimals]:
+                value += tick
+            digits = str(value)
+            if decimals:
+                if len(digits) <= decimals:
+                    digits = '0' * (decimals + 1 - len(digits)) + digits
+                integer = digits[:-decimals]
+                fraction = digits[-decimals:]
+            else:
+                integer = digits
+                fraction = ''
+            # an exact zero is positive
+            if not value:
+                sign = ''
+        return round_places(sign, integer, fraction, self.places, self.padding_mode)
+
+
+rounders = {}
+
+
+def rounder(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """
+    a callable that returns decimal_to_precision(n, rounding_mode, precision, counting_mode, padding_mode) for any n
+    the rounders are shared and kept, the common cases are computed with integers instead of the decimal module
+    """
+    try:
+        key = (rounding_mode, type(precision), precision, counting_mode, padding_mode)
+        result = rounders.get(key)
+    except TypeError:
+        return Rounder(rounding_mode, precision, counting_mode, padding_mode)
+    if result is None:
+        result = Rounder
+        if rounding_mode in (ROUND, TRUNCATE) and padding_mode in (NO_PADDING, PAD_WITH_ZERO):
+            if counting_mode == DECIMAL_PLACES and isinstance(precision, int) and not isinstance(precision, bool) and precision >= 0:
+                result = DecimalPlacesRounder
+            elif counting_mode == TICK_SIZE and isinstance(precision, (float, int, str, decimal.Decimal)) and not isinstance(precision, bool):
+                try:
+                    value = float(precision)
+                except ValueError:
+                    value = None
+                if value is not None and 0 < value < 1e12:
+                    result = TickSizeRounder
+        result = result(rounding_mode, precision, counting_mode, padding_mode)
+        if len(rounders) >= 10000:
+            rounders.clear()
+        rounders[key] = result
+    return result
+
+
+def rounded_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """decimal_to_precision() through the shared rounder of its arguments"""
+    return rounder(rounding_mode, precision, counting_mode, padding_mode)(n)
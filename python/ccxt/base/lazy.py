@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import sys
+import types
+
+# -----------------------------------------------------------------------------
+# exchange classes in ccxt, ccxt.async_support and ccxt.pro are imported on first access
+# through a module-level __getattr__ (PEP 562), so that `ccxt.binance` only loads binance and its base
+
+
+class LazyExchangesModule(types.ModuleType):
+    # importing an exchange submodule directly (`import ccxt.binance` or from another exchange)
+    # makes the import system set the package attribute to the submodule itself
+    # store the exchange class there instead, as the former eager `from ccxt.binance import binance` did
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get('exchanges', []):
+            value = getattr(value, name, value)
+        super(LazyExchangesModule, self).__setattr__(name, value)
+
+
+def lazy_exchanges(module_name):
+    module = sys.modules[module_name]
+    module.__class__ = LazyExchangesModule
+
+    def __getattr__(name):
+        if name in module.__dict__.get('exchanges', []):
+            exchange = getattr(importlib.import_module(module_name + '.' + name), name)
+            setattr(module, name, exchange)
+            return exchange
+        raise AttributeError('module ' + repr(module_name) + ' has no attribute ' + repr(name))
+
+    def __dir__():
+        return sorted(set(module.__dict__) | set(module.__dict__.get('exchanges', [])))
+
+    return __getattr__, __dir__
@@ -11,26 +11,94 @@
 # (╯°□°）╯︵ ┻━┻
 
 
+# the (integer, decimals) of the strings parsed or produced by the string_* methods
+# the result of one operation is usually the argument of the next one, safe_order() chains several per order
+parsed_numbers = {}
+parsed_numbers_size = 10000
+
+
+def parse_number(number):
+    parsed = parsed_numbers.get(number)
+    if parsed is None:
+        modifier = 0
+        string = number.lower()
+        if 'e' in string:
+            string, modifier = string.split('e')
+            modifier = int(modifier)
+        decimal_index = string.find('.')
+        if decimal_index > -1:
+            parsed = (int(string.replace('.', '')), len(string) - decimal_index - 1 - modifier)
+        else:
+            parsed = (int(string), -modifier)
+        if len(parsed_numbers) >= parsed_numbers_size:
+            parsed_numbers.clear()
+        parsed_numbers[number] = parsed
+    return parsed
+
+
+def reduce_number(integer, decimals):
+    # strips the trailing zeros of the integer, 1.50 is (15, 1)
+    if integer % 10:
+        return integer, decimals
+    if integer == 0:
+        return 0, 0
+    string = str(integer)
+    stripped = string.rstrip('0')
+    return int(stripped), decimals - len(string) + len(stripped)
+
+
+def number_to_string(integer, decimals):
+    integer, decimals = reduce_number(integer, decimals)
+    if decimals > 0:
+        if integer < 0:
+            digits = str(-integer)
+            sign = '-'
+        else:
+            digits = str(integer)
+            sign = ''
+        if len(digits) > decimals:
+            string = sign + digits[:-decimals] + '.' + digits[-decimals:]
+        else:
+            string = sign + '0.' + digits.rjust(decimals, '0')
+    elif decimals == 0:
+        string = str(integer)
+    else:
+        string = str(integer) + '0' * -decimals
+        integer = integer * 10 ** -decimals
+        decimals = 0
+    if string not in parsed_numbers:
+        if len(parsed_numbers) >= parsed_numbers_size:
+            parsed_numbers.clear()
+        parsed_numbers[string] = (integer, decimals)
+    return string
+
+
+def add_numbers(integer1, decimals1, integer2, decimals2):
+    if decimals1 == decimals2:
+        return integer1 + integer2, decimals1
+    elif decimals1 > decimals2:
+        return integer2 * 10 ** (decimals1 - decimals2) + integer1, decimals1
+    else:
+        return integer1 * 10 ** (decimals2 - decimals1) + integer2, decimals2
+
+
+def compare_numbers(string1, string2):
+    # the sign of string1 - string2
+    integer1, decimals1 = parse_number(string1)
+    integer2, decimals2 = parse_number(string2)
+    return add_numbers(integer1, decimals1, -integer2, decimals2)[0]
+
+
 class Precise:
+    __slots__ = ['integer', 'decimals']
+    base = 10
+
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse_number(number)
         else:
             self.integer = number
             self.decimals = decimals
-        self.base = 10
 
     def __add__(self, other):
         return self.add(other)
@@ -151,20 +219,8 @@ class Precise:
         return other.ge(self)
 
     def reduce(self):
-        string = str(self.integer)
-        start = len(string) - 1
-        if start == 0:
-            if string == "0":
-                self.decimals = 0
-            return self
-        for i in range(start, -1, -1):
-            if string[i] != '0':
-                break
-        difference = start - i
-        if difference == 0:
-            return self
-        self.decimals -= difference
-        self.integer = int(string[:i + 1])
+        self.integer, self.decimals = reduce_number(self.integer, self.decimals)
+        return self
 
     def equals(self, other):
         self.reduce()
@@ -173,19 +229,7 @@ class Precise:
 
     def __str__(self):
         self.reduce()
-        sign = '-' if self.integer < 0 else ''
-        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
-        index = len(integer_array) - self.decimals
-        if index == 0:
-            item = '0.'
-        elif self.decimals < 0:
-            item = '0' * (-self.decimals)
-        elif self.decimals == 0:
-            item = ''
-        else:
-            item = '.'
-        integer_array.insert(index, item)
-        return sign + ''.join(integer_array)
+        return number_to_string(self.integer, self.decimals)
 
     def __repr__(self):
         return "Precise(" + str(self) + ")"
@@ -197,16 +241,30 @@ class Precise:
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        integer1, decimals1 = parse_number(string1)
+        integer2, decimals2 = parse_number(string2)
+        return number_to_string(integer1 * integer2, decimals1 + decimals2)
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
+        integer2, decimals2 = parse_number(string2)
+        if integer2 == 0:
             return None
-        return str(Precise(string1).div(string2_precise, precision))
+        integer1, decimals1 = parse_number(string1)
+        distance = precision - decimals1 + decimals2
+        if distance == 0:
+            numerator = integer1
+        elif distance < 0:
+            numerator = integer1 // 10 ** -distance
+        else:
+            numerator = integer1 * 10 ** distance
+        result, mod = divmod(numerator, integer2)
+        # python floors negative numbers down instead of truncating
+        if result < 0 and mod:
+            result += 1
+        return number_to_string(result, precision)
 
     @staticmethod
     def string_add(string1, string2):
@@ -216,25 +274,31 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        integer1, decimals1 = parse_number(string1)
+        integer2, decimals2 = parse_number(string2)
+        return number_to_string(*add_numbers(integer1, decimals1, integer2, decimals2))
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        integer1, decimals1 = parse_number(string1)
+        integer2, decimals2 = parse_number(string2)
+        return number_to_string(*add_numbers(integer1, decimals1, -integer2, decimals2))
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse_number(string)
+        return number_to_string(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse_number(string)
+        return number_to_string(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
@@ -252,46 +316,46 @@ class Precise:
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return reduce_number(*parse_number(string1)) == reduce_number(*parse_number(string2))
 
     @staticmethod
     def string_eq(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return reduce_number(*parse_number(string1)) == reduce_number(*parse_number(string2))
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        return number_to_string(*parse_number(string1 if compare_numbers(string2, string1) > 0 else string2))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        return number_to_string(*parse_number(string1 if compare_numbers(string1, string2) > 0 else string2))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        return compare_numbers(string1, string2) > 0
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        return compare_numbers(string1, string2) >= 0
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        return compare_numbers(string2, string1) > 0
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        return compare_numbers(string2, string1) >= 0
@@ -0,0 +1,45 @@
+import collections
+import threading
+
+
+class RequestCache:
+    # responses of public requests kept for a short ttl and evicted least recently used first, see Exchange.fetch2()
+    # Exchange.fetch2() hands a copy of the kept response to every caller
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        self.entries = collections.OrderedDict()  # key => (expires, response)
+        self.inflight = {}  # key => the pending request every identical caller waits for
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key, now):
+        # returns (True, response) on a fresh hit, (False, None) otherwise
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= now:
+            del self.entries[key]
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, key, response, expires):
+        self.entries[key] = (expires, response)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'size': len(self.entries),
+        }
@@ -0,0 +1,82 @@
+import collections
+import threading
+from time import time
+
+
+class Throttler:
+    # the token bucket of ccxt.async_support.base.throttler for the synchronous exchanges
+    # calls from any number of threads are served in arrival order, the caller blocks until its turn
+    # named buckets shared by every exchange instance that attaches to the same key
+    registry = {}
+    registry_lock = threading.Lock()
+
+    def __init__(self, config):
+        self.config = {
+            'refillRate': 1.0,
+            'delay': 0.001,
+            'cost': 1.0,
+            'tokens': 0,
+            'maxCapacity': 2000,
+            'capacity': 1.0,
+        }
+        self.config.update(config)
+        self.lock = threading.Lock()
+        self.queue = collections.deque()
+        self.last_timestamp = time() * 1000
+
+    def refill(self):
+        now = time() * 1000
+        elapsed = now - self.last_timestamp
+        if elapsed > 0:
+            self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+            self.last_timestamp = now
+
+    def wait_time(self):
+        # seconds until the bucket is back to zero tokens, never shorter than the configured delay
+        missing = -self.config['tokens']
+        refill_rate = self.config['refillRate']
+        if refill_rate <= 0:
+            return self.config['delay']
+        return max(missing / refill_rate / 1000, self.config['delay'])
+
+    @classmethod
+    def shared(cls, key, config):
+        # the bucket is created with the config of the first caller, the config of later callers is ignored
+        with cls.registry_lock:
+            throttler = cls.registry.get(key)
+            if throttler is None:
+                throttler = cls(config)
+                cls.registry[key] = throttler
+            return throttler
+
+    @classmethod
+    def release_shared(cls, key):
+        with cls.registry_lock:
+            return cls.registry.pop(key, None)
+
+    def __call__(self, cost=None):
+        cost = self.config['cost'] if cost is None else cost
+        with self.lock:
+            if len(self.queue) > self.config['maxCapacity']:
+                raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
+            # every caller waits on a condition of its own, so that only the head of the queue is woken up
+            turn = threading.Condition(self.lock)
+            self.queue.append(turn)
+            try:
+                while True:
+                    if self.queue[0] is turn:
+                        # like the async looper, the balance is spent before it is refilled and capped
+                        if self.config['tokens'] < 0:
+                            self.refill()
+                        if self.config['tokens'] >= 0:
+                            self.config['tokens'] -= cost
+                            return
+                        turn.wait(self.wait_time())
+                    else:
+                        turn.wait()
+            finally:
+                # served, interrupted or failed, the caller leaves the queue and the next one moves up
+                head = self.queue[0] is turn
+                self.queue.remove(turn)
+                if head and self.queue:
+                    self.queue[0].notify()
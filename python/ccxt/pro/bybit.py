@@ -110,6 +110,19 @@ class bybit(ccxt.async_support.bybit):
                 },
             },
             'options': {
+                'ws': {
+                    # frames of the channels below are decoded only while the prefix followed by the symbol of the frame is watched, see Client.route() in python
+                    'routes': {
+                        'key': 'topic',
+                        'separator': '.',
+                        'channels': {
+                            'publicTrade': 'trade:',
+                            'kline': 'ohlcv::',
+                            'tickers': 'ticker:',
+                            'liquidation': 'liquidations::',
+                        },
+                    },
+                },
                 'watchTicker': {
                     'name': 'tickers',  # 'tickers' for 24hr statistical ticker or 'tickers_lt' for leverage token ticker
                 },
@@ -64,6 +64,15 @@ class kraken(ccxt.async_support.kraken):
             #     'ws': '0.2.0',
             # },
             'options': {
+                'ws': {
+                    # frames of the channels below are decoded only while a hash with the prefix is watched, see Client.route() in python
+                    'routes': {
+                        'key': 'event',
+                        'channels': {
+                            'heartbeat': 'heartbeat',
+                        },
+                    },
+                },
                 'tradesLimit': 1000,
                 'OHLCVLimit': 1000,
                 'ordersLimit': 1000,
@@ -0,0 +1,39 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.cache import ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: E402
+
+
+def test_cache_by_key():
+    cache = ArrayCacheBySymbolById(3)
+    cache.append({'symbol': 'BTC/USDT', 'id': '1', 'i': 1})
+    cache.append({'symbol': 'BTC/USDT', 'id': '2', 'i': 2})
+    cache.append({'symbol': 'ETH/USDT', 'id': '1', 'i': 3})
+    # the same id on another symbol is a different order
+    assert [item['i'] for item in cache] == [1, 2, 3]
+    # an update moves the order to the end and keeps the reference
+    reference = cache[0]
+    cache.append({'symbol': 'BTC/USDT', 'id': '1', 'i': 4})
+    assert [item['i'] for item in cache] == [2, 3, 4]
+    assert cache[-1] is reference
+    assert cache[1:] == [cache[1], cache[2]]
+    # the oldest order is evicted from both the storage and the hashmap
+    cache.append({'symbol': 'ETH/USDT', 'id': '5', 'i': 5})
+    assert len(cache) == 3
+    assert [item['i'] for item in cache] == [3, 4, 5]
+    assert '2' not in cache.hashmap['BTC/USDT']
+    assert cache.getLimit('BTC/USDT', None) == 2
+    assert cache.getLimit(None, None) == 4
+    cache.append({'symbol': 'ETH/USDT', 'id': '5', 'i': 6})
+    assert cache.getLimit('ETH/USDT', None) == 1
+    assert cache.getLimit(None, None) == 1
+    # positions are keyed by symbol and side
+    positions = ArrayCacheBySymbolBySide()
+    positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 1})
+    positions.append({'symbol': 'BTC/USDT', 'side': 'short', 'contracts': 2})
+    positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 3})
+    assert [item['contracts'] for item in positions] == [2, 3]
+    assert positions.getLimit('BTC/USDT', None) == 2
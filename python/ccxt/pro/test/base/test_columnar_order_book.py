@@ -0,0 +1,61 @@
+import json
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book import ColumnarOrderBook, ColumnarCountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_side import np  # noqa: E402
+
+
+def random_delta(counted):
+    price = random.randint(1, 300) / 4
+    size = random.choice([0, None, random.randint(1, 100) / 10])
+    if counted:
+        return [price, size, float(random.choice([0, 1, 2]))]
+    return [price, size]
+
+
+def test_columnar_order_book():
+    if np is None:
+        return
+    random.seed(7)
+    for counted, expected_class, actual_class in [(False, OrderBook, ColumnarOrderBook), (True, CountedOrderBook, ColumnarCountedOrderBook)]:
+        # limits every 97 deltas flush them in one vectorised step, every 3 deltas one by one
+        for depth, mirror_depth, interval in [(None, 100, 97), (25, 100, 97), (None, 10, 97), (None, 100, 3), (25, 10, 3)]:
+            snapshot = {
+                'asks': [random_delta(counted) for i in range(0, 50)],
+                'bids': [random_delta(counted) for i in range(0, 50)],
+            }
+            expected = expected_class(json.loads(json.dumps(snapshot)), depth)
+            actual = actual_class(json.loads(json.dumps(snapshot)), depth)
+            actual['asks'].mirror_depth = mirror_depth
+            actual['bids'].mirror_depth = mirror_depth
+            for i in range(0, 3000):
+                side = random.choice(['asks', 'bids'])
+                delta = random_delta(counted)
+                expected[side].storeArray(list(delta))
+                actual[side].storeArray(list(delta))
+                if i % interval == 0:
+                    expected.limit()
+                    actual.limit()
+                    for key in ['asks', 'bids']:
+                        assert len(expected[key]) == len(actual[key])
+                        assert list(expected[key]) == list(actual[key])
+                        assert expected[key][2:9] == actual[key][2:9]
+                        assert actual.top(5)[key].tolist() == expected[key][:5]
+                    assert json.dumps(actual) == json.dumps(expected)
+                    # the inherited list storage, read by C extensions like orjson, mirrors the top mirror_depth levels
+                    for key in ['asks', 'bids']:
+                        assert list.__getitem__(actual[key], slice(None)) == expected[key][:mirror_depth]
+                    if len(expected['bids']):
+                        assert actual.best_bid().tolist() == expected['bids'][0]
+                        # best and top are views into the preallocated arrays, not copies
+                        assert np.shares_memory(actual.best_bid(), actual['bids']._data)
+            expected.reset(json.loads(json.dumps(snapshot)))
+            actual.reset(json.loads(json.dumps(snapshot)))
+            assert list(expected['asks']) == list(actual['asks'])
+            assert list(expected['bids']) == list(actual['bids'])
@@ -0,0 +1,68 @@
+import asyncio
+import gzip
+import json
+import os
+import sys
+import zlib
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMessage, WSMsgType  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient  # noqa: E402
+from ccxt.async_support.base.ws.functions import gunzip, inflate, is_json_encoded_object, json_decoder  # noqa: E402
+
+
+def deflate(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def received(config={}):
+    messages = []
+    client = AiohttpClient('wss://decode.test', lambda client, message: messages.append(message), None, None, None, config)
+    return client, messages
+
+
+async def test_decode_async():
+    document = {'ch': 'market.btcusdt.trade.detail', 'tick': {'data': [{'price': 30000.5, 'amount': '0.1'}]}}
+    encoded = json.dumps(document).encode('utf-8')
+    assert is_json_encoded_object(encoded)
+    assert is_json_encoded_object(bytearray(b'[1]'))
+    assert not is_json_encoded_object(b'pong')
+    assert gunzip(gzip.compress(encoded)) == encoded.decode('utf-8')
+    assert inflate(deflate(encoded)) == encoded
+    # compressed binary frames
+    client, messages = received({'gunzip': True})
+    client.handle_message(WSMessage(WSMsgType.BINARY, gzip.compress(encoded), None))
+    client.handle_message(WSMessage(WSMsgType.BINARY, gzip.compress(b'ping'), None))
+    client, inflated = received({'inflate': True})
+    client.handle_message(WSMessage(WSMsgType.BINARY, deflate(encoded), None))
+    client.handle_message(WSMessage(WSMsgType.TEXT, 'pong', None))
+    assert messages == [document, 'ping']
+    assert inflated == [document, 'pong']
+    # the decoder is configurable through options['ws']
+    calls = []
+
+    def decoder(data):
+        calls.append(type(data))
+        return json.loads(data)
+
+    client, messages = received({'decoder': decoder})
+    client.handle_message(WSMessage(WSMsgType.BINARY, encoded, None))
+    client.handle_message(WSMessage(WSMsgType.TEXT, encoded.decode('utf-8'), None))
+    assert messages == [document, document]
+    # binary frames are parsed without decoding them to text first
+    assert calls == [bytes, str]
+    client, messages = received({'decoder': 'json'})
+    assert client.decode is json.loads
+    try:
+        json_decoder('yaml')
+        assert False
+    except NotSupported:
+        pass
+
+
+def test_decode():
+    asyncio.run(test_decode_async())
@@ -189,6 +189,41 @@ async def test_reject_with_non_exception():
     except Exception as e:
         assert str(e) == "test error", f"Expected 'test error', got '{str(e)}'"
 
+async def test_race_reuses_members():
+    print("test_race_reuses_members")
+    futures = [Future() for i in range(0, 3)]
+    # the same member futures are raced again after every result, as watch_multiple does
+    for i in range(0, 3):
+        race_future = Future.race(futures)
+        futures[i].resolve(i)
+        result = await race_future
+        assert result == i, f"Expected {i}, got '{result}'"
+        futures[i] = Future()
+    race_future = Future.race([Future(), Future()])
+    race_future.cancel()
+    await asyncio.sleep(0)
+    assert race_future.cancelled()
+
+async def test_race_cancelled_member():
+    print("test_race_cancelled_member")
+    future1 = Future()
+    future2 = Future()
+    race_future = Future.race([future1, future2])
+    future1.cancel()
+    try:
+        await race_future
+        assert False, "Expected an ExchangeClosedByUser"
+    except ExchangeClosedByUser:
+        assert True
+
+async def test_race_empty():
+    print("test_race_empty")
+    try:
+        Future.race([])
+        assert False, "Expected a ValueError"
+    except ValueError:
+        assert True
+
 async def test_ws_future():
     await test_resolve_before()
     await test_reject()
@@ -203,4 +238,6 @@ async def test_ws_future():
     await test_race_with_precompleted_future()
     await test_closed_by_user()
     await test_reject_with_non_exception()
-
+    await test_race_reuses_members()
+    await test_race_cancelled_member()
+    await test_race_empty()
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMessage, WSMsgType  # noqa: E402
+import ccxt.pro  # noqa: E402
+from ccxt.async_support.base.ws.aiohttp_client import AiohttpClient  # noqa: E402
+
+routes = {
+    'key': 'e',
+    'drop': ['pong'],
+    'channels': {
+        'trade': 'trade::',
+        'depthUpdate': 'orderbook::',
+    },
+}
+
+
+async def test_route_async():
+    messages = []
+    client = AiohttpClient('wss://route.test', lambda client, message: messages.append(message), None, None, None, {'routes': routes})
+    trade = b'{"e":"trade","s":"BTCUSDT","p":"30000.1"}'
+    depth = '{"e": "depthUpdate", "s": "BTCUSDT", "b": []}'
+    # nobody subscribed yet, the channel frames are dropped unparsed
+    client.handle_message(WSMessage(WSMsgType.BINARY, trade, None))
+    client.handle_message(WSMessage(WSMsgType.TEXT, depth, None))
+    client.handle_message(WSMessage(WSMsgType.TEXT, '{"e":"pong"}', None))
+    assert messages == []
+    assert client.dropped_frames == 3
+    # undeclared routing values and frames without the routing member are always decoded
+    client.handle_message(WSMessage(WSMsgType.TEXT, '{"e":"executionReport","i":1}', None))
+    client.handle_message(WSMessage(WSMsgType.TEXT, '{"result":null,"id":1}', None))
+    assert messages == [{'e': 'executionReport', 'i': 1}, {'result': None, 'id': 1}]
+    # a pending future, a subscription or a stream makes the channel wanted
+    client.future('trade::BTC/USDT')
+    client.handle_message(WSMessage(WSMsgType.BINARY, trade, None))
+    client.subscriptions['orderbook::BTC/USDT'] = True
+    client.handle_message(WSMessage(WSMsgType.TEXT, depth, None))
+    assert messages[2:] == [{'e': 'trade', 's': 'BTCUSDT', 'p': '30000.1'}, {'e': 'depthUpdate', 's': 'BTCUSDT', 'b': []}]
+    # once unsubscribed the remaining frames of the channel are dropped again
+    del client.subscriptions['orderbook::BTC/USDT']
+    client.handle_message(WSMessage(WSMsgType.TEXT, depth, None))
+    assert len(messages) == 4
+    assert client.dropped_frames == 4
+    # the routing member must be within the scanned window
+    late = AiohttpClient('wss://route.test', lambda client, message: messages.append(message), None, None, None, {'routes': {'key': 'e', 'window': 8, 'drop': ['pong']}})
+    late.handle_message(WSMessage(WSMsgType.TEXT, '{"time":1,"e":"pong"}', None))
+    assert messages[-1] == {'time': 1, 'e': 'pong'}
+    client.future('trade::BTC/USDT').cancel()
+    # with the market ids known only the frames of the watched symbols are decoded
+    symbols = {'BTCUSDT': ['BTC/USDT', 'BTC/USDT:USDT'], 'ETHUSDT': ['ETH/USDT']}
+    keyed = AiohttpClient('wss://route.test', lambda client, message: messages.append(message), None, None, None, {'routes': {'key': 'e', 'id': 's', 'channels': {'kline': 'ohlcv::'}}, 'route_symbols': symbols.get})
+    keyed.subscriptions['ohlcv::BTC/USDT:USDT::1m'] = True
+    keyed.handle_message(WSMessage(WSMsgType.TEXT, '{"e":"kline","s":"ETHUSDT","k":{}}', None))
+    assert keyed.dropped_frames == 1
+    keyed.handle_message(WSMessage(WSMsgType.TEXT, '{"e":"kline","s":"BTCUSDT","k":{}}', None))
+    keyed.handle_message(WSMessage(WSMsgType.TEXT, '{"e":"kline","s":"XRPUSDT","k":{}}', None))
+    assert messages[-2:] == [{'e': 'kline', 's': 'BTCUSDT', 'k': {}}, {'e': 'kline', 's': 'XRPUSDT', 'k': {}}]
+    assert keyed.dropped_frames == 1
+
+
+btc_usdt = {
+    'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot',
+    'spot': True, 'margin': False, 'swap': False, 'future': False, 'option': False, 'contract': False,
+}
+eth_usdt = dict(btc_usdt, id='ETHUSDT', symbol='ETH/USDT', base='ETH')
+
+
+def text(data):
+    return WSMessage(WSMsgType.TEXT, data, None)
+
+
+async def test_exchange_routes_async():
+    # the routing tables the exchanges declare, driven through their own handle_message
+    binance = ccxt.pro.binance()
+    binance.set_markets([btc_usdt, eth_usdt])
+    client = binance.client('wss://stream.binance.com:9443/ws')
+    trade = '{"e":"trade","E":1700000000001,"s":"BTCUSDT","t":1,"p":"30000.10","q":"0.5","T":1700000000000,"m":true}'
+    client.handle_message(text(trade))
+    assert 'BTC/USDT' not in binance.trades
+    assert client.dropped_frames == 1
+    future = client.future('trade::BTC/USDT')
+    client.handle_message(text(trade))
+    assert future.done()
+    assert binance.trades['BTC/USDT'][-1]['price'] == 30000.1
+    # the trades of a market nobody watches are dropped while the channel is watched
+    client.future('trade::BTC/USDT')
+    client.handle_message(text(trade.replace('BTCUSDT', 'ETHUSDT')))
+    assert 'ETH/USDT' not in binance.trades
+    assert client.dropped_frames == 2
+    client.future('trade::BTC/USDT').cancel()
+    # the subscription keeps the channel wanted between two watch calls
+    client.subscriptions['trade::BTC/USDT'] = {}
+    client.handle_message(text(trade.replace('"t":1', '"t":2')))
+    assert len(binance.trades['BTC/USDT']) == 2
+    del client.subscriptions['trade::BTC/USDT']
+    # an undeclared event is always handed to handle_message
+    client.handle_message(text('{"e":"bookTicker","u":1,"s":"BTCUSDT","b":"30000","B":"1","a":"30001","A":"2"}'))
+    assert binance.bidsasks['BTC/USDT']['ask'] == 30001.0
+    assert client.dropped_frames == 2
+    # the bybit topics carry the market id after the channel
+    bybit = ccxt.pro.bybit()
+    bybit.set_markets([btc_usdt, eth_usdt])
+    client = bybit.client('wss://stream.bybit.com/v5/public/spot')
+    trade = '{"topic":"publicTrade.BTCUSDT","type":"snapshot","ts":1700000000001,"data":[{"i":"1","T":1700000000000,"p":"30000.1","v":"0.5","S":"Buy","s":"BTCUSDT","BT":false}]}'
+    client.handle_message(text(trade))
+    assert 'BTC/USDT' not in bybit.trades
+    client.future('trade:BTC/USDT')
+    client.handle_message(text(trade))
+    assert bybit.trades['BTC/USDT'][-1]['price'] == 30000.1
+    client.handle_message(text(trade.replace('BTCUSDT', 'ETHUSDT')))
+    assert 'ETH/USDT' not in bybit.trades
+    assert client.dropped_frames == 2
+    await binance.close()
+    await bybit.close()
+
+
+def test_route():
+    asyncio.run(test_route_async())
+    asyncio.run(test_exchange_routes_async())
@@ -0,0 +1,76 @@
+import json
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book import SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook  # noqa: E402
+
+
+def random_delta(kind):
+    price = random.randint(1, 300) / 4
+    size = random.choice([0, 0, random.randint(1, 100) / 10])
+    if kind == 'counted':
+        return [price, size, random.choice([0, 1, 2])]
+    if kind == 'indexed':
+        return [random.choice([price, None]), size, 'id' + str(random.randint(1, 200))]
+    return [price, size]
+
+
+def assert_same(expected, actual):
+    for side in ['asks', 'bids']:
+        assert len(expected[side]) == len(actual[side])
+        assert list(expected[side]) == list(actual[side])
+        assert expected[side][:] == actual[side][:]
+        assert expected[side][1:10] == actual[side][1:10]
+        assert expected[side][::3] == actual[side][::3]
+        if len(expected[side]):
+            assert expected[side][0] == actual[side][0]
+            assert expected[side][-1] == actual[side][-1]
+
+
+def test_sorted_order_book():
+    random.seed(42)
+    pairs = [
+        ('plain', OrderBook, SortedOrderBook),
+        ('counted', CountedOrderBook, SortedCountedOrderBook),
+        ('indexed', IndexedOrderBook, SortedIndexedOrderBook),
+    ]
+    for kind, expected_class, actual_class in pairs:
+        for depth in [None, 25]:
+            snapshot = {
+                'asks': [d for d in (random_delta(kind) for i in range(0, 50)) if d[0] is not None],
+                'bids': [d for d in (random_delta(kind) for i in range(0, 50)) if d[0] is not None],
+            }
+            expected = expected_class(json.loads(json.dumps(snapshot)), depth)
+            actual = actual_class(json.loads(json.dumps(snapshot)), depth)
+            actual['asks'].load = actual['bids'].load = 4  # force plenty of block splits
+            actual['asks'].mirror_depth = actual['bids'].mirror_depth = 30
+            for i in range(0, 1500):
+                side = random.choice(['asks', 'bids'])
+                delta = random_delta(kind)
+                if kind == 'indexed' and delta[0] is None and delta[2] not in expected[side]._hashmap:
+                    continue
+                expected[side].storeArray(list(delta))
+                actual[side].storeArray(list(delta))
+                if i % 150 == 0:
+                    expected.limit()
+                    actual.limit()
+                    assert_same(expected, actual)
+                    assert json.dumps(expected) == json.dumps(actual)
+                    for key in ['asks', 'bids']:
+                        # the inherited list storage, read by C extensions like orjson, mirrors the top mirror_depth levels
+                        assert list.__getitem__(actual[key], slice(None)) == expected[key][:30]
+                        # deletes do not leave undersized blocks behind
+                        blocks = actual[key]._keys
+                        assert len(blocks) == 1 or all(len(keys) >= actual[key].load // 2 for keys in blocks)
+            # between the calls to limit() too
+            for side in ['asks', 'bids']:
+                assert json.loads(json.dumps(actual[side])) == list(actual[side])
+            if kind != 'indexed':
+                expected.reset(json.loads(json.dumps(snapshot)))
+                actual.reset(json.loads(json.dumps(snapshot)))
+                assert_same(expected, actual)
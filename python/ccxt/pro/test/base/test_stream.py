@@ -0,0 +1,161 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NetworkError  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheBySymbolById  # noqa: E402
+from ccxt.async_support.base.ws.client import Client  # noqa: E402
+
+url = 'wss://stream.test'
+
+
+class StreamExchange(Exchange):
+    async def watch_ticker(self, symbol, params={}):
+        # an auxiliary subscription first, the stream follows the last one
+        self.watch(url, 'authenticated', None, 'authenticated')
+        return await self.watch(url, 'ticker:' + symbol, None, 'ticker:' + symbol)
+
+    async def watch_trades(self, symbol, since=None, limit=None, params={}):
+        return await self.watch(url, 'trades:' + symbol, None, 'trades:' + symbol)
+
+    async def watch_orders(self, symbol=None, since=None, limit=None, params={}):
+        # one private subscription for every symbol
+        return await self.watch(url, 'orders', None, 'orders')
+
+    async def watch_order_book(self, symbol, limit=None, params={}):
+        return await self.watch(url, 'orderbook:' + symbol, None, 'orderbook:' + symbol)
+
+
+def connected_client():
+    client = Client(url, None, None, None, None)
+    client.connected.resolve(url)
+    return client
+
+
+async def settle():
+    for i in range(0, 3):
+        await asyncio.sleep(0)
+
+
+async def test_stream_async():
+    exchange = StreamExchange({'id': 'streamtest'})
+    client = connected_client()
+    exchange.clients[url] = client
+    # several consumers read one subscription, each one at its own pace
+    fast = exchange.stream_ticker('BTC/USDT')
+    slow = exchange.stream_ticker('BTC/USDT', maxSize=2)
+    first = asyncio.ensure_future(fast.__anext__())
+    second = asyncio.ensure_future(slow.__anext__())
+    await settle()
+    assert 'authenticated' not in client.streams
+    assert len(client.streams['ticker:BTC/USDT']) == 2
+    for i in range(0, 4):
+        client.resolve({'last': i}, 'ticker:BTC/USDT')
+    assert (await first) == {'last': 0}
+    assert [await fast.__anext__() for i in range(0, 3)] == [{'last': 1}, {'last': 2}, {'last': 3}]
+    # the slow consumer lost the oldest updates once its buffer was full
+    assert slow.dropped == 2
+    assert (await second) == {'last': 2}
+    assert slow.lag == 1
+    assert (await slow.__anext__()) == {'last': 3}
+    assert slow.lag == 0
+    slow.close()
+    assert len(client.streams['ticker:BTC/USDT']) == 1
+    # coalesce keeps the latest value in the last slot
+    latest = exchange.stream_ticker('ETH/USDT', maxSize=2, overflow='coalesce')
+    pending = asyncio.ensure_future(latest.__anext__())
+    await settle()
+    for i in range(0, 5):
+        client.resolve({'last': i}, 'ticker:ETH/USDT')
+    assert (await pending) == {'last': 0}
+    assert (await latest.__anext__()) == {'last': 4}
+    assert latest.coalesced == 3
+    # caches stream the entries added since the previous value
+    cache = ArrayCache(3)
+    trades = exchange.stream_trades('BTC/USDT')
+    pending = asyncio.ensure_future(trades.__anext__())
+    await settle()
+    cache.append({'symbol': 'BTC/USDT', 'id': 1})
+    client.resolve(cache, 'trades:BTC/USDT')
+    cache.append({'symbol': 'BTC/USDT', 'id': 2})
+    cache.append({'symbol': 'BTC/USDT', 'id': 3})
+    client.resolve(cache, 'trades:BTC/USDT')
+    for i in range(4, 9):
+        cache.append({'symbol': 'BTC/USDT', 'id': i})
+    client.resolve(cache, 'trades:BTC/USDT')
+    assert [trade['id'] for trade in await pending] == [1]
+    assert [trade['id'] for trade in await trades.__anext__()] == [2, 3]
+    # more entries than the cache holds were added in between
+    assert [trade['id'] for trade in await trades.__anext__()] == [6, 7, 8]
+    assert trades.dropped == 2
+    # the symbol, since and limit of the watch_* call apply to every value
+    orders = ArrayCacheBySymbolById()
+    btc = exchange.stream_orders('BTC/USDT', None, 2)
+    every = exchange.stream_orders()
+    pending = [asyncio.ensure_future(stream.__anext__()) for stream in [btc, every]]
+    await settle()
+    for i in range(0, 4):
+        orders.append({'symbol': 'BTC/USDT', 'id': i, 'timestamp': i})
+        orders.append({'symbol': 'ETH/USDT', 'id': i, 'timestamp': i})
+    client.resolve(orders, 'orders')
+    orders.append({'symbol': 'ETH/USDT', 'id': 4, 'timestamp': 4})
+    client.resolve(orders, 'orders')
+    orders.append({'symbol': 'BTC/USDT', 'id': 0, 'timestamp': 5})
+    client.resolve(orders, 'orders')
+    assert [(order['symbol'], order['id']) for order in await pending[0]] == [('BTC/USDT', 2), ('BTC/USDT', 3)]
+    # the update of ETH/USDT only was not queued for BTC/USDT
+    assert [order['id'] for order in await btc.__anext__()] == [0]
+    assert btc.lag == 0
+    assert len(await pending[1]) == 8
+    assert [order['id'] for order in await every.__anext__()] == [4]
+    # order books are queued as copies of their limited depth
+    orderbook = exchange.order_book({}, 2)
+    books = exchange.stream_order_book('BTC/USDT')
+    pending = asyncio.ensure_future(books.__anext__())
+    await settle()
+    for price in [1, 2, 3]:
+        orderbook['bids'].store(price, 1)
+    client.resolve(orderbook, 'orderbook:BTC/USDT')
+    orderbook['bids'].store(4, 1)
+    orderbook['bids'].store(3, 0)
+    client.resolve(orderbook, 'orderbook:BTC/USDT')
+    assert (await pending)['bids'] == [[3, 1], [2, 1]]
+    assert (await books.__anext__())['bids'] == [[4, 1], [2, 1]]
+    # a blocking consumer pauses the client instead of losing updates
+    blocking = exchange.stream_trades('ETH/USDT', maxSize=1, overflow='block')
+    pending = asyncio.ensure_future(blocking.__anext__())
+    await settle()
+    client.resolve({'id': 1}, 'trades:ETH/USDT')
+    assert (await pending) == {'id': 1}
+    client.resolve({'id': 2}, 'trades:ETH/USDT')
+    assert client.backpressure is None
+    client.resolve({'id': 3}, 'trades:ETH/USDT')
+    assert client.backpressure is not None and not client.backpressure.done()
+    assert (await blocking.__anext__()) == {'id': 2}
+    assert not client.backpressure.done()
+    assert (await blocking.__anext__()) == {'id': 3}
+    assert client.backpressure.done()
+    assert blocking.dropped == 0
+    # errors reach every consumer of the hash
+    pending = asyncio.ensure_future(fast.__anext__())
+    await settle()
+    client.futures.pop('authenticated').cancel()
+    client.reject(NetworkError('connection lost'))
+    try:
+        await pending
+        assert False
+    except NetworkError:
+        pass
+    for stream in [fast, latest, trades, btc, every, books, blocking]:
+        stream.close()
+    assert client.streams == {}
+    del exchange.clients[url]
+    await exchange.close()
+
+
+def test_stream():
+    asyncio.run(test_stream_async())
@@ -8,13 +8,25 @@ from asyncio import run
 
 from ccxt.pro.test.base.test_order_book import test_ws_order_book  # noqa: F401
 from ccxt.pro.test.base.test_cache import test_ws_cache  # noqa: F401
+from ccxt.pro.test.base.test_cache_by_key import test_cache_by_key  # noqa: F401
+from ccxt.pro.test.base.test_sorted_order_book import test_sorted_order_book  # noqa: F401
+from ccxt.pro.test.base.test_columnar_order_book import test_columnar_order_book  # noqa: F401
+from ccxt.pro.test.base.test_stream import test_stream  # noqa: F401
+from ccxt.pro.test.base.test_decode import test_decode  # noqa: F401
+from ccxt.pro.test.base.test_route import test_route  # noqa: F401
 # todo : from ccxt.pro.test.base.test_close import test_ws_close  # noqa: F401
 from ccxt.pro.test.base.test_future import test_ws_future  # noqa: F401
 from ccxt.pro.test.base.test_abnormal_close import test_abnormal_close  # noqa: F401
 
 def test_base_init_ws():
     test_ws_order_book()
+    test_sorted_order_book()
+    test_columnar_order_book()
     test_ws_cache()
+    test_cache_by_key()
+    test_stream()
+    test_decode()
+    test_route()
     # todo : run(test_ws_close())
     run(test_ws_future())
     # run(test_abnormal_close()) stays in infinite loop in travis
@@ -1,3 +1,50 @@
-from .keccak import SHA3
+from .keccak import SHA3 as python_sha3
+
+# keccak-256 of pycryptodome, pycryptodomex, pysha3 or openssl 3.2+, the first one installed is used for bytes-like input
+# hashlib.sha3_256 is the NIST variant with another padding, it is not keccak-256
+native = None
+native_resolved = False
+empty_digest = bytes.fromhex('c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470')
+
+
+def native_candidates():
+    try:
+        from Crypto.Hash import keccak as pycryptodome_keccak
+        yield lambda data: pycryptodome_keccak.new(data=data, digest_bits=256).digest()
+    except ImportError:
+        pass
+    try:
+        from Cryptodome.Hash import keccak as pycryptodomex_keccak
+        yield lambda data: pycryptodomex_keccak.new(data=data, digest_bits=256).digest()
+    except ImportError:
+        pass
+    try:
+        import sha3
+        yield lambda data: sha3.keccak_256(data).digest()
+    except ImportError:
+        pass
+    import hashlib
+    yield lambda data: hashlib.new('keccak-256', data).digest()
+
+
+def resolve_native():
+    global native, native_resolved
+    for candidate in native_candidates():
+        try:
+            if candidate(b'') == empty_digest and candidate(bytearray(b'ccxt')) == bytes(python_sha3(b'ccxt')):
+                native = candidate
+                break
+        except Exception:
+            pass
+    native_resolved = True
+    return native
+
+
+def SHA3(_input):
+    function = native if native_resolved else resolve_native()
+    if function is not None and isinstance(_input, (bytes, bytearray)):
+        return bytearray(function(_input))
+    return python_sha3(_input)
+
 
 __all__ = ['SHA3']
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NetworkError  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# a burst of 600 trades in the first second, then one trade every 50ms up to 20s, with three trades sharing a timestamp
+history = [{'id': 'b' + str(i), 'timestamp': 1000 + i} for i in range(0, 600)]
+history += [{'id': 't' + str(i), 'timestamp': 2000 + i * 50} for i in range(0, 360)]
+history += [{'id': 'same' + str(i), 'timestamp': 5000} for i in range(0, 3)]
+history.sort(key=lambda trade: trade['timestamp'])
+
+
+def trades_page(since, limit, params, oldest_first):
+    until = params.get('until')
+    entries = [trade for trade in history if (since is None or trade['timestamp'] >= since) and (until is None or trade['timestamp'] <= until)]
+    # some exchanges return the oldest entries of the range, the others the newest, whatever the paginationDirection option says
+    return entries[:limit] if oldest_first else entries[-limit:]
+
+
+class AdaptiveExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(AdaptiveExchange, self).describe(), {'id': 'adaptivetest'})
+
+    def __init__(self, config={}):
+        super(AdaptiveExchange, self).__init__(config)
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.failures = 1
+        self.oldest_first = False
+        self.counter_lock = threading.Lock()
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchTrades', 'paginate')
+        if paginate:
+            return self.fetch_paginated_call_dynamic('fetchTrades', symbol, since, limit, params, 100)
+        with self.counter_lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            failure = self.failures > 0
+            self.failures -= 1
+        time.sleep(0.01)
+        with self.counter_lock:
+            self.active -= 1
+        if failure:
+            raise NetworkError('connection reset')
+        return trades_page(since, limit, params, self.oldest_first)
+
+
+class AsyncAdaptiveExchange(AsyncExchange):
+    def describe(self):
+        return self.deep_extend(super(AsyncAdaptiveExchange, self).describe(), {'id': 'adaptivetest'})
+
+    def __init__(self, config={}):
+        super(AsyncAdaptiveExchange, self).__init__(config)
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.oldest_first = False
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchTrades', 'paginate')
+        if paginate:
+            return await self.fetch_paginated_call_dynamic('fetchTrades', symbol, since, limit, params, 100)
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return trades_page(since, limit, params, self.oldest_first)
+
+
+def expected_ids(since, until):
+    return [trade['id'] for trade in history if since <= trade['timestamp'] <= until]
+
+
+def test_adaptive_pagination_sync():
+    for direction, oldest_first in [('backward', False), ('forward', True), ('backward', True), ('forward', False)]:
+        # the covered end of a full window is read from the timestamps, the option does not have to match the api
+        exchange = AdaptiveExchange({'enableRateLimit': False, 'options': {'paginationDirection': direction}})
+        exchange.oldest_first = oldest_first
+        trades = exchange.fetch_trades('BTC/USDT', 1000, None, {'paginate': True, 'until': 19999, 'paginationConcurrency': 4, 'paginationCalls': 100})
+        # every trade of the range exactly once and in order, the full windows were subdivided until they were not full
+        assert [trade['id'] for trade in trades] == expected_ids(1000, 19999)
+        assert 1 < exchange.max_active <= 4
+        assert exchange.calls < 40
+        exchange.close()
+    # the concurrency is capped by what the rate limiter releases per second
+    assert AdaptiveExchange({'rateLimit': 250}).pagination_concurrency(10) == 4
+    assert AdaptiveExchange({'rateLimit': 2000}).pagination_concurrency(10) == 1
+    # paginationCalls still bounds the number of requests
+    exchange = AdaptiveExchange({'enableRateLimit': False})
+    exchange.fetch_trades('BTC/USDT', 1000, None, {'paginate': True, 'until': 19999, 'paginationConcurrency': 4, 'paginationCalls': 5})
+    assert exchange.calls == 5
+    exchange.close()
+    # an oldest-first api under the default option
+    exchange = AdaptiveExchange({'enableRateLimit': False})
+    exchange.oldest_first = True
+    trades = exchange.fetch_trades('BTC/USDT', 1000, None, {'paginate': True, 'until': 19999, 'paginationConcurrency': 4, 'paginationCalls': 100})
+    assert len(trades) == len(history)
+    exchange.close()
+    # paginated calls on the batch workers do not wait for windows queued behind them on the same pool
+    exchange = AdaptiveExchange({'enableRateLimit': False, 'options': {'batch': {'maxWorkers': 2}}})
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(exchange.gather([
+        ['fetch_trades', 'BTC/USDT', 1000, None, {'paginate': True, 'until': 19999, 'paginationConcurrency': 4, 'paginationCalls': 100}],
+        ['fetch_trades', 'ETH/USDT', 1000, None, {'paginate': True, 'until': 19999, 'paginationConcurrency': 4, 'paginationCalls': 100}],
+    ])), daemon=True)
+    thread.start()
+    thread.join(30)
+    assert not thread.is_alive()
+    assert [len(result) for result in results] == [len(history), len(history)]
+    exchange.close()
+
+
+async def test_adaptive_pagination_async():
+    exchange = AsyncAdaptiveExchange({'enableRateLimit': False})
+    trades = await exchange.fetch_trades('BTC/USDT', 1500, 50, {'paginate': True, 'until': 19999, 'paginationConcurrency': 8, 'paginationCalls': 100})
+    assert [trade['id'] for trade in trades] == expected_ids(1500, 19999)[:50]
+    assert 1 < exchange.max_active <= 8
+    # without a concurrency the range is walked one page at a time like before
+    serial = AsyncAdaptiveExchange({'enableRateLimit': False})
+    trades = await serial.fetch_trades('BTC/USDT', 1000, None, {'paginate': True, 'until': 19999, 'paginationCalls': 100})
+    # it steps below the oldest ms of every page, the other trades of that ms are skipped
+    assert set(trade['id'] for trade in trades) == set(expected_ids(1000, 19999)) - set(['same0', 'same1', 't60'])
+    assert serial.max_active == 1
+    await exchange.close()
+    await serial.close()
+
+
+def test_adaptive_pagination():
+    test_adaptive_pagination_sync()
+    asyncio.run(test_adaptive_pagination_async())
@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+import time
+from requests import Session
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import BadSymbol  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+
+class ClosingSession(Session):
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super(ClosingSession, self).close()
+
+
+class BatchExchange(Exchange):
+    def __init__(self, config={}):
+        super(BatchExchange, self).__init__(config)
+        self.loads = 0
+        self.threads = set()
+
+    def fetch_markets(self, params={}):
+        self.loads += 1
+        time.sleep(0.02)
+        return [{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True}]
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': 'https://api.test/' + path, 'method': method, 'body': body, 'headers': headers}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return {'url': url}
+
+    def fetch_ticker(self, symbol, params={}):
+        self.load_markets()
+        if symbol not in self.markets:
+            raise BadSymbol(symbol)
+        return self.fetch2('ticker')
+
+
+def test_batch():
+    exchange = BatchExchange({'id': 'batchtest', 'enableRateLimit': False, 'options': {'batch': {'maxWorkers': 8, 'poolSize': 16}}})
+    assert exchange.session.get_adapter('https://api.test').poolmanager.connection_pool_kw['maxsize'] == 16
+    start = time.time()
+    results = exchange.batch('fetch_ticker', ['BTC/USDT'] * 7 + ['LTC/USDT'])
+    elapsed = time.time() - start
+    # results and exceptions come back in the order of the calls
+    assert results[:7] == [{'url': 'https://api.test/ticker'}] * 7
+    assert isinstance(results[7], BadSymbol)
+    # the calls ran side by side and the markets were loaded once
+    assert elapsed < 0.2
+    assert exchange.loads == 1
+    assert len(exchange.threads) > 1
+    mixed = exchange.gather([
+        ['fetch_ticker', 'BTC/USDT'],
+        [exchange.fetch2, 'time'],
+        lambda: 'done',
+    ])
+    assert mixed == [{'url': 'https://api.test/ticker'}, {'url': 'https://api.test/time'}, 'done']
+    # the rate limiter still spaces the requests of concurrent calls
+    limited = BatchExchange({'id': 'batchtest', 'rateLimit': 20})
+    start = time.time()
+    limited.batch('fetch2', ['time'] * 6)
+    assert time.time() - start > 0.08
+    # every instance guards its own executors
+    assert exchange.batch_executor_lock is not limited.batch_executor_lock
+    exchange.close()
+    limited.close()
+    assert exchange.batch_executor is None
+    # a session passed in the config belongs to the caller and stays open
+    session = ClosingSession()
+    supplied = BatchExchange({'id': 'batchtest', 'session': session})
+    supplied.close()
+    assert not session.closed
+    assert exchange.own_session and not supplied.own_session
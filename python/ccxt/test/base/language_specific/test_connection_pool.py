@@ -0,0 +1,67 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import web  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.connection_pool import ConnectionPool  # noqa: E402
+
+
+class PoolExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(PoolExchange, self).describe(), {'id': 'pooltest'})
+
+
+async def test_connection_pool_async():
+    async def handler(request):
+        return web.json_response({'ok': True})
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    origin = 'http://127.0.0.1:' + str(port)
+    urls = {'api': {'public': origin + '/api/v3', 'private': origin + '/api/v3', 'ws': 'wss://127.0.0.1/ws'}}
+    options = {'connectionPool': {'limitPerHost': 4}}
+    first = PoolExchange({'urls': urls, 'options': options})
+    second = PoolExchange({'urls': urls, 'options': options})
+    isolated = PoolExchange({'urls': urls})
+    try:
+        assert first.api_origins() == [origin]
+        assert (await first.prewarm(3)) == {origin: 3}
+        pool = first.connection_pool
+        metrics = pool.metrics()['127.0.0.1']
+        assert metrics['opened'] == 3
+        assert metrics['idle'] == 3
+        assert metrics['active'] == 0
+        assert metrics['limit'] == 4
+        # instances with the same settings share the connections opened by the prewarm
+        second.open()
+        assert second.connection_pool is pool
+        assert pool.users == 2
+        assert (await second.fetch(origin + '/api/v3/time')) == {'ok': True}
+        metrics = pool.metrics()['127.0.0.1']
+        assert metrics['opened'] == 3
+        assert metrics['reused'] == 1
+        # instances without the option keep a connector of their own
+        isolated.open()
+        assert isolated.connection_pool is None
+        assert isolated.tcp_connector is not None
+        await first.close()
+        assert not pool.connector.closed
+        await second.close()
+        assert pool.connector.closed
+        assert ConnectionPool.registry == {}
+    finally:
+        await isolated.close()
+        await runner.cleanup()
+
+
+def test_connection_pool():
+    asyncio.run(test_connection_pool_async())
@@ -0,0 +1,28 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+
+
+def test_describe_cache():
+    # the instances of a class are built from one cached describe() and share none of its dicts or lists
+    first = ccxt.binance()
+    first.options['fetchMarkets'].remove('inverse')
+    first.options['networks']['ERC20'] = 'changed'
+    first.precisionMode = None
+    second = ccxt.binance()
+    assert 'inverse' in second.options['fetchMarkets']
+    assert second.options['networks']['ERC20'] == 'ETH'
+    assert second.precisionMode is not None
+    assert second.options['fetchMarkets'] is not first.options['fetchMarkets']
+    # the config is merged like deep_extend(describe(), config)
+    fetch_markets = ['spot']
+    configured = ccxt.binance({'options': {'fetchMarkets': fetch_markets, 'defaultType': 'future'}, 'timeout': 5000})
+    assert configured.options['fetchMarkets'] is fetch_markets
+    assert configured.options['defaultType'] == 'future'
+    assert configured.options['networks']['ERC20'] == 'ETH'
+    assert configured.timeout == 5000
+    assert ccxt.binance().options['defaultType'] == 'spot'
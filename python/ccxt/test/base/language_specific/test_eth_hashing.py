@@ -0,0 +1,68 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.static_dependencies import keccak  # noqa: E402
+from ccxt.static_dependencies.ethereum import account  # noqa: E402
+
+domain = {'name': 'Ether Mail', 'version': '1', 'chainId': 1, 'verifyingContract': '0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC'}
+types = {
+    'Person': [{'name': 'name', 'type': 'string'}, {'name': 'wallet', 'type': 'address'}],
+    'Mail': [{'name': 'from', 'type': 'Person'}, {'name': 'to', 'type': 'Person'}, {'name': 'contents', 'type': 'string'}],
+}
+
+
+def mail(contents):
+    return {
+        'from': {'name': 'Cow', 'wallet': '0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826'},
+        'to': {'name': 'Bob', 'wallet': '0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB'},
+        'contents': contents,
+    }
+
+
+def encode_without_cache(domain, types, message):
+    encoded = account.messages.encode_typed_data(domain, types, message)
+    return Exchange.binary_concat(b'\x19\x01', encoded.header, encoded.body)
+
+
+def test_keccak():
+    python_keccak = keccak.python_sha3
+    for data in [b'', b'abc', bytearray(b'ccxt' * 100)]:
+        assert keccak.SHA3(data) == python_keccak(data)
+        assert type(keccak.SHA3(data)) is bytearray
+    # the other inputs of the static dependency still go through it
+    assert keccak.SHA3([0x61, 0x62, 0x63]) == python_keccak(b'abc')
+    assert Exchange.hash(b'', 'keccak') == 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'
+
+
+def test_eth_encode_structured_data():
+    Exchange.eth_domain_separators.clear()
+    Exchange.eth_message_types.clear()
+    first = Exchange.eth_encode_structured_data(domain, types, mail('Hello, Bob!'))
+    assert Exchange.hash(first, 'keccak') == 'be609aee343fb3c4b28e1df9e632fca64fcfaede20f02e86244efddf30957bd2'
+    assert first == encode_without_cache(domain, types, mail('Hello, Bob!'))
+    # the domain separator and the type hashes are kept, only the message is hashed again
+    assert len(Exchange.eth_domain_separators) == 1
+    primary_type, type_hashes = list(Exchange.eth_message_types.values())[0]
+    assert primary_type == 'Mail'
+    assert sorted(type_hashes.keys()) == ['Mail', 'Person']
+    second = Exchange.eth_encode_structured_data(dict(domain), dict(types), mail('Hello, Alice!'))
+    assert second == encode_without_cache(domain, types, mail('Hello, Alice!'))
+    assert len(Exchange.eth_domain_separators) == 1
+    assert len(Exchange.eth_message_types) == 1
+    # a different chain is a different domain
+    Exchange.eth_encode_structured_data(Exchange.extend(domain, {'chainId': 2}), types, mail('Hello, Bob!'))
+    assert len(Exchange.eth_domain_separators) == 2
+    try:
+        Exchange.eth_encode_structured_data({'unknown': 1}, types, mail(''))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_eth_hashing():
+    test_keccak()
+    test_eth_encode_structured_data()
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import web  # noqa: E402
+from multidict import CIMultiDict, CIMultiDictProxy  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+
+class ResponseExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(ResponseExchange, self).describe(), {'id': 'responsetest'})
+
+    def handle_errors(self, code, reason, url, method, headers, body, response, request_headers, request_body):
+        self.handled = (body, response)
+
+    def on_json_response(self, response_body):
+        self.parsed = type(response_body)
+        return super(ResponseExchange, self).on_json_response(response_body)
+
+
+class TextHookExchange(ResponseExchange):
+    def on_rest_response(self, code, reason, url, method, response_headers, response_body, request_headers, request_body):
+        return response_body.replace('"a"', '"b"').strip()
+
+
+async def test_fetch_response_async():
+    async def handler(request):
+        path = request.match_info['path']
+        if path == 'json':
+            headers = CIMultiDict([('Set-Cookie', 'a=1'), ('Set-Cookie', 'b=2')])
+            return web.Response(body=' \n{"a": "€"}\n'.encode('utf-8'), content_type='application/json', headers=headers)
+        if path == 'gbk':
+            return web.Response(body='{"a": "中"}'.encode('gbk'), content_type='application/json', charset='gbk')
+        if path == 'text':
+            return web.Response(text='pong')
+        return web.Response(body=b'{"a": tr', content_type='application/json')
+
+    app = web.Application()
+    app.router.add_get('/{path}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    origin = 'http://127.0.0.1:' + str(runner.addresses[0][1]) + '/'
+    exchange = ResponseExchange()
+    hooked = TextHookExchange()
+    try:
+        # the hooks see the stripped text
+        assert (await exchange.fetch(origin + 'json')) == {'a': '€'}
+        assert exchange.handled == ('{"a": "€"}', {'a': '€'})
+        assert exchange.last_http_response == '{"a": "€"}'
+        assert exchange.last_json_response == {'a': '€'}
+        # utf-8 json is parsed from the body bytes
+        assert exchange.parsed is bytes
+        # repeated headers are handled like before
+        raw_headers = CIMultiDictProxy(CIMultiDict([('Set-Cookie', 'a=1'), ('Set-Cookie', 'b=2'), ('Date', 'now')]))
+        joined = {}
+        for header in raw_headers:
+            joined[header] = (joined[header] + ', ' + raw_headers[header]) if header in joined else raw_headers[header]
+        assert Exchange.join_response_headers(raw_headers) == joined
+        assert 'Set-Cookie' in exchange.last_response_headers
+        # the charset of the response is honoured
+        assert (await exchange.fetch(origin + 'gbk')) == {'a': '中'}
+        assert exchange.parsed is str
+        assert (await exchange.fetch(origin + 'text')) == 'pong'
+        assert exchange.handled == ('pong', None)
+        # a malformed json body is passed on as text
+        assert (await exchange.fetch(origin + 'broken')) == '{"a": tr'
+        # exchanges can rewrite the text before it is parsed
+        assert (await hooked.fetch(origin + 'json')) == {'b': '€'}
+        assert hooked.parsed is str
+    finally:
+        await exchange.close()
+        await hooked.close()
+        await runner.cleanup()
+
+
+def test_fetch_response():
+    asyncio.run(test_fetch_response_async())
@@ -0,0 +1,197 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# trades 1..25 one second apart, served in ascending pages of 10 below params['until'] or from since
+history = [{'id': str(i), 'timestamp': i * 1000, 'price': i} for i in range(1, 26)]
+
+
+def page_until(since, params, limit):
+    # the pages overlap by one entry, like exchanges that treat since and until loosely
+    if since is not None:
+        return [trade for trade in history if trade['timestamp'] >= since - 1000][:limit]
+    until = params.get('until')
+    entries = history if until is None else [trade for trade in history if trade['timestamp'] <= until + 1000]
+    return entries[-limit:]
+
+
+def candles_page(since, limit, params):
+    # one minute candles from since up to params['until']
+    start = -(-since // 60000) * 60000
+    return [[start + i * 60000, 1, 1, 1, 1, 1] for i in range(0, limit) if start + i * 60000 <= params['until']]
+
+
+def ledger_page(params):
+    # pages of three entries, oldest first, numbered from 1
+    page = params['page']
+    entries = [{'id': 'L' + str(i), 'timestamp': i} for i in range(10 - page * 3, 10 - page * 3 + 3) if i > 0]
+    return entries
+
+
+class IterateExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(IterateExchange, self).describe(), {'id': 'iteratetest'})
+
+    def __init__(self, config={}):
+        super(IterateExchange, self).__init__(config)
+        self.calls = 0
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchTrades', 'paginate')
+        if paginate:
+            return self.fetch_paginated_call_dynamic('fetchTrades', symbol, since, limit, params, 10)
+        self.calls += 1
+        return page_until(since, params, limit or 10)
+
+    def fetch_ledger(self, code=None, since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchLedger', 'paginate')
+        if paginate:
+            return self.fetch_paginated_call_incremental('fetchLedger', code, since, limit, params, 'page', 3)
+        self.calls += 1
+        return ledger_page(params)
+
+    def fetch_deposits(self, code=None, since=None, limit=None, params={}):
+        self.calls += 1
+        return [{'id': 'D1', 'timestamp': 1}]
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchOHLCV', 'paginate')
+        if paginate:
+            return self.fetch_paginated_call_deterministic('fetchOHLCV', symbol, since, limit, timeframe, params, 5)
+        self.calls += 1
+        return candles_page(since, limit, params)
+
+
+class AsyncIterateExchange(AsyncExchange):
+    def describe(self):
+        return self.deep_extend(super(AsyncIterateExchange, self).describe(), {'id': 'iteratetest'})
+
+    def __init__(self, config={}):
+        super(AsyncIterateExchange, self).__init__(config)
+        self.calls = 0
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchTrades', 'paginate')
+        if paginate:
+            return await self.fetch_paginated_call_dynamic('fetchTrades', symbol, since, limit, params, 10)
+        self.calls += 1
+        await asyncio.sleep(0)
+        return page_until(since, params, limit or 10)
+
+    async def fetch_ledger(self, code=None, since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchLedger', 'paginate')
+        if paginate:
+            return await self.fetch_paginated_call_incremental('fetchLedger', code, since, limit, params, 'page', 3)
+        self.calls += 1
+        return ledger_page(params)
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        paginate = False
+        paginate, params = self.handle_option_and_params(params, 'fetchOHLCV', 'paginate')
+        if paginate:
+            return await self.fetch_paginated_call_deterministic('fetchOHLCV', symbol, since, limit, timeframe, params, 5)
+        self.calls += 1
+        return candles_page(since, limit, params)
+
+
+def ids(entries):
+    return [entry['id'] for entry in entries]
+
+
+def newest_first(start, stop):
+    return [str(i) for i in range(stop - 1, start - 1, -1)]
+
+
+def candles_range(exchange):
+    # twenty candles of the last hour, the deterministic pagination does not reach further back than paginationCalls pages
+    since = (exchange.milliseconds() // 60000 - 30) * 60000
+    return since, since + 20 * 60000 - 1
+
+
+def test_iterate_pages_sync():
+    exchange = IterateExchange()
+    # the collected call is unchanged
+    collected = exchange.fetch_trades('BTC/USDT', None, None, {'paginate': True, 'paginationCalls': 4})
+    assert ids(collected) == [str(i) for i in range(16, 26)] + [str(i) for i in range(7, 16)] + [str(i) for i in range(1, 7)]
+    assert exchange.calls == 4
+    # the pages come one request at a time, the overlapping entries are dropped
+    # a backward pagination starts from the newest page and yields its entries newest first too
+    exchange.calls = 0
+    pages = exchange.iterate_trades('BTC/USDT', None, None, {'paginationCalls': 4})
+    first = next(pages)
+    assert ids(first) == newest_first(16, 26)
+    assert exchange.calls == 1
+    assert [ids(page) for page in pages] == [newest_first(7, 16), newest_first(1, 7)]
+    assert exchange.calls == 4
+    # since and limit apply to the whole iteration, which stops as soon as the limit is reached
+    exchange.calls = 0
+    pages = list(exchange.iterate_trades('BTC/USDT', 12000, 12, {'paginationCalls': 4}))
+    assert [ids(page) for page in pages] == [newest_first(16, 26), ['15', '14']]
+    assert exchange.calls == 2
+    # a forward pagination yields the entries oldest first
+    pages = list(exchange.iterate_trades('BTC/USDT', 1000, None, {'paginationCalls': 4, 'paginationDirection': 'forward'}))
+    assert [ids(page) for page in pages] == [[str(i) for i in range(1, 11)], [str(i) for i in range(11, 20)], [str(i) for i in range(20, 26)]]
+    # the overlapping entries are next to each other, the dedup window is bounded
+    pages = list(exchange.iterate_trades('BTC/USDT', None, None, {'paginationCalls': 2, 'paginationDedupSize': 1}))
+    assert [ids(page) for page in pages] == [newest_first(16, 26), newest_first(7, 16)]
+    pages = list(exchange.iterate_trades('BTC/USDT', None, None, {'paginationCalls': 2, 'paginationDedupSize': 0}))
+    assert [ids(page) for page in pages] == [newest_first(16, 26), newest_first(7, 17)]
+    # cursor and incremental pages are sorted like the collected result
+    pages = list(exchange.iterate_ledger(None, None, None, {'paginationCalls': 5}))
+    assert [ids(page) for page in pages] == [['L9', 'L8', 'L7'], ['L6', 'L5', 'L4'], ['L3', 'L2', 'L1']]
+    # the collected call goes through the same pages
+    exchange.calls = 0
+    assert ids(exchange.fetch_ledger(None, None, 5, {'paginate': True, 'paginationCalls': 5})) == ['L9', 'L8', 'L7', 'L6', 'L5']
+    assert exchange.calls == 4
+    # the deterministic pagination splits since..until into pages fetched in parallel
+    since, until = candles_range(exchange)
+    candles = exchange.fetch_ohlcv('BTC/USDT', '1m', since, None, {'paginate': True, 'until': until})
+    assert [candle[0] for candle in candles] == [since + i * 60000 for i in range(0, 20)]
+    pages = list(exchange.iterate_ohlcv('BTC/USDT', '1m', since, None, {'until': until}))
+    assert sum(len(page) for page in pages) == 20
+    # a method the exchange does not paginate yields its response as the only page
+    exchange.calls = 0
+    assert list(exchange.iterate_deposits()) == [[{'id': 'D1', 'timestamp': 1}]]
+    assert exchange.calls == 1
+
+
+async def test_iterate_pages_async():
+    exchange = AsyncIterateExchange()
+    collected = await exchange.fetch_trades('BTC/USDT', None, None, {'paginate': True, 'paginationCalls': 4})
+    assert len(collected) == 25
+    exchange.calls = 0
+    pages = exchange.iterate_trades('BTC/USDT', None, None, {'paginationCalls': 4})
+    first = await pages.__anext__()
+    assert ids(first) == newest_first(16, 26)
+    assert exchange.calls == 1
+    assert [ids(page) async for page in pages] == [newest_first(7, 16), newest_first(1, 7)]
+    pages = [page async for page in exchange.iterate_trades('BTC/USDT', 12000, 12, {'paginationCalls': 4})]
+    assert [ids(page) for page in pages] == [newest_first(16, 26), ['15', '14']]
+    pages = [page async for page in exchange.iterate_trades('BTC/USDT', 1000, None, {'paginationCalls': 4, 'paginationDirection': 'forward'})]
+    assert [ids(page) for page in pages] == [[str(i) for i in range(1, 11)], [str(i) for i in range(11, 20)], [str(i) for i in range(20, 26)]]
+    since, until = candles_range(exchange)
+    candles = await exchange.fetch_ohlcv('BTC/USDT', '1m', since, None, {'paginate': True, 'until': until})
+    assert [candle[0] for candle in candles] == [since + i * 60000 for i in range(0, 20)]
+    pages = [page async for page in exchange.iterate_ohlcv('BTC/USDT', '1m', since, None, {'until': until})]
+    assert sum(len(page) for page in pages) == 20
+    pages = [page async for page in exchange.iterate_ledger(None, None, None, {'paginationCalls': 5})]
+    assert [ids(page) for page in pages] == [['L9', 'L8', 'L7'], ['L6', 'L5', 'L4'], ['L3', 'L2', 'L1']]
+    collected = await exchange.fetch_ledger(None, None, 5, {'paginate': True, 'paginationCalls': 5})
+    assert ids(collected) == ['L9', 'L8', 'L7', 'L6', 'L5']
+    await exchange.close()
+
+
+def test_iterate_pages():
+    test_iterate_pages_sync()
+    asyncio.run(test_iterate_pages_async())
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+
+def market(base, quote):
+    return {
+        'id': base + quote,
+        'symbol': base + '/' + quote,
+        'base': base,
+        'quote': quote,
+        'baseId': base,
+        'quoteId': quote,
+        'type': 'spot',
+        'spot': True,
+        'linear': None,
+        'inverse': None,
+        'precision': {'amount': 8, 'price': 2},
+    }
+
+
+class CountingExchange(Exchange):
+    listed = [market('BTC', 'USDT'), market('ETH', 'USDT')]
+    calls = 0
+
+    def fetch_markets(self, params={}):
+        self.calls += 1
+        return self.listed
+
+    def describe(self):
+        return self.deep_extend(super(CountingExchange, self).describe(), {'id': 'cachetest'})
+
+
+class AsyncCountingExchange(AsyncExchange):
+    listed = [market('BTC', 'USDT'), market('ETH', 'USDT')]
+    calls = 0
+
+    async def fetch_markets(self, params={}):
+        self.calls += 1
+        return self.listed
+
+    def describe(self):
+        return self.deep_extend(super(AsyncCountingExchange, self).describe(), {'id': 'cachetest'})
+
+
+def test_markets_cache_sync(directory):
+    options = {'marketsCache': {'directory': directory}}
+    first = CountingExchange({'options': options})
+    first.load_markets()
+    assert first.calls == 1
+    path = first.markets_cache_path()
+    assert os.path.exists(path)
+    second = CountingExchange({'options': options})
+    second.load_markets()
+    assert second.calls == 0
+    assert second.markets == first.markets
+    assert second.markets_by_id == first.markets_by_id
+    assert second.currencies == first.currencies
+    assert second.currencies_by_id == first.currencies_by_id
+    assert second.currencies_by_id['BTC'] is second.currencies['BTC']
+    assert second.symbols == ['BTC/USDT', 'ETH/USDT']
+    assert second.codes == ['BTC', 'ETH', 'USDT']
+    # an expired cache is refreshed inline
+    expired = CountingExchange({'options': {'marketsCache': {'directory': directory, 'ttl': -1}}})
+    expired.load_markets()
+    assert expired.calls == 1
+    # a different api endpoint does not share the file
+    sandbox = CountingExchange({'options': options, 'urls': {'api': 'https://testnet.example.com'}})
+    assert sandbox.markets_cache_path() != path
+    # the file is json and only the current user can write it
+    with open(path, 'rb') as f:
+        assert f.read(1) == b'{'
+    if hasattr(os, 'getuid'):
+        assert os.stat(path).st_mode & 0o077 == 0
+        os.chmod(path, 0o666)
+        shared = CountingExchange({'options': options})
+        shared.load_markets()
+        assert shared.calls == 1
+        assert os.stat(path).st_mode & 0o077 == 0
+    # a corrupt file is a cache miss
+    with open(path, 'wb') as f:
+        f.write(b'not json')
+    corrupt = CountingExchange({'options': options})
+    corrupt.load_markets()
+    assert corrupt.calls == 1
+    # the cache is opt-in
+    disabled = CountingExchange()
+    assert disabled.markets_cache_path() is None
+    disabled.load_markets()
+    assert disabled.calls == 1
+
+
+async def test_markets_cache_async(directory):
+    warm = AsyncCountingExchange({'options': {'marketsCache': {'directory': directory}}})
+    await warm.load_markets()
+    assert warm.calls == 1
+    # a stale cache is served right away and refreshed in the background
+    stale = AsyncCountingExchange({'options': {'marketsCache': {'directory': directory, 'ttl': -1}}})
+    stale.listed = stale.listed + [market('LTC', 'USDT')]
+    markets = await stale.load_markets()
+    assert list(markets.keys()) == ['BTC/USDT', 'ETH/USDT']
+    await stale.markets_cache_refresher
+    assert stale.calls == 1
+    assert 'LTC/USDT' in stale.markets
+    fresh = AsyncCountingExchange({'options': {'marketsCache': {'directory': directory}}})
+    await fresh.load_markets()
+    assert fresh.calls == 0
+    assert 'LTC/USDT' in fresh.markets
+    await warm.close()
+    await stale.close()
+    await fresh.close()
+
+
+def test_markets_cache_directory(directory):
+    # by default the files go to a private directory in the cache directory of the user
+    if os.name == 'nt':
+        return
+    previous = os.environ.get('XDG_CACHE_HOME')
+    os.environ['XDG_CACHE_HOME'] = directory
+    try:
+        exchange = CountingExchange({'options': {'marketsCache': True}})
+        exchange.load_markets()
+        path = exchange.markets_cache_path()
+        assert os.path.dirname(path) == os.path.join(directory, 'ccxt')
+        assert os.path.exists(path)
+        assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+    finally:
+        if previous is None:
+            del os.environ['XDG_CACHE_HOME']
+        else:
+            os.environ['XDG_CACHE_HOME'] = previous
+
+
+def test_markets_cache():
+    with tempfile.TemporaryDirectory() as directory:
+        test_markets_cache_directory(directory)
+    with tempfile.TemporaryDirectory() as directory:
+        test_markets_cache_sync(directory)
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(test_markets_cache_async(directory))
@@ -0,0 +1,125 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+
+def market(marketId, base, quote, type, settle=None, active=True):
+    contract = type != 'spot'
+    return {
+        'id': marketId,
+        'symbol': base + '/' + quote + ((':' + settle) if settle else ''),
+        'base': base,
+        'quote': quote,
+        'settle': settle,
+        'type': type,
+        'spot': type == 'spot',
+        'swap': type == 'swap',
+        'future': False,
+        'option': False,
+        'contract': contract,
+        'linear': (settle == quote) if contract else None,
+        'inverse': (settle == base) if contract else None,
+        'active': active,
+        'precision': {'amount': 8, 'price': 2},
+        'limits': {'amount': {'min': 0.001}},
+        'info': {'filters': [{'tickSize': '0.01'}]},
+    }
+
+
+def test_set_markets():
+    exchange = Exchange({'id': 'indextest'})
+    exchange.set_markets([
+        market('BTCUSDT', 'BTC', 'USDT', 'swap', 'USDT'),
+        market('BTCUSDT', 'BTC', 'USDT', 'spot'),
+        market('ETHUSDT', 'ETH', 'USDT', 'spot', active=None),
+        market('BTCUSD', 'BTC', 'USD', 'swap', 'BTC', active=False),
+    ])
+    # spot markets take precedence on conflicting ids
+    assert [m['type'] for m in exchange.markets_by_id['BTCUSDT']] == ['spot', 'swap']
+    assert exchange.safe_market('ETHUSDT')['symbol'] == 'ETH/USDT'
+    assert exchange.safe_market('BTC_EUR', None, '_')['symbol'] == 'BTC/EUR'
+    assert exchange.safe_market('BTCUSDT', None, None, 'swap')['symbol'] == 'BTC/USDT:USDT'
+    assert exchange.symbols == ['BTC/USD:BTC', 'BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT']
+    assert exchange.ids == ['BTCUSD', 'BTCUSDT', 'ETHUSDT']
+    btc = exchange.markets['BTC/USDT']
+    assert btc['precision'] == {'amount': 8, 'price': 2, 'cost': None, 'base': None, 'quote': None}
+    assert btc['limits']['amount'] == {'min': 0.001, 'max': None}
+    assert btc['limits']['leverage'] == {'min': None, 'max': None}
+    assert exchange.markets['BTC/USDT:USDT']['subType'] == 'linear'
+    assert exchange.markets['BTC/USD:BTC']['subType'] == 'inverse'
+    assert btc['subType'] is None
+    # the defaults are copied into every market
+    btc['limits']['leverage']['max'] = 10
+    assert exchange.markets['ETH/USDT']['limits']['leverage'] == {'min': None, 'max': None}
+    assert exchange.get_symbols_for_market_type('spot') == ['BTC/USDT', 'ETH/USDT']
+    assert exchange.get_symbols_for_market_type('spot', None, True, False) == ['BTC/USDT']
+    assert exchange.get_symbols_for_market_type('swap', 'inverse') == []
+    assert exchange.get_symbols_for_market_type('swap', 'inverse', False, False) == ['BTC/USD:BTC']
+    assert exchange.get_symbols_for_market_type(None, 'linear') == ['BTC/USDT:USDT']
+    assert exchange.market_symbols(['ETH/USDT', 'BTCUSD']) == ['ETH/USDT', 'BTC/USD:BTC']
+
+
+def test_update_markets():
+    exchange = Exchange({'id': 'indextest', 'options': {'marketsReload': 'incremental'}})
+    exchange.set_markets([
+        market('BTCUSDT', 'BTC', 'USDT', 'spot'),
+        market('ETHUSDT', 'ETH', 'USDT', 'spot'),
+        market('LTCUSDT', 'LTC', 'USDT', 'spot'),
+    ])
+    btc = exchange.market('BTC/USDT')
+    eth = exchange.market('ETH/USDT')
+    received = []
+    exchange.subscribe_markets_changes(received.append)
+    tick = market('ETHUSDT', 'ETH', 'USDT', 'spot')
+    tick['precision']['price'] = 1
+    result = exchange.apply_markets([
+        market('BTCUSDT', 'BTC', 'USDT', 'spot'),
+        tick,
+        market('SOLUSDT', 'SOL', 'USDT', 'spot'),
+    ])
+    assert result is exchange.markets
+    assert received == [{
+        'listed': ['SOL/USDT'],
+        'delisted': ['LTC/USDT'],
+        'changed': {'ETH/USDT': {'precision.price': [2, 1]}},
+    }]
+    # references held by callers follow the reload
+    assert exchange.market('BTC/USDT') is btc
+    assert exchange.market('ETH/USDT') is eth
+    assert eth['precision']['price'] == 1
+    assert exchange.symbols == ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']
+    assert exchange.ids == ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']
+    assert exchange.markets_by_id['ETHUSDT'] == [tick]
+    assert 'SOL' in exchange.currencies
+    # an identical reload reports nothing
+    exchange.unsubscribe_markets_changes(received.append)
+    changes = exchange.update_markets([
+        market('BTCUSDT', 'BTC', 'USDT', 'spot'),
+        tick,
+        market('SOLUSDT', 'SOL', 'USDT', 'spot'),
+    ])
+    assert changes == {'listed': [], 'delisted': [], 'changed': {}}
+    assert len(received) == 1
+    # only the markets fetched differently are rebuilt, a swap sharing an id goes after the spot market
+    exchange.markets['SOL/USDT']['custom'] = True
+    changes = exchange.update_markets([
+        market('BTCUSDT', 'BTC', 'USDT', 'swap', 'USDT'),
+        market('BTCUSDT', 'BTC', 'USDT', 'spot', active=False),
+        tick,
+        market('SOLUSDT', 'SOL', 'USDT', 'spot'),
+    ])
+    assert changes == {'listed': ['BTC/USDT:USDT'], 'delisted': [], 'changed': {'BTC/USDT': {'active': [True, False]}}}
+    assert exchange.markets['SOL/USDT']['custom'] is True
+    assert exchange.market('BTC/USDT') is btc
+    assert [m['type'] for m in exchange.markets_by_id['BTCUSDT']] == ['spot', 'swap']
+    assert exchange.markets['BTC/USDT:USDT']['subType'] == 'linear'
+    assert exchange.symbols == ['BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT', 'SOL/USDT']
+
+
+def test_markets_index():
+    test_set_markets()
+    test_update_markets()
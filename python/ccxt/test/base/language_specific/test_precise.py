@@ -0,0 +1,83 @@
+import decimal
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base import precise  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+
+def random_string(generator):
+    value = generator.uniform(-1, 1) * 10 ** generator.randint(-10, 10)
+    kind = generator.randint(0, 3)
+    if kind == 0:
+        return repr(value)
+    if kind == 1:
+        return '%.*f' % (generator.randint(0, 12), value)
+    if kind == 2:
+        return str(generator.randint(-1000, 1000)) + 'e' + str(generator.randint(-12, 12))
+    return generator.choice(['0', '-0', '0.000', '1', '10', '-100', '1.50', '.5', '5.'])
+
+
+def test_precise_matches_objects():
+    # the string_* methods work on the parsed integers, the results are the same as with the Precise objects
+    generator = random.Random(3)
+    context = decimal.Context(prec=100)
+    for i in range(0, 5000):
+        a = random_string(generator)
+        b = random_string(generator)
+        assert Precise.string_mul(a, b) == str(Precise(a).mul(Precise(b)))
+        assert Precise.string_add(a, b) == str(Precise(a).add(Precise(b)))
+        assert Precise.string_sub(a, b) == str(Precise(a).sub(Precise(b)))
+        assert Precise.string_min(a, b) == str(Precise(a).min(Precise(b)))
+        assert Precise.string_max(a, b) == str(Precise(a).max(Precise(b)))
+        assert Precise.string_neg(a) == str(Precise(a).neg())
+        assert Precise.string_equals(a, b) == Precise(a).equals(Precise(b))
+        assert Precise.string_gt(a, b) == (context.compare(decimal.Decimal(a), decimal.Decimal(b)) > 0)
+        assert Precise.string_le(a, b) == (context.compare(decimal.Decimal(a), decimal.Decimal(b)) <= 0)
+        assert decimal.Decimal(Precise.string_add(a, b)) == context.add(decimal.Decimal(a), decimal.Decimal(b))
+        if Precise(b).integer != 0:
+            assert Precise.string_div(a, b, 12) == str(Precise(a).div(Precise(b), 12))
+        else:
+            assert Precise.string_div(a, b) is None
+
+
+def test_precise_strings():
+    assert Precise.string_mul('1.50', '2') == '3'
+    assert Precise.string_add('0.1', '0.2') == '0.3'
+    assert Precise.string_sub('-0.1', '0.00001') == '-0.10001'
+    assert Precise.string_mul('1e5', '3') == '300000'
+    assert Precise.string_div('-1', '3', 2) == '-0.33'
+    assert Precise.string_div('1', '0') is None
+    assert Precise.string_add(None, '1.0') == '1.0'
+    assert Precise.string_abs('-0.0010') == '0.001'
+    assert Precise.string_mod('5.5', '2') == '1.5'
+    assert Precise.string_equals('1.0', '1') is True
+    assert Precise.string_min('1.10', '2') == '1.1'
+    # the results and the parsed arguments are kept for the operations that follow
+    precise.parsed_numbers.clear()
+    cost = Precise.string_mul('123.45', '0.002')
+    assert cost == '0.2469'
+    assert precise.parsed_numbers[cost] == (2469, 4)
+    assert precise.parsed_numbers['123.45'] == (12345, 2)
+    assert Precise.string_mul('2', '500') == '1000'
+    assert precise.parsed_numbers['1000'] == (1000, 0)
+    # the objects are still mutable, the cached values are not shared with them
+    number = Precise('123.45')
+    number.decimals += 2
+    assert str(number) == '1.2345'
+    assert str(Precise('123.45')) == '123.45'
+    try:
+        Precise('1.5x')
+        assert False
+    except ValueError:
+        pass
+    assert not hasattr(number, '__dict__')
+
+
+def test_precise():
+    test_precise_matches_objects()
+    test_precise_strings()
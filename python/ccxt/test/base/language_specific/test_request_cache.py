@@ -0,0 +1,154 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NetworkError  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+
+def sign(exchange, path, api='public', method='GET', params={}, headers=None, body=None):
+    url = 'https://api.test/' + (api if isinstance(api, str) else '/'.join(api)) + '/' + path
+    if params:
+        url += '?' + exchange.urlencode(params)
+    return {'url': url, 'method': method, 'body': body, 'headers': headers}
+
+
+def respond(exchange, url):
+    # sets the last_* attributes like fetch() does
+    response = {'url': url, 'count': len(exchange.requested)}
+    exchange.last_http_response = exchange.json(response)
+    exchange.last_json_response = response
+    exchange.last_response_headers = {'X-Count': str(response['count'])}
+    return response
+
+
+class CountingExchange(Exchange):
+    def __init__(self, config={}):
+        super(CountingExchange, self).__init__(config)
+        self.requested = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return sign(self, path, api, method, params, headers, body)
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        self.requested.append(url)
+        self.gate.wait()
+        if 'fail' in url:
+            raise NetworkError('down')
+        return respond(self, url)
+
+
+class AsyncCountingExchange(AsyncExchange):
+    def __init__(self, config={}):
+        super(AsyncCountingExchange, self).__init__(config)
+        self.requested = []
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return sign(self, path, api, method, params, headers, body)
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        self.requested.append(url)
+        await asyncio.sleep(0.01)
+        if 'fail' in url:
+            raise NetworkError('down')
+        return respond(self, url)
+
+
+def test_request_cache_sync():
+    exchange = CountingExchange({'enableRateLimit': False, 'options': {'requestCache': {'ttl': 1000, 'endpoints': {'depth': 0}, 'maxSize': 2}}})
+    first = exchange.fetch2('ticker', 'public', 'GET', {'symbol': 'BTCUSDT'})
+    first_http_response = exchange.last_http_response
+    # identical public requests are served from the cache, parameter order does not matter
+    assert exchange.fetch2('ticker', 'public', 'GET', {'symbol': 'BTCUSDT'}) == first
+    # every caller gets its own copy and the last_* attributes of the cached response
+    hit = exchange.request('ticker', 'public', 'GET', {'symbol': 'BTCUSDT'})
+    assert hit == first and hit is not first
+    assert exchange.last_http_response == first_http_response
+    assert exchange.last_response_headers == {'X-Count': '1'}
+    assert exchange.last_json_response is hit
+    first['count'] = 0
+    hit['url'] = None
+    assert exchange.fetch2('ticker', 'public', 'GET', {'symbol': 'BTCUSDT'}) == {'url': 'https://api.test/public/ticker?symbol=BTCUSDT', 'count': 1}
+    assert exchange.fetch2('ticker', 'public', 'GET', {'symbol': 'ETHUSDT'}) != first
+    # private apis and other methods always reach the network
+    exchange.fetch2('account', 'private', 'GET')
+    exchange.fetch2('account', 'private', 'GET')
+    exchange.fetch2('order', 'public', 'POST')
+    assert len(exchange.requested) == 5
+    # the least recently used entry is evicted
+    exchange.fetch2('time', ['v3', 'public'], 'GET')
+    exchange.fetch2('ticker', 'public', 'GET', {'symbol': 'BTCUSDT'})
+    assert len(exchange.requested) == 7
+    assert exchange.request_cache_stats() == {'hits': 3, 'misses': 4, 'coalesced': 0, 'size': 2}
+    # concurrent threads asking for the same uncached endpoint share one request
+    exchange.gate.clear()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(exchange.fetch2('depth', 'public', 'GET', {'limit': 5}))) for i in range(0, 4)]
+    for thread in threads:
+        thread.start()
+    while len(exchange.requested) < 8:
+        time.sleep(0.001)
+    time.sleep(0.01)
+    exchange.gate.set()
+    for thread in threads:
+        thread.join()
+    assert len(exchange.requested) == 8
+    assert len(results) == 4 and all(result == results[0] for result in results)
+    assert len(set(id(result) for result in results)) == 4
+    assert exchange.request_cache_stats()['coalesced'] == 3
+    # a zero ttl coalesces without caching
+    exchange.fetch2('depth', 'public', 'GET', {'limit': 5})
+    assert len(exchange.requested) == 9
+    # errors are not cached
+    for i in range(0, 2):
+        try:
+            exchange.fetch2('fail', 'public', 'GET')
+            assert False
+        except NetworkError:
+            pass
+    assert len(exchange.requested) == 11
+    # the cache is opt-in
+    disabled = CountingExchange({'enableRateLimit': False})
+    disabled.fetch2('ticker', 'public', 'GET')
+    disabled.fetch2('ticker', 'public', 'GET')
+    assert len(disabled.requested) == 2
+    assert disabled.request_cache is None
+
+
+async def test_request_cache_async():
+    exchange = AsyncCountingExchange({'enableRateLimit': False, 'options': {'requestCache': {'ttl': 1000, 'apis': ['spotPublic']}}})
+    responses = await asyncio.gather(*[exchange.fetch2('ticker', 'spotPublic', 'GET', {'symbol': 'BTCUSDT'}) for i in range(0, 5)])
+    assert len(exchange.requested) == 1
+    assert all(response == responses[0] for response in responses)
+    assert len(set(id(response) for response in responses)) == 5
+    await exchange.fetch2('ticker', 'public', 'GET')
+    hit = await exchange.fetch2('ticker', 'spotPublic', 'GET', {'symbol': 'BTCUSDT'})
+    assert hit == responses[0] and hit is not responses[0]
+    assert exchange.last_response_headers == {'X-Count': '1'}
+    # only the apis listed in the options are shared
+    await asyncio.gather(exchange.fetch2('ticker', 'public', 'GET'), exchange.fetch2('ticker', 'public', 'GET'))
+    assert len(exchange.requested) == 4
+    # a cancelled caller leaves the shared request running for the others
+    first = asyncio.ensure_future(exchange.fetch2('depth', 'spotPublic', 'GET'))
+    second = asyncio.ensure_future(exchange.fetch2('depth', 'spotPublic', 'GET'))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert (await second)['url'] == 'https://api.test/spotPublic/depth'
+    # an error reaches every waiting caller
+    results = await asyncio.gather(*[exchange.fetch2('fail', 'spotPublic', 'GET') for i in range(0, 3)], return_exceptions=True)
+    assert all(isinstance(result, NetworkError) for result in results)
+    assert exchange.request_cache_stats() == {'hits': 1, 'misses': 3, 'coalesced': 7, 'size': 2}
+    await exchange.close()
+
+
+def test_request_cache():
+    test_request_cache_sync()
+    asyncio.run(test_request_cache_async())
@@ -0,0 +1,88 @@
+import decimal
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import InvalidOrder  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision, rounded_to_precision, rounder, Rounder  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+
+ticks = [0.01, 0.1, 0.5, 0.25, 0.05, 0.3, 0.003, 1, 5, 10, 100, 2.5, 1e-05, 1e-08, 1e-10, '0.01', '0.00000001', decimal.Decimal('0.01'), decimal.Decimal('0.010'), decimal.Decimal('1E+1'), 0, -0.1]
+places = [0, 1, 2, 3, 5, 8, 12, 18, 26, 27, -1, -2, 2.0]
+edge_values = [0, -0.0, '0', '-0', '-0.000', '0.5', '-0.5', '2.5', '-2.5', '0.15', '0.005', '-0.005', 0.15, 1.005, 2.675, '007.50', '-00.10', 1e-07, '1e-7', 1e21, '123456789012345678901234567890.5', '1.', '.5', ' 1.5', 'abc', None, True, float('nan')]
+
+
+def random_value(generator):
+    magnitude = 10 ** generator.randint(-9, 9)
+    value = generator.uniform(-1, 1) * magnitude
+    kind = generator.randint(0, 4)
+    if kind == 0:
+        return value
+    if kind == 1:
+        return str(round(value, generator.randint(0, 12)))
+    if kind == 2:
+        return int(value)
+    if kind == 3:
+        return decimal.Decimal(str(value))
+    return generator.choice(edge_values)
+
+
+def outcome(function):
+    try:
+        return function()
+    except Exception as e:
+        return type(e)
+
+
+def test_rounder_matches_decimal_to_precision():
+    generator = random.Random(7)
+    for i in range(0, 20000):
+        counting_mode = generator.choice([DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE])
+        precision = generator.choice(ticks if counting_mode == TICK_SIZE else places)
+        rounding_mode = generator.choice([ROUND, TRUNCATE])
+        padding_mode = generator.choice([NO_PADDING, PAD_WITH_ZERO])
+        value = random_value(generator)
+        expected = outcome(lambda: decimal_to_precision(value, rounding_mode, precision, counting_mode, padding_mode))
+        result = outcome(lambda: rounder(rounding_mode, precision, counting_mode, padding_mode)(value))
+        assert result == expected, repr((value, rounding_mode, precision, counting_mode, padding_mode, expected, result))
+    # the remainder is compared with the float half of the tick, like decimal_to_precision does
+    assert rounder(ROUND, 0.1, TICK_SIZE, NO_PADDING)('0.15') == '0.1'
+    assert rounder(ROUND, decimal.Decimal('0.1'), TICK_SIZE, NO_PADDING)('0.15') == '0.2'
+    # the rounders are shared, the unsupported modes go through decimal_to_precision
+    assert rounder(ROUND, 0.01, TICK_SIZE, NO_PADDING) is rounder(ROUND, 0.01, TICK_SIZE, NO_PADDING)
+    assert rounder(ROUND, 2, DECIMAL_PLACES, NO_PADDING) is not rounder(ROUND, 2.0, DECIMAL_PLACES, NO_PADDING)
+    assert type(rounder(ROUND, 3, SIGNIFICANT_DIGITS, NO_PADDING)) is Rounder
+
+
+def test_market_precision():
+    exchange = Exchange({'id': 'roundertest'})
+    # the transpiled *_to_precision() methods round through the shared rounders
+    assert exchange.decimal_to_precision is rounded_to_precision
+    exchange.precisionMode = TICK_SIZE
+    exchange.set_markets([
+        {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'precision': {'price': 0.5, 'amount': 0.001}},
+    ])
+    assert exchange.price_to_precision('BTC/USDT', 100.3) == '100.5'
+    assert exchange.prices_to_precision('BTC/USDT', [100.2, '100.74', 101]) == ['100', '100.5', '101']
+    assert exchange.amount_to_precision('BTC/USDT', '0.12345') == '0.123'
+    assert exchange.cost_to_precision('BTC/USDT', 100.9) == '100.5'
+    assert exchange.fee_to_precision('BTC/USDT', 100.75) == '101'
+    try:
+        exchange.prices_to_precision('BTC/USDT', [100, 0.2])
+        assert False
+    except InvalidOrder:
+        pass
+    # a precision changed after set_markets() is picked up
+    exchange.markets['BTC/USDT']['precision']['price'] = 0.1
+    assert exchange.price_to_precision('BTC/USDT', 100.33) == '100.3'
+    exchange.paddingMode = PAD_WITH_ZERO
+    assert exchange.price_to_precision('BTC/USDT', 100) == '100.0'
+
+
+def test_rounder():
+    test_rounder_matches_decimal_to_precision()
+    test_market_precision()
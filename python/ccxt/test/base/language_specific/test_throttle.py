@@ -0,0 +1,157 @@
+import asyncio
+import os
+import sys
+import threading
+from time import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+from ccxt.base.throttler import Throttler as SyncThrottler  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+
+test_cases = [
+    {'tokens': 0, 'refillRate': 1 / 50, 'cost': 1, 'runs': 10},
+    {'tokens': 20, 'refillRate': 1 / 50, 'cost': 1, 'runs': 30},
+    {'tokens': 0, 'refillRate': 1 / 20, 'cost': 1, 'runs': 20},
+    {'tokens': 100, 'refillRate': 1 / 20, 'cost': 5, 'runs': 30},
+    {'tokens': 0, 'refillRate': 1 / 40, 'cost': 2, 'runs': 10},
+    {'tokens': 0, 'refillRate': 1 / 10, 'cost': 1, 'runs': 50},
+]
+
+
+async def sequential_runner(test):
+    throttler = Throttler({
+        'refillRate': test['refillRate'],
+        'tokens': test['tokens'],
+    })
+    start = time() * 1000
+    for i in range(0, test['runs']):
+        await throttler(test['cost'])
+    return time() * 1000 - start
+
+
+async def concurrent_runner(test):
+    throttler = Throttler({
+        'refillRate': test['refillRate'],
+        'tokens': test['tokens'],
+    })
+    start = time() * 1000
+    await asyncio.gather(*[throttler(test['cost']) for i in range(0, test['runs'])])
+    return time() * 1000 - start
+
+
+async def test_throttle_async():
+    delta = 20
+    for runner in [sequential_runner, concurrent_runner]:
+        for test in test_cases:
+            instantly_complete = test['tokens'] / test['cost']
+            remaining = max(test['runs'] - instantly_complete - 1, 0)
+            expected = remaining * test['cost'] / test['refillRate']
+            elapsed = await runner(test)
+            assert abs(elapsed - expected) < delta, runner.__name__ + ' took ' + str(elapsed) + 'ms, expected ' + str(expected) + 'ms'
+
+
+def test_throttle_shared():
+    first = Throttler.shared('test_throttle_shared', {'refillRate': 1 / 50, 'capacity': 1})
+    second = Throttler.shared('test_throttle_shared', {'refillRate': 1 / 10})
+    assert first is second
+    # the config of the first caller wins
+    assert first.config['refillRate'] == 1 / 50
+    # the exchange reports 90 of 100 weight used, only 10 * 0.1 tokens remain
+    assert first.resync(90, 100, 0.1) == 0
+    assert first.resync(110, 100, 0.1) == -1
+    # a remote view with more room than the local bucket does not raise the balance
+    assert first.resync(0, 100, 0.1) == -1
+    assert Throttler.release_shared('test_throttle_shared') is first
+    assert 'test_throttle_shared' not in Throttler.registry
+
+
+async def test_rate_limit_headers():
+    exchange = AsyncExchange({'id': 'throttletest', 'options': {'rateLimitHeaders': {'x-mbx-used-weight-1m': {'limit': 100, 'cost': 0.1}}}})
+    exchange.handle_rate_limit_headers({'X-MBX-USED-WEIGHT-1M': 'unknown'})
+    assert exchange.throttle.config['tokens'] == 0
+    exchange.handle_rate_limit_headers({'X-MBX-USED-WEIGHT-1M': '110', 'Content-Type': 'application/json'})
+    assert exchange.throttle.config['tokens'] == -1
+    await exchange.close()
+
+
+def sync_sequential_runner(test):
+    throttler = SyncThrottler({
+        'refillRate': test['refillRate'],
+        'tokens': test['tokens'],
+    })
+    start = time() * 1000
+    for i in range(0, test['runs']):
+        throttler(test['cost'])
+    return time() * 1000 - start
+
+
+def sync_threaded_runner(test):
+    throttler = SyncThrottler({
+        'refillRate': test['refillRate'],
+        'tokens': test['tokens'],
+    })
+    start = time() * 1000
+    threads = [threading.Thread(target=throttler, args=(test['cost'],)) for i in range(0, test['runs'])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time() * 1000 - start
+
+
+def test_throttle_sync():
+    delta = 20
+    for runner in [sync_sequential_runner, sync_threaded_runner]:
+        for test in test_cases:
+            instantly_complete = test['tokens'] / test['cost']
+            remaining = max(test['runs'] - instantly_complete - 1, 0)
+            expected = remaining * test['cost'] / test['refillRate']
+            elapsed = runner(test)
+            assert abs(elapsed - expected) < delta, runner.__name__ + ' took ' + str(elapsed) + 'ms, expected ' + str(expected) + 'ms'
+
+
+def test_throttle_contention():
+    # threads sharing an exchange instance are served one at a time in the order they asked
+    exchange = Exchange({'id': 'throttletest', 'rateLimit': 5})
+    served = []
+    lock = threading.Lock()
+
+    def worker(index):
+        exchange.throttle(1)
+        with lock:
+            served.append((index, time() * 1000))
+
+    threads = []
+    for i in range(0, 16):
+        thread = threading.Thread(target=worker, args=(i,))
+        thread.start()
+        threads.append(thread)
+        # wait until the thread has joined the queue so that the arrival order is known
+        while len(exchange.throttler.queue) + len(served) <= i:
+            pass
+    for thread in threads:
+        thread.join()
+    assert [index for index, timestamp in served] == list(range(0, 16))
+    # the idle bucket was full so the second call went through at once, the others were spaced by the refill rate
+    assert abs((served[-1][1] - served[0][1]) - 14 * 5) < 20
+    # instances in the same rate limit group share the bucket
+    first = Exchange({'id': 'throttletest', 'rateLimitGroup': 'test_throttle_contention'})
+    second = Exchange({'id': 'throttletest', 'rateLimitGroup': 'test_throttle_contention'})
+    third = Exchange({'id': 'throttletest', 'rateLimitGroup': 'test_throttle_contention', 'rateLimit': 100})
+    assert first.throttler is second.throttler
+    assert third.throttler is first.throttler
+    assert third.throttler.config['refillRate'] == 1 / 2000
+    assert SyncThrottler.release_shared('test_throttle_contention') is first.throttler
+
+
+def test_throttle():
+    test_throttle_shared()
+    asyncio.run(test_throttle_async())
+    asyncio.run(test_rate_limit_headers())
+    test_throttle_sync()
+    test_throttle_contention()
@@ -0,0 +1,38 @@
+import os
+import re
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+delimiter = '# METHODS BELOW THIS LINE ARE TRANSPILED FROM JAVASCRIPT TO PYTHON AND PHP'
+files = [
+    os.path.join(root, 'ccxt', 'base', 'exchange.py'),
+    os.path.join(root, 'ccxt', 'async_support', 'base', 'exchange.py'),
+]
+# pythonNativeBaseMethods in build/transpile.js, their transpiled bodies are dropped
+native_methods = [
+    'fetch_paginated_call_cursor',
+    'fetch_paginated_call_deterministic',
+    'fetch_paginated_call_dynamic',
+    'fetch_paginated_call_incremental',
+]
+
+
+def method_names(code):
+    return re.findall(r'^    (?:async )?def (\w+)\(', code, re.MULTILINE)
+
+
+def test_transpiled_methods():
+    # the same check as build/transpile.js, a native method never shadows a transpiled one
+    for path in files:
+        with open(path, encoding='utf-8') as file:
+            native, transpiled = file.read().split(delimiter)
+        native_names = set(method_names(native))
+        for name in method_names(transpiled):
+            assert name not in native_names, path + ' shadows the transpiled ' + name + '()'
+            if name.endswith('_transpiled'):
+                assert name[:-len('_transpiled')] in native_names, path + ' has no native wrapper around ' + name + '()'
+                assert name[:-len('_transpiled')] not in native_methods, path + ' keeps the transpiled body of the native ' + name[:-len('_transpiled')] + '()'
+        for name in native_methods:
+            assert name in native_names, path + ' has no native ' + name + '()'
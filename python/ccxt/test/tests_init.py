@@ -8,6 +8,21 @@ except ImportError:
     asyncio = None
 
 from base.tests_init import base_tests_init  # noqa: F401
+from base.language_specific.test_throttle import test_throttle  # noqa: F401
+from base.language_specific.test_markets_cache import test_markets_cache  # noqa: F401
+from base.language_specific.test_markets_index import test_markets_index  # noqa: F401
+from base.language_specific.test_connection_pool import test_connection_pool  # noqa: F401
+from base.language_specific.test_request_cache import test_request_cache  # noqa: F401
+from base.language_specific.test_batch import test_batch  # noqa: F401
+from base.language_specific.test_fetch_response import test_fetch_response  # noqa: F401
+from base.language_specific.test_iterate_pages import test_iterate_pages  # noqa: F401
+from base.language_specific.test_adaptive_pagination import test_adaptive_pagination  # noqa: F401
+from base.language_specific.test_rounder import test_rounder  # noqa: F401
+from base.language_specific.test_precise import test_precise  # noqa: F401
+from base.language_specific.test_ecdsa import test_ecdsa  # noqa: F401
+from base.language_specific.test_eth_hashing import test_eth_hashing  # noqa: F401
+from base.language_specific.test_transpiled_methods import test_transpiled_methods  # noqa: F401
+from base.language_specific.test_describe_cache import test_describe_cache  # noqa: F401
 from ccxt.pro.test.base.tests_init import test_base_init_ws  # noqa: F401
 
 # fix : https://github.com/aio-libs/aiodns/issues/86
@@ -26,6 +41,21 @@ if (isBaseTests):
         test_base_init_ws()
     else:
         base_tests_init()
+        test_throttle()
+        test_markets_cache()
+        test_markets_index()
+        test_connection_pool()
+        test_request_cache()
+        test_batch()
+        test_fetch_response()
+        test_iterate_pages()
+        test_adaptive_pagination()
+        test_rounder()
+        test_precise()
+        test_ecdsa()
+        test_eth_hashing()
+        test_transpiled_methods()
+        test_describe_cache()
     print('base tests passed!')
     if not run_all:
         exit(0)
@@ -3006,9 +3006,30 @@ export default class Exchange {
         return cleanStructure;
     }
 
+    marketDefaults () {
+        // the defaults are merged once per reload, deepExtend copies them into every market
+        return this.deepExtend (this.safeMarketStructure (), {
+            'precision': this.precision,
+            'limits': this.limits,
+        }, this.fees['trading']);
+    }
+
+    buildMarket (defaults, value) {
+        const market = this.deepExtend (defaults, value);
+        if (market['linear']) {
+            market['subType'] = 'linear';
+        } else if (market['inverse']) {
+            market['subType'] = 'inverse';
+        } else {
+            market['subType'] = undefined;
+        }
+        return market;
+    }
+
     setMarkets (markets, currencies = undefined) {
         const values = [];
         this.markets_by_id = {};
+        const defaults = this.marketDefaults ();
         // handle marketId conflicts
         // we insert spot markets first
         const marketValues = this.sortBy (this.toArray (markets), 'spot', true, true);
@@ -3019,24 +3040,18 @@ export default class Exchange {
             } else {
                 this.markets_by_id[value['id']] = [ value ] as any;
             }
-            const market = this.deepExtend (this.safeMarketStructure (), {
-                'precision': this.precision,
-                'limits': this.limits,
-            }, this.fees['trading'], value);
-            if (market['linear']) {
-                market['subType'] = 'linear';
-            } else if (market['inverse']) {
-                market['subType'] = 'inverse';
-            } else {
-                market['subType'] = undefined;
-            }
-            values.push (market);
+            values.push (this.buildMarket (defaults, value));
         }
         this.markets = this.indexBy (values, 'symbol') as any;
         const marketsSortedBySymbol = this.keysort (this.markets);
         const marketsSortedById = this.keysort (this.markets_by_id);
         this.symbols = Object.keys (marketsSortedBySymbol);
         this.ids = Object.keys (marketsSortedById);
+        this.setCurrenciesFromMarkets (values, currencies);
+        return this.markets;
+    }
+
+    setCurrenciesFromMarkets (values, currencies = undefined) {
         if (currencies !== undefined) {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
             this.currencies = this.deepExtend (this.currencies, currencies);
@@ -3094,7 +3109,6 @@ export default class Exchange {
         this.currencies_by_id = this.indexBy (this.currencies, 'id');
         const currenciesSortedByCode = this.keysort (this.currencies);
         this.codes = Object.keys (currenciesSortedByCode);
-        return this.markets;
     }
 
     getDescribeForExtendedWsExchange (currentRestInstance: any, parentRestInstance: any, wsBaseDescribe: Dictionary<any>) {
@@ -4723,10 +4737,6 @@ export default class Exchange {
     }
 
     safeMarket (marketId: Str, market: Market = undefined, delimiter: Str = undefined, marketType: Str = undefined): MarketInterface {
-        const result = this.safeMarketStructure ({
-            'symbol': marketId,
-            'marketId': marketId,
-        });
         if (marketId !== undefined) {
             if ((this.markets_by_id !== undefined) && (marketId in this.markets_by_id)) {
                 const markets = this.markets_by_id[marketId];
@@ -4749,6 +4759,10 @@ export default class Exchange {
                     }
                 }
             } else if (delimiter !== undefined && delimiter !== '') {
+                const result = this.safeMarketStructure ({
+                    'symbol': marketId,
+                    'marketId': marketId,
+                });
                 const parts = marketId.split (delimiter);
                 const partsLength = parts.length;
                 if (partsLength === 2) {
@@ -4766,7 +4780,11 @@ export default class Exchange {
         if (market !== undefined) {
             return market;
         }
-        return result;
+        // the placeholder structure is only built for an unknown market id
+        return this.safeMarketStructure ({
+            'symbol': marketId,
+            'marketId': marketId,
+        });
     }
 
     checkRequiredCredentials (error = true) {
@@ -154,6 +154,17 @@ export default class binance extends binanceRest {
                 'listenKeyRefreshRate': 1200000, // 20 mins
                 'ws': {
                     'cost': 5,
+                    // frames of the channels below are decoded only while the prefix followed by the symbol of the frame is watched, see Client.route() in python
+                    'routes': {
+                        'key': 'e',
+                        'id': 's',
+                        'channels': {
+                            'trade': 'trade::',
+                            'aggTrade': 'trade::',
+                            'depthUpdate': 'orderbook::',
+                            'kline': 'ohlcv::',
+                        },
+                    },
                 },
                 'tickerChannelsMap': {
                     '24hrTicker': 'ticker',